@@ -0,0 +1,102 @@
+"""
+Measures how long a SQL repository takes to list rows with a nested
+relationship, with entities validated by pydantic and with trusted
+hydration building them straight from the selected columns.
+
+Usage: python -m benchmarks.hydration [rows] [runs]
+"""
+
+import sys
+from time import perf_counter
+
+from sqlalchemy import ForeignKey, create_engine
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+)
+
+from domino.domain.models import pydantic as pd
+from domino.repositories.sql.sqlalchemy.repository import SQLListMixin
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class UserMapping(Base):
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    email: Mapped[str]
+
+
+class TaskMapping(Base):
+    __tablename__ = "tasks"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    title: Mapped[str]
+    done: Mapped[bool]
+
+    user: Mapped[UserMapping] = relationship()
+
+
+class User(pd.Entity):
+    id: int
+    name: str
+    email: str
+
+
+class Task(pd.Entity):
+    id: int
+    user: User
+    title: str
+    done: bool
+
+
+class TaskRepository(SQLListMixin[Task]):
+    sql_mapping = TaskMapping
+    domain_mapping = Task
+
+
+class TrustedTaskRepository(TaskRepository):
+    trusted_hydration = True
+
+
+def measure(session: Session, repository: type[TaskRepository], runs: int) -> float:
+    """
+    Returns the number of seconds taken by `runs` lists of all the rows.
+    """
+    start = perf_counter()
+    for _ in range(runs):
+        repository(session).list({}, count="none")
+        # Loaded rows would be read from the identity map by the next run
+        session.expunge_all()
+    return perf_counter() - start
+
+
+def main(rows: int = 5000, runs: int = 20) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserMapping(id=1, name="John Doe", email="jdoe@42.fr"))
+        session.add_all(
+            TaskMapping(id=index, user_id=1, title=f"Task {index}", done=False)
+            for index in range(1, rows + 1)
+        )
+        session.commit()
+
+        print(f"{'hydration':<12}{'seconds':>10}")
+        for name, repository in {
+            "validated": TaskRepository,
+            "trusted": TrustedTaskRepository,
+        }.items():
+            print(f"{name:<12}{measure(session, repository, runs):>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
@@ -0,0 +1,76 @@
+"""
+Measures the memory used per instance by the model flavours of
+`domino.domain.models`, for an entity of four fields.
+
+Usage: python -m benchmarks.model_memory [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from domino.domain.models import dataclasses as dc
+from domino.domain.models import pydantic as pd
+
+
+class PydanticTask(pd.Entity):
+    id: int
+    title: str
+    done: bool
+    owner_id: int
+
+
+@dataclass
+class DataclassTask(dc.Entity):
+    id: int
+    title: str
+    done: bool
+    owner_id: int
+
+
+@dc.slotted
+class SlottedTask(dc.Entity):
+    id: int
+    title: str
+    done: bool
+    owner_id: int
+
+
+def measure(build: Callable[[int], Any], count: int) -> float:
+    """
+    Returns the number of bytes allocated per instance built by `build`.
+    Field values are shared across instances, so only the instances are
+    measured.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [build(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding the instances is not part of their size
+    list_size = sys.getsizeof(instances)
+    del instances
+    return (after - before - list_size) / count
+
+
+def main(count: int = 100_000) -> None:
+    title = "Write the benchmarks"
+    flavours = {
+        "pydantic Entity": lambda index: PydanticTask(
+            id=index, title=title, done=False, owner_id=1
+        ),
+        "dataclass Entity": lambda index: DataclassTask(index, title, False, 1),
+        "slotted dataclass Entity": lambda index: SlottedTask(index, title, False, 1),
+    }
+
+    print(f"{'model':<28}{'bytes per instance':>20}")
+    for name, build in flavours.items():
+        print(f"{name:<28}{measure(build, count):>20.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:2]))
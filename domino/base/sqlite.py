@@ -0,0 +1,43 @@
+import os
+import sqlite3
+import threading
+
+
+class SQLiteConnections:
+    """
+    The connections opened on a SQLite file, one per thread and process.
+
+    Connections are in autocommit mode, so that transactions are opened
+    explicitly, and use the write-ahead log.
+
+    Attributes:
+    -----------
+    path: str
+        The path of the SQLite file.
+    synchronous: str
+        The SQLite synchronous mode of the connections.
+    """
+
+    def __init__(self, path: str, synchronous: str = "FULL") -> None:
+        self.path = path
+        self.synchronous = synchronous
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        # Connections can't be shared across threads, nor survive a fork
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -1,21 +1,40 @@
-from .uow import AbstractUnitOfWork
-from .service import Service
+from .uow import AbstractUnitOfWork, AbstractAsyncUnitOfWork
+from .pools import UnitOfWorkPool, ThreadLocalUnitOfWork, TaskLocalUnitOfWork
+from .service import Service, AsyncService
 from .repositories import (
     AbstractRepository,
     AbstractReadOnlyRepository,
     AbstractWriteOnlyRepository,
     AbstractCRUDRepository,
+    AbstractAsyncReadOnlyRepository,
+    AbstractAsyncWriteOnlyRepository,
+    AbstractAsyncCRUDRepository,
 )
 from .models.pydantic import Entity, DTO, Aggregate
+from .pagination import Page
+from .filters import Filter, where, all_of, any_of
 
 __all__ = [
     "AbstractUnitOfWork",
+    "AbstractAsyncUnitOfWork",
+    "UnitOfWorkPool",
+    "ThreadLocalUnitOfWork",
+    "TaskLocalUnitOfWork",
     "Service",
+    "AsyncService",
     "AbstractRepository",
     "AbstractReadOnlyRepository",
     "AbstractWriteOnlyRepository",
     "AbstractCRUDRepository",
+    "AbstractAsyncReadOnlyRepository",
+    "AbstractAsyncWriteOnlyRepository",
+    "AbstractAsyncCRUDRepository",
     "Entity",
     "DTO",
     "Aggregate",
+    "Page",
+    "Filter",
+    "where",
+    "all_of",
+    "any_of",
 ]
@@ -0,0 +1,248 @@
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, Mapping
+
+from domino.exceptions import InvalidFilter
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+OPERATORS = (
+    "eq",
+    "ne",
+    "in",
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "between",
+    "startswith",
+    "is_null",
+)
+
+
+class Filter:
+    """
+    A filter on the attributes of the documents of a repository.
+
+    Filters are built from `where`, and combined with `&`, `|`, `all_of` and
+    `any_of`. Repositories translate them to their datasource, such as SQL
+    predicates that can use indexes.
+    """
+
+    def __and__(self, other: "Filter") -> "Filter":
+        return And((self, other))
+
+    def __or__(self, other: "Filter") -> "Filter":
+        return Or((self, other))
+
+    @property
+    def shape(self) -> Hashable:
+        """
+        What the filter looks like without its values, so that filters
+        only differing by their values can share a compiled form.
+        """
+        raise NotImplementedError
+
+    def conditions(self) -> Iterator["Condition"]:
+        """
+        Yields the conditions of the filter, depth first.
+        """
+        raise NotImplementedError
+
+    def predicate(self) -> Predicate:
+        """
+        Compiles the filter into a function telling whether a document,
+        given as a mapping of its attributes, matches it.
+
+        Like SQL, comparisons other than `eq(None)` and `is_null` never
+        match missing or None attributes.
+        """
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Condition(Filter):
+    """
+    A comparison of an attribute with a value.
+
+    Attributes:
+    -----------
+    field: str
+        The name of the compared attribute.
+    operator: str
+        One of `eq`, `ne`, `in`, `gt`, `ge`, `lt`, `le`, `between`,
+        `startswith` and `is_null`.
+    value: Any
+        The compared value, a sequence for `in`, a `(low, high)` pair for
+        `between` and a bool for `is_null`.
+    """
+
+    field: str
+    operator: str
+    value: Any
+
+    def __post_init__(self):
+        if self.operator not in OPERATORS:
+            raise InvalidFilter(f"Unknown operator {self.operator!r}")
+        if self.operator == "between" and len(self.value) != 2:
+            raise InvalidFilter("between expects a (low, high) pair")
+        if self.operator == "in":
+            object.__setattr__(self, "value", tuple(self.value))
+
+    @property
+    def shape(self) -> Hashable:
+        # Comparisons with None and null checks compile to IS (NOT) NULL
+        if self.operator in ("eq", "ne"):
+            return (self.operator, self.field, self.value is None)
+        if self.operator == "is_null":
+            return (self.operator, self.field, bool(self.value))
+        return (self.operator, self.field)
+
+    def conditions(self) -> Iterator["Condition"]:
+        yield self
+
+    def predicate(self) -> Predicate:
+        field, value = self.field, self.value
+
+        if self.operator == "is_null":
+            expected = bool(value)
+            return lambda data: (data.get(field) is None) == expected
+        if self.operator == "eq" and value is None:
+            return lambda data: data.get(field) is None
+        if self.operator == "ne" and value is None:
+            return lambda data: data.get(field) is not None
+        if self.operator == "in":
+            values = set(value)
+            return lambda data: data.get(field) in values
+        if self.operator == "between":
+            low, high = value
+            return lambda data: _compare(
+                data.get(field), lambda item: low <= item <= high
+            )
+        if self.operator == "startswith":
+            return lambda data: _compare(
+                data.get(field), lambda item: str(item).startswith(value)
+            )
+
+        compare = getattr(operator, self.operator)
+        return lambda data: _compare(data.get(field), lambda item: compare(item, value))
+
+
+@dataclass(frozen=True)
+class And(Filter):
+    filters: tuple[Filter, ...]
+
+    def __and__(self, other: Filter) -> Filter:
+        return And((*self.filters, other))
+
+    @property
+    def shape(self) -> Hashable:
+        return ("and", tuple(filter.shape for filter in self.filters))
+
+    def conditions(self) -> Iterator[Condition]:
+        for filter in self.filters:
+            yield from filter.conditions()
+
+    def predicate(self) -> Predicate:
+        predicates = [filter.predicate() for filter in self.filters]
+        return lambda data: all(predicate(data) for predicate in predicates)
+
+
+@dataclass(frozen=True)
+class Or(Filter):
+    filters: tuple[Filter, ...]
+
+    def __or__(self, other: Filter) -> Filter:
+        return Or((*self.filters, other))
+
+    @property
+    def shape(self) -> Hashable:
+        return ("or", tuple(filter.shape for filter in self.filters))
+
+    def conditions(self) -> Iterator[Condition]:
+        for filter in self.filters:
+            yield from filter.conditions()
+
+    def predicate(self) -> Predicate:
+        predicates = [filter.predicate() for filter in self.filters]
+        return lambda data: any(predicate(data) for predicate in predicates)
+
+
+class FilterField:
+    """
+    Builds the conditions of a filter on an attribute.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    def eq(self, value: Any) -> Condition:
+        return Condition(self.field, "eq", value)
+
+    def ne(self, value: Any) -> Condition:
+        return Condition(self.field, "ne", value)
+
+    def in_(self, values: Any) -> Condition:
+        return Condition(self.field, "in", values)
+
+    def gt(self, value: Any) -> Condition:
+        return Condition(self.field, "gt", value)
+
+    def ge(self, value: Any) -> Condition:
+        return Condition(self.field, "ge", value)
+
+    def lt(self, value: Any) -> Condition:
+        return Condition(self.field, "lt", value)
+
+    def le(self, value: Any) -> Condition:
+        return Condition(self.field, "le", value)
+
+    def between(self, low: Any, high: Any) -> Condition:
+        return Condition(self.field, "between", (low, high))
+
+    def startswith(self, prefix: str) -> Condition:
+        return Condition(self.field, "startswith", prefix)
+
+    def is_null(self, value: bool = True) -> Condition:
+        return Condition(self.field, "is_null", value)
+
+
+def where(field: str) -> FilterField:
+    """
+    Starts a condition on an attribute, such as
+    `where("age").between(18, 65) & where("name").startswith("J")`.
+    """
+    return FilterField(field)
+
+
+def all_of(*filters: Filter) -> Filter:
+    return filters[0] if len(filters) == 1 else And(filters)
+
+
+def any_of(*filters: Filter) -> Filter:
+    return filters[0] if len(filters) == 1 else Or(filters)
+
+
+def as_filter(filter_data: "FilterData | None") -> Filter | None:
+    """
+    Returns the filter given to a repository as a Filter, turning the
+    mappings of attribute values of the original API into equality
+    conditions. Returns None when nothing is filtered.
+    """
+    if filter_data is None or isinstance(filter_data, Filter):
+        return filter_data
+    if not filter_data:
+        return None
+    return all_of(*(where(key).eq(value) for key, value in filter_data.items()))
+
+
+FilterData = Filter | Mapping[str, Any]
+
+
+def _compare(item: Any, compare: Callable[[Any], bool]) -> bool:
+    if item is None:
+        return False
+    try:
+        return compare(item)
+    except TypeError:
+        return False
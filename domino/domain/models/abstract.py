@@ -1,21 +1,107 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, TypeVar
+
+V = TypeVar("V", bound="AbstractValueObject")
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Returns a hashable equivalent of a dumped value, turning lists into
+    tuples, and dicts and sets into frozensets.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
 
 
 class AbstractValueObject(ABC):
+    """
+    A value object is identified by the values of its fields: two value
+    objects of the same class are equal when their fields are.
+
+    Value objects are immutable, so implementations can compute their hash
+    once and cache it, which `__eq__` uses to tell most different values
+    apart without comparing their fields.
+    """
+
+    __slots__ = ()
+
     @abstractmethod
     def dump(self) -> dict:
         raise NotImplementedError
 
+    def compute_hash(self) -> int:
+        return hash((type(self), freeze(tuple(self.dump().values()))))
+
     def __hash__(self) -> int:
-        return hash(frozenset(self.dump()))
+        return self.compute_hash()
 
     def __eq__(self, other):
-        if isinstance(other, AbstractValueObject):
-            return hash(self) == hash(other)
-        return False
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+        if hash(self) != hash(other):
+            return False
+        return self.dump() == other.dump()
+
+
+class InternPool:
+    """
+    A flyweight pool of value objects, so that equal value objects used in
+    many places share a single instance.
+
+    Attributes:
+    -----------
+    max_size: int | None
+        The number of value objects kept in the pool. When it is full, the
+        least recently interned value objects are dropped first. None keeps
+        every value object.
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self.max_size = max_size
+        self._values: OrderedDict[AbstractValueObject, AbstractValueObject] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def intern(self, value: V) -> V:
+        """
+        Returns the pooled instance equal to the value object, adding the
+        value object to the pool when there is none.
+        """
+        with self._lock:
+            pooled = self._values.get(value)
+            if pooled is not None:
+                self._values.move_to_end(value)
+                return pooled  # type: ignore[return-value]
+
+            self._values[value] = value
+            if self.max_size is not None and len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
 
 
 class AbstractEntity(ABC):
+    __slots__ = ()
+
     id: int
 
     @abstractmethod
@@ -29,12 +115,16 @@ class AbstractEntity(ABC):
 
 
 class AbstractDTO(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def dump(self) -> dict:
         pass
 
 
 class AbstractAggregate(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def dump(self) -> dict:
         pass
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any, Callable, TypeVar
 
 from domino.domain.models.abstract import (
     AbstractEntity,
@@ -7,26 +8,98 @@ from domino.domain.models.abstract import (
     AbstractValueObject,
 )
 
+T = TypeVar("T")
 
-@dataclass(frozen=True)
-class ValueObject(AbstractValueObject):
-    def dump(self):
-        return self.__dict__
+
+def _compile(cls: type, key: str, source: Callable[[type], str]) -> Callable:
+    """
+    Compiles a function specialized for the fields of a dataclass, once per
+    class, and caches it on the class.
+    """
+    function = cls.__dict__.get(key)
+    if function is None:
+        namespace: dict[str, Any] = {}
+        exec(source(cls), namespace)
+        function = namespace["function"]
+        setattr(cls, key, function)
+    return function
+
+
+def _dump_source(cls: type) -> str:
+    items = ", ".join(f"{field.name!r}: self.{field.name}" for field in fields(cls))
+    return f"def function(self):\n    return {{{items}}}\n"
+
+
+def compiled_dump(cls: type) -> Callable[[Any], dict]:
+    """
+    Returns a function building a new dict of the fields of an instance,
+    with one attribute read per field and no introspection at call time.
+    """
+    return _compile(cls, "__domino_dump__", _dump_source)
+
+
+def slotted(cls: type[T] | None = None, /, **options: Any) -> Any:
+    """
+    Declares a model as a dataclass storing its fields in `__slots__`
+    instead of a per-instance `__dict__`, which makes instances much
+    smaller and attribute access faster.
+
+    Subclasses of ValueObject are frozen like their base, and keep its
+    cached hash and equality. Other dataclass options are passed through.
+    """
+
+    def wrap(cls: type[T]) -> type[T]:
+        params = getattr(cls, "__dataclass_params__", None)
+        options.setdefault("frozen", params is not None and params.frozen)
+        if issubclass(cls, AbstractValueObject):
+            options.setdefault("eq", False)
+        return dataclass(cls, slots=True, **options)
+
+    return wrap if cls is None else wrap(cls)
+
+
+class DataclassModel:
+    """
+    The dump shared by dataclass models.
+    """
+
+    __slots__ = ()
+
+    def dump(self) -> dict:
+        return compiled_dump(type(self))(self)
+
+
+@dataclass(frozen=True, eq=False)
+class ValueObject(DataclassModel, AbstractValueObject):
+    """
+    A frozen dataclass value object caching its hash in a slot.
+
+    Subclasses declared with `slotted` or `@dataclass(frozen=True, eq=False)`
+    inherit the cached hash, while a plain `@dataclass(frozen=True)`
+    generates an uncached `__hash__` and `__eq__` over the fields.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = self.compute_hash()
+            object.__setattr__(self, "_hash", value)
+            return value
 
 
 @dataclass
-class Entity(AbstractEntity):
-    def dump(self):
-        return self.__dict__
+class Entity(DataclassModel, AbstractEntity):
+    __slots__ = ()
 
 
 @dataclass
-class Aggregate(AbstractAggregate):
-    def dump(self):
-        return self.__dict__
+class Aggregate(DataclassModel, AbstractAggregate):
+    __slots__ = ()
 
 
 @dataclass
-class DTO(AbstractDTO):
-    def dump(self):
-        return self.__dict__
+class DTO(DataclassModel, AbstractDTO):
+    __slots__ = ()
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from collections.abc import Mapping
+from typing import Any, Callable, ClassVar, Iterable, get_args
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr, TypeAdapter
 
 from domino.domain.models.abstract import (
     AbstractAggregate,
@@ -8,13 +11,109 @@ from domino.domain.models.abstract import (
 )
 
 
+def nested_model(annotation: Any) -> type[BaseModel] | None:
+    """
+    Returns the pydantic model nested in a field annotation, such as `User`,
+    `User | None` or `list[User]`, or None if the field holds no model.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    for argument in get_args(annotation):
+        model = nested_model(argument)
+        if model is not None:
+            return model
+    return None
+
+
+def trusted_constructor(cls: type[BaseModel]) -> Callable[[dict], BaseModel]:
+    """
+    Returns a function building instances of a model from the values of all
+    its fields, without validating them, for trusted data such as the
+    columns of our own tables.
+
+    The function is compiled once per model: the values become the
+    `__dict__` of the instance as they are, along with a precomputed set of
+    fields, so nothing is validated nor coerced.
+    """
+    constructor = cls.__dict__.get("__domino_trusted_constructor__")
+    if constructor is not None:
+        return constructor
+
+    fields = frozenset(cls.model_fields)
+    post_init = bool(cls.__pydantic_post_init__)
+    new = object.__new__
+    # Setting the slots through their descriptors skips the attribute lookup
+    slots = BaseModel.__dict__
+    set_dict = slots["__dict__"].__set__
+    set_fields = slots["__pydantic_fields_set__"].__set__
+    set_extra = slots["__pydantic_extra__"].__set__
+    set_private = slots["__pydantic_private__"].__set__
+
+    def construct(values: dict) -> BaseModel:
+        instance = new(cls)
+        set_dict(instance, values)
+        set_fields(instance, set(fields))
+        set_extra(instance, None)
+        set_private(instance, None)
+        if post_init:
+            # Sets the default values of private attributes
+            instance.model_post_init(None)
+        return instance
+
+    setattr(cls, "__domino_trusted_constructor__", construct)
+    return construct
+
+
+def list_adapter(cls: type[BaseModel]) -> TypeAdapter:
+    """
+    Returns the TypeAdapter validating and serializing lists of a model,
+    built once per model.
+
+    Going through the adapter validates or serializes a whole list in a
+    single pydantic-core call, instead of one Python call per item.
+    """
+    adapter = cls.__dict__.get("__domino_list_adapter__")
+    if adapter is None:
+        adapter = TypeAdapter(list[cls])  # type: ignore[valid-type]
+        setattr(cls, "__domino_list_adapter__", adapter)
+    return adapter
+
+
 class ValueObject(AbstractValueObject, BaseModel):
     model_config = ConfigDict(from_attributes=True, frozen=True)
 
+    trusted_hydration: ClassVar[bool] = False
+
+    _hash: int | None = PrivateAttr(default=None)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = self.compute_hash()
+        return self._hash
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep=False):
+        # The copy may have other values, its hash is computed again
+        copy = super().model_copy(update=update, deep=deep)
+        copy._hash = None
+        return copy
+
     @classmethod
     def load(cls, data):
         return cls.model_validate(data)
 
+    @classmethod
+    def load_many(cls, data: Iterable[Any]) -> list:
+        return list_adapter(cls).validate_python(list(data))
+
+    @classmethod
+    def dump_many(cls, items: Iterable[Any]) -> list[dict]:
+        return list_adapter(cls).dump_python(list(items))
+
+    @classmethod
+    def dump_many_json(cls, items: Iterable[Any]) -> bytes:
+        return list_adapter(cls).dump_json(list(items))
+
     def dump(self):
         return self.model_dump()
 
@@ -22,10 +121,24 @@ class ValueObject(AbstractValueObject, BaseModel):
 class Entity(AbstractEntity, BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
+    trusted_hydration: ClassVar[bool] = False
+
     @classmethod
     def load(cls, data):
         return cls.model_validate(data)
 
+    @classmethod
+    def load_many(cls, data: Iterable[Any]) -> list:
+        return list_adapter(cls).validate_python(list(data))
+
+    @classmethod
+    def dump_many(cls, items: Iterable[Any]) -> list[dict]:
+        return list_adapter(cls).dump_python(list(items))
+
+    @classmethod
+    def dump_many_json(cls, items: Iterable[Any]) -> bytes:
+        return list_adapter(cls).dump_json(list(items))
+
     def dump(self):
         return self.model_dump()
 
@@ -33,18 +146,46 @@ class Entity(AbstractEntity, BaseModel):
 class Aggregate(AbstractAggregate, BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
+    trusted_hydration: ClassVar[bool] = False
+
     @classmethod
     def load(cls, data):
         return cls.model_validate(data)
 
+    @classmethod
+    def load_many(cls, data: Iterable[Any]) -> list:
+        return list_adapter(cls).validate_python(list(data))
+
+    @classmethod
+    def dump_many(cls, items: Iterable[Any]) -> list[dict]:
+        return list_adapter(cls).dump_python(list(items))
+
+    @classmethod
+    def dump_many_json(cls, items: Iterable[Any]) -> bytes:
+        return list_adapter(cls).dump_json(list(items))
+
     def dump(self):
         return self.model_dump()
 
 
 class DTO(AbstractDTO, BaseModel):
+    trusted_hydration: ClassVar[bool] = False
+
     @classmethod
     def load(cls, data):
         return cls.model_validate(data)
 
+    @classmethod
+    def load_many(cls, data: Iterable[Any]) -> list:
+        return list_adapter(cls).validate_python(list(data))
+
+    @classmethod
+    def dump_many(cls, items: Iterable[Any]) -> list[dict]:
+        return list_adapter(cls).dump_python(list(items), exclude_none=True)
+
+    @classmethod
+    def dump_many_json(cls, items: Iterable[Any]) -> bytes:
+        return list_adapter(cls).dump_json(list(items), exclude_none=True)
+
     def dump(self):
         return self.model_dump(exclude_none=True)
@@ -0,0 +1,129 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Generic, TypeVar
+from uuid import UUID
+
+from domino.exceptions import InvalidCursor, InvalidLimit
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    A page of results returned by a paginated list.
+
+    Attributes:
+    -----------
+    items: list[T]
+        The items of the page, in sort order.
+    next_cursor: str | None
+        The opaque cursor to pass back to get the next page, or None when
+        this page is the last one.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+# Sort key values JSON has no type for, tagged with their type in cursors.
+# datetime is tested before date, which it subclasses
+CURSOR_TYPES: dict[str, tuple[type, Callable[[Any], str], Callable[[str], Any]]] = {
+    "datetime": (datetime, datetime.isoformat, datetime.fromisoformat),
+    "date": (date, date.isoformat, date.fromisoformat),
+    "time": (time, time.isoformat, time.fromisoformat),
+    "uuid": (UUID, str, UUID),
+    "decimal": (Decimal, str, Decimal),
+}
+
+
+def check_limit(limit: int) -> None:
+    """
+    Raises InvalidLimit unless `limit` is a positive number of items.
+    """
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise InvalidLimit(f"Pages hold at least one item, got limit={limit!r}")
+
+
+def _tag(value: Any) -> dict:
+    for name, (kind, dump, _) in CURSOR_TYPES.items():
+        if isinstance(value, kind):
+            return {"$type": name, "value": dump(value)}
+    raise TypeError(f"Can't build a cursor from {type(value).__name__} values")
+
+
+def _untag(value: dict) -> Any:
+    if value.keys() == {"$type", "value"} and value["$type"] in CURSOR_TYPES:
+        return CURSOR_TYPES[value["$type"]][2](value["value"])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encodes the sort key values of the last seen item into an opaque cursor.
+
+    Values must be JSON serializable, or datetimes, dates, times, UUIDs or
+    decimals, which are decoded back to their type.
+    """
+    payload = json.dumps(list(values), separators=(",", ":"), default=_tag)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Decodes a cursor built by `encode_cursor` back into its sort key values.
+
+    Raises InvalidCursor if the cursor was not built by `encode_cursor`.
+    """
+    try:
+        values = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()), object_hook=_untag
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, ArithmeticError):
+        raise InvalidCursor(cursor)
+
+    if not isinstance(values, list) or not values:
+        raise InvalidCursor(cursor)
+    return values
+
+
+def paginate_items(
+    items: list[T],
+    limit: int,
+    cursor: str | None,
+    sort_key: str,
+    primary_key: str,
+    descending: bool,
+) -> Page[T]:
+    """
+    Returns the page of `items` following `cursor`, for repositories holding
+    every item they paginate. Items are sorted on `sort_key`, then on
+    `primary_key` to break ties.
+    """
+
+    def position(item: T) -> tuple:
+        return (getattr(item, sort_key), getattr(item, primary_key))
+
+    items = sorted(items, key=position, reverse=descending)
+
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        last_seen = (values[0], values[-1])
+        if descending:
+            items = [item for item in items if position(item) < last_seen]
+        else:
+            items = [item for item in items if position(item) > last_seen]
+
+    next_cursor = None
+    if len(items) > limit:
+        next_cursor = encode_cursor(*position(items[limit - 1]))
+
+    return Page(items=items[:limit], next_cursor=next_cursor)
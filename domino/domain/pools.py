@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Callable, Generic, Iterator, TypeVar
+from weakref import WeakKeyDictionary
+
+from domino.base.baseclass import DominoBaseClass
+
+UOW = TypeVar("UOW")
+
+
+class UnitOfWorkPool(DominoBaseClass, Generic[UOW]):
+    """
+    A pool of units of work, handed out to requests one at a time and
+    reused by the next ones instead of being built for each request.
+
+    Units of work are reset when they are given back: those defining a
+    `reset` method are prepared for reuse with it. They are dropped instead
+    of being pooled when it returns False or raises, and closed with their
+    `close` method when they define one.
+
+    Attributes:
+    -----------
+    factory: Callable[[], UOW]
+        Builds a unit of work when none is idle.
+    max_size: int | None
+        The number of idle units of work kept, unbounded when None.
+    """
+
+    def __init__(self, factory: Callable[[], UOW], max_size: int | None = None) -> None:
+        super().__init__()
+        self.factory = factory
+        self.max_size = max_size
+        self._idle: list[UOW] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> UOW:
+        with self._lock:
+            if self._idle:
+                # The most recently used one has the warmest caches
+                return self._idle.pop()
+        return self.factory()
+
+    def release(self, unit_of_work: UOW) -> None:
+        reset = getattr(unit_of_work, "reset", None)
+        try:
+            reusable = reset is None or reset() is not False
+        except Exception:
+            # Raising here would hide the error the unit of work was given
+            # back with
+            self.log.exception("Failed to reset %r, dropping it", unit_of_work)
+            reusable = False
+
+        if not reusable:
+            self._discard(unit_of_work)
+            return
+        with self._lock:
+            if self.max_size is None or len(self._idle) < self.max_size:
+                self._idle.append(unit_of_work)
+                return
+        self._discard(unit_of_work)
+
+    def _discard(self, unit_of_work: UOW) -> None:
+        close = getattr(unit_of_work, "close", None)
+        if close is None:
+            return
+        try:
+            close()
+        except Exception:
+            self.log.exception("Failed to close %r", unit_of_work)
+
+    @contextmanager
+    def borrow(self) -> Iterator[UOW]:
+        """
+        Acquires a unit of work for the duration of a block.
+        """
+        unit_of_work = self.acquire()
+        try:
+            yield unit_of_work
+        finally:
+            self.release(unit_of_work)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+
+class ThreadLocalUnitOfWork(Generic[UOW]):
+    """
+    One unit of work per thread, built the first time the thread asks for
+    it and reused by everything the thread runs afterwards.
+
+    It suits servers running each request in a thread of a long lived
+    pool, where a thread runs one transaction at a time.
+    """
+
+    def __init__(self, factory: Callable[[], UOW]) -> None:
+        self.factory = factory
+        self._local = threading.local()
+
+    def get(self) -> UOW:
+        unit_of_work = getattr(self._local, "unit_of_work", None)
+        if unit_of_work is None:
+            unit_of_work = self._local.unit_of_work = self.factory()
+        return unit_of_work
+
+
+class TaskLocalUnitOfWork(Generic[UOW]):
+    """
+    One unit of work per asyncio task, taken from a pool the first time
+    the task asks for it and given back to the pool once the task is done.
+
+    Tasks are usually short lived, one per request, so the units of work
+    are pooled rather than built for each task.
+
+    Attributes:
+    -----------
+    pool: UnitOfWorkPool[UOW]
+        The units of work not used by any task.
+    """
+
+    def __init__(self, factory: Callable[[], UOW], max_size: int | None = None) -> None:
+        self.pool = UnitOfWorkPool(factory, max_size)
+        self._owners: WeakKeyDictionary[asyncio.Task, UOW] = WeakKeyDictionary()
+
+    def get(self) -> UOW:
+        task = asyncio.current_task()
+        if task is None:
+            raise RuntimeError("Task local units of work need a running task")
+
+        unit_of_work = self._owners.get(task)
+        if unit_of_work is None:
+            unit_of_work = self._owners[task] = self.pool.acquire()
+            task.add_done_callback(self._release)
+        return unit_of_work
+
+    def _release(self, task: asyncio.Task) -> None:
+        unit_of_work = self._owners.pop(task, None)
+        if unit_of_work is not None:
+            self.pool.release(unit_of_work)
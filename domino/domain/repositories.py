@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, AsyncIterator, Generic, Iterator, Sequence, TypeVar
 
 from domino.domain.models.abstract import AbstractDTO, AbstractEntity
+from domino.domain.pagination import Page
 
 BaseT = TypeVar("BaseT", bound=AbstractEntity)
 CreateT = TypeVar("CreateT", bound=AbstractDTO)
@@ -32,12 +33,42 @@ class ListRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
     `list(filter_data: Any) -> tuple[int, list[BaseT]]` should be used to retrieve
     a tuple with the total count of documents from the filter and a list of
     documents data from a datasource
+
+    `filter_data` is either a dict of attribute values or a Filter built with
+    `domino.domain.filters.where`
     """
 
     @abstractmethod
     def list(self, filter_data: Any) -> tuple[int, list[BaseT]]:
         return NotImplemented
 
+    def iter_list(self, filter_data: Any, batch_size: int = 1000) -> Iterator[BaseT]:
+        """
+        Yields the documents matching the filter one at a time.
+
+        Datasources able to stream their results should override it so that
+        memory does not grow with the size of the result. The default
+        implementation falls back on `list`.
+        """
+        _, results = self.list(filter_data)
+        yield from results
+
+
+class PaginateRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Mixin that implements the paginate function to a repository
+
+    `paginate(filter_data: Any, limit: int, cursor: str | None) -> Page[BaseT]`
+    should be used to retrieve at most `limit` documents after the given
+    cursor, along with the cursor of the next page. Pages are keyset based so
+    fetching a deep page costs the same as fetching the first one
+    """
+
+    @abstractmethod
+    def paginate(
+        self, filter_data: Any, limit: int, cursor: str | None = None
+    ) -> Page[BaseT]:
+        return NotImplemented
+
 
 class CreateRepositoryMixin(AbstractRepository, Generic[BaseT, CreateT], ABC):
     """Mixin that implements the create function to a repository
@@ -87,6 +118,58 @@ class SaveRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
         raise NotImplementedError
 
 
+# Bulk Abstract Mixins
+class BulkCreateRepositoryMixin(AbstractRepository, Generic[BaseT, CreateT], ABC):
+    """Mixin that implements the create_many function to a repository
+
+    `create_many(data: Sequence[CreateT]) -> list[BaseT]` should be used to save
+    several documents in datasource at once and return the created entities
+    in the same order as the input
+    """
+
+    @abstractmethod
+    def create_many(self, data: Sequence[CreateT]) -> list[BaseT]:
+        return NotImplemented
+
+
+class BulkUpdateRepositoryMixin(AbstractRepository, Generic[BaseT, UpdateT], ABC):
+    """Mixin that implements the update_many function to a repository
+
+    `update_many(ids: Sequence[Any], data: UpdateT) -> list[BaseT]` should be
+    used to apply the same update to several documents in datasource and return
+    the updated entities in the same order as the given ids
+    """
+
+    @abstractmethod
+    def update_many(self, ids: Sequence[Any], data: UpdateT) -> list[BaseT]:
+        return NotImplemented
+
+
+class BulkDeleteRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Mixin that implements the delete_many function to a repository
+
+    `delete_many(ids: Sequence[Any]) -> None` should be used to delete several
+    documents from a datasource at once
+    """
+
+    @abstractmethod
+    def delete_many(self, ids: Sequence[Any]) -> None:
+        raise NotImplementedError
+
+
+class BulkSaveRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Mixin that implements the save_many function to a repository
+
+    `save_many(data: Sequence[BaseT]) -> list[BaseT]` should be used to save
+    several documents in datasource at once, creating the missing ones, and
+    return the saved entities in the same order as the input
+    """
+
+    @abstractmethod
+    def save_many(self, data: Sequence[BaseT]) -> list[BaseT]:
+        return NotImplemented
+
+
 # Abstract Crud Repositories
 class AbstractReadOnlyRepository(
     GetRepositoryMixin[BaseT],
@@ -119,3 +202,103 @@ class AbstractCRUDRepository(
     """
 
     pass
+
+
+# Async Crud Abstract Mixins
+class AsyncGetRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Asynchronous counterpart of GetRepositoryMixin"""
+
+    @abstractmethod
+    async def get(self, id: Any) -> BaseT:
+        return NotImplemented
+
+
+class AsyncListRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Asynchronous counterpart of ListRepositoryMixin"""
+
+    @abstractmethod
+    async def list(self, filter_data: Any) -> tuple[int, list[BaseT]]:
+        return NotImplemented
+
+    async def iter_list(
+        self, filter_data: Any, batch_size: int = 1000
+    ) -> AsyncIterator[BaseT]:
+        _, results = await self.list(filter_data)
+        for result in results:
+            yield result
+
+
+class AsyncPaginateRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Asynchronous counterpart of PaginateRepositoryMixin"""
+
+    @abstractmethod
+    async def paginate(
+        self, filter_data: Any, limit: int, cursor: str | None = None
+    ) -> Page[BaseT]:
+        return NotImplemented
+
+
+class AsyncCreateRepositoryMixin(AbstractRepository, Generic[BaseT, CreateT], ABC):
+    """Asynchronous counterpart of CreateRepositoryMixin"""
+
+    @abstractmethod
+    async def create(self, data: CreateT) -> BaseT:
+        return NotImplemented
+
+
+class AsyncUpdateRepositoryMixin(AbstractRepository, Generic[BaseT, UpdateT], ABC):
+    """Asynchronous counterpart of UpdateRepositoryMixin"""
+
+    @abstractmethod
+    async def update(self, id: Any, data: UpdateT) -> BaseT:
+        return NotImplemented
+
+
+class AsyncDeleteRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Asynchronous counterpart of DeleteRepositoryMixin"""
+
+    @abstractmethod
+    async def delete(self, id: Any) -> None:
+        raise NotImplementedError
+
+
+class AsyncSaveRepositoryMixin(AbstractRepository, Generic[BaseT], ABC):
+    """Asynchronous counterpart of SaveRepositoryMixin"""
+
+    @abstractmethod
+    async def save(self, data: BaseT) -> BaseT:
+        raise NotImplementedError
+
+
+# Abstract Async Crud Repositories
+class AbstractAsyncReadOnlyRepository(
+    AsyncGetRepositoryMixin[BaseT],
+    AsyncListRepositoryMixin[BaseT],
+    ABC,
+):
+    """Abstract repository that implements the asynchronous read only operations"""
+
+    pass
+
+
+class AbstractAsyncWriteOnlyRepository(
+    AsyncCreateRepositoryMixin[BaseT, CreateT],
+    AsyncUpdateRepositoryMixin[BaseT, UpdateT],
+    AsyncDeleteRepositoryMixin[BaseT],
+    ABC,
+):
+    """Abstract repository that implements the asynchronous write only operations"""
+
+    pass
+
+
+class AbstractAsyncCRUDRepository(
+    AbstractAsyncReadOnlyRepository[BaseT],
+    AbstractAsyncWriteOnlyRepository[BaseT, CreateT, UpdateT],
+    ABC,
+):
+    """
+    Abstract repository that implements the asynchronous CRUD operations
+    """
+
+    pass
@@ -1,9 +1,10 @@
 from typing import Generic, TypeVar
 
 from domino.base.baseclass import DominoBaseClass
-from domino.domain.uow import AbstractUnitOfWork
+from domino.domain.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
 
 UOW = TypeVar("UOW", bound=AbstractUnitOfWork)
+AsyncUOW = TypeVar("AsyncUOW", bound=AbstractAsyncUnitOfWork)
 
 
 class Service(DominoBaseClass, Generic[UOW]):
@@ -19,3 +20,19 @@ class Service(DominoBaseClass, Generic[UOW]):
 
         self.unit_of_work = unit_of_work
         self.log.debug("Service Initialized")
+
+
+class AsyncService(DominoBaseClass, Generic[AsyncUOW]):
+    """
+    AsyncService is the asyncio counterpart of Service.
+
+    It provides an asynchronous unit of work, to be used with `async with`
+    in the service coroutines. It also provides a logger to be used in the
+    service methods.
+    """
+
+    def __init__(self, unit_of_work: AsyncUOW) -> None:
+        super().__init__()
+
+        self.unit_of_work = unit_of_work
+        self.log.debug("Service Initialized")
@@ -1,8 +1,95 @@
+import functools
+import inspect
 from abc import abstractmethod
+from typing import Any, Callable
+
 from domino.base.baseclass import DominoBaseClass
 
 
-class AbstractUnitOfWork(DominoBaseClass):
+def _running_hooks(method: Callable, committed: bool) -> Callable:
+    """
+    Wraps the commit or rollback method of a unit of work so that the
+    transaction hooks run once it returns. Methods calling the ones of
+    their parent class only run them once, when the outermost one returns.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if self.__dict__.get("_ending"):
+                return await method(self, *args, **kwargs)
+            self.__dict__["_ending"] = True
+            try:
+                result = await method(self, *args, **kwargs)
+            finally:
+                self.__dict__["_ending"] = False
+            self._run_transaction_hooks(committed)
+            return result
+
+    else:
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.__dict__.get("_ending"):
+                return method(self, *args, **kwargs)
+            self.__dict__["_ending"] = True
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                self.__dict__["_ending"] = False
+            self._run_transaction_hooks(committed)
+            return result
+
+    wrapper._runs_transaction_hooks = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class TransactionHooksMixin:
+    """
+    Collects callbacks to run once the current transaction of a unit of work
+    ends. Commit callbacks are discarded when the transaction is rolled back,
+    and the other way around.
+
+    The callbacks run once `commit` or `rollback` returns, whether they are
+    called explicitly or when leaving the unit of work context. They don't
+    run when `commit` raises, until the transaction is rolled back.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, committed in (("commit", True), ("rollback", False)):
+            method = cls.__dict__.get(name)
+            if (
+                method is None
+                or getattr(method, "__isabstractmethod__", False)
+                or getattr(method, "_runs_transaction_hooks", False)
+            ):
+                continue
+            setattr(cls, name, _running_hooks(method, committed))
+
+    def on_commit(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a callback to run after the current transaction is committed.
+        """
+        self.__dict__.setdefault("_commit_hooks", []).append(callback)
+
+    def on_rollback(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a callback to run after the current transaction is rolled back.
+        """
+        self.__dict__.setdefault("_rollback_hooks", []).append(callback)
+
+    def _run_transaction_hooks(self, committed: bool) -> None:
+        commit_hooks = self.__dict__.pop("_commit_hooks", [])
+        rollback_hooks = self.__dict__.pop("_rollback_hooks", [])
+        for hook in commit_hooks if committed else rollback_hooks:
+            hook()
+
+
+class AbstractUnitOfWork(TransactionHooksMixin, DominoBaseClass):
+    # Whether the unit of work only reads, so that it can use read replicas
+    read_only: bool = False
+
     @abstractmethod
     def __init__(self):
         raise NotImplementedError
@@ -40,3 +127,46 @@ class AbstractUnitOfWork(DominoBaseClass):
         Begins a new transaction for all repositories in the unit of work.
         """
         raise NotImplementedError
+
+
+class AbstractAsyncUnitOfWork(TransactionHooksMixin, DominoBaseClass):
+    # Whether the unit of work only reads, so that it can use read replicas
+    read_only: bool = False
+
+    @abstractmethod
+    def __init__(self):
+        raise NotImplementedError
+
+    # Context Management
+    async def __aenter__(self):
+        await self.begin()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            await self.rollback()
+            return False
+        else:
+            await self.commit()
+            return True
+
+    # UOW Transaction Management
+    @abstractmethod
+    async def commit(self):
+        """
+        Commits the current transaction for all repositories in the unit of work.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self):
+        """
+        Rolls back the current transaction for all repositories in the unit of work.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def begin(self):
+        """
+        Begins a new transaction for all repositories in the unit of work.
+        """
+        raise NotImplementedError
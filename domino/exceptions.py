@@ -24,3 +24,19 @@ class BusinessRuleViolation(DominoException):
 
     def to_json(self):
         return {"id": self.id, "message": self.message}
+
+
+class InvalidCursor(DominoException):
+    pass
+
+
+class InvalidLimit(DominoException):
+    pass
+
+
+class InvalidFilter(DominoException):
+    pass
+
+
+class WriteConflict(DominoException):
+    pass
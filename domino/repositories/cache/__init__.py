@@ -0,0 +1,9 @@
+from .backends import CacheStats, InMemoryCacheBackend, SQLiteCacheBackend
+from .repository import CachedRepository
+
+__all__ = [
+    "CachedRepository",
+    "CacheStats",
+    "InMemoryCacheBackend",
+    "SQLiteCacheBackend",
+]
@@ -0,0 +1,246 @@
+import copy
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from domino.base.sqlite import SQLiteConnections
+
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a cache backend.
+
+    Attributes:
+    -----------
+    hits: int
+        The number of lookups answered by the cache.
+    misses: int
+        The number of lookups that had to go to the repository.
+    evictions: int
+        The number of entries dropped because the cache was full or the
+        entry had expired.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend(ABC):
+    """
+    A key-value store used by CachedRepository.
+
+    Backends evict the least recently used entries once `max_size` entries
+    are stored, and entries older than `ttl` seconds. A `ttl` of None keeps
+    entries until they are evicted or invalidated.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """
+        Returns the value stored at key, or MISSING.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Deletes every key starting with prefix.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _expires_at(self) -> float | None:
+        return None if self.ttl is None else time.monotonic() + self.ttl
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    A thread-safe LRU/TTL cache living in the memory of the process.
+
+    Values are deep copied in and out unless `copy_values` is unset, so that
+    callers mutating an entity don't change the cached one.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, ttl: float | None = None, copy_values: bool = True
+    ) -> None:
+        super().__init__(max_size, ttl)
+        self.copy_values = copy_values
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry[0] is not None
+                and entry[0] < time.monotonic()
+            ):
+                del self._entries[key]
+                self.stats.evictions += 1
+                entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            value = entry[1]
+
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.copy_values:
+            value = copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (self._expires_at(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    A LRU/TTL cache stored in a SQLite file, shared by every process that
+    opens the same path.
+
+    Values are pickled. Expiration uses wall clock time, since monotonic
+    clocks are not comparable across processes. Statistics are counted per
+    process.
+
+    Hits don't write to the file: their access times are kept in memory and
+    written in one batch by the next `set`, or once `touch_batch_size` keys
+    were hit. Eviction is thus an approximate LRU, which may not account for
+    the latest hits of other processes.
+    """
+
+    touch_batch_size: int = 64
+
+    def __init__(
+        self, path: str, max_size: int = 1024, ttl: float | None = None
+    ) -> None:
+        super().__init__(max_size, ttl)
+        self.path = path
+        self._connections = SQLiteConnections(path, "NORMAL")
+        self._touched: dict[str, float] = {}
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB, expires_at REAL, accessed_at REAL)"
+        )
+        self._connection().execute(
+            "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def _expires_at(self) -> float | None:
+        return None if self.ttl is None else time.time() + self.ttl
+
+    def get(self, key: str) -> Any:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is not None and row[1] is not None and row[1] < time.time():
+            connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self.stats.evictions += 1
+            row = None
+
+        if row is None:
+            self.stats.misses += 1
+            return MISSING
+
+        self._touched[key] = time.time()
+        if len(self._touched) >= self.touch_batch_size:
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                self._write_touches(connection)
+        self.stats.hits += 1
+        return pickle.loads(row[0])
+
+    def _write_touches(self, connection: sqlite3.Connection) -> None:
+        touched, self._touched = self._touched, {}
+        connection.executemany(
+            "UPDATE cache SET accessed_at = ? WHERE key = ? AND accessed_at < ?",
+            [(accessed_at, key, accessed_at) for key, accessed_at in touched.items()],
+        )
+
+    def set(self, key: str, value: Any) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._write_touches(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, pickle.dumps(value), self._expires_at(), time.time()),
+            )
+            overflow = connection.execute(
+                "SELECT COUNT(*) - ? FROM cache", (self.max_size,)
+            ).fetchone()[0]
+            if overflow > 0:
+                connection.execute(
+                    "DELETE FROM cache WHERE key IN ("
+                    "SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+                self.stats.evictions += overflow
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        self._connection().execute(
+            "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+        )
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM cache")
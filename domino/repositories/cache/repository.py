@@ -0,0 +1,163 @@
+import json
+from typing import Any, Generic, Sequence
+
+from domino.base.baseclass import DominoBaseClass
+from domino.domain.repositories import AbstractReadOnlyRepository, BaseT
+from domino.domain.uow import TransactionHooksMixin
+
+from .backends import MISSING, CacheBackend, InMemoryCacheBackend
+
+
+class CachedRepository(Generic[BaseT], DominoBaseClass):
+    """
+    A read-through cache wrapped around any read only repository.
+
+    `get` and `list` results are served from the cache backend and stored in
+    it on a miss. Every other attribute is delegated to the wrapped
+    repository.
+
+    Writes made through the wrapper invalidate the written ids and every
+    cached list. When a unit of work is given, the invalidation happens once
+    it commits, and reads of keys written in the current transaction bypass
+    the cache until then. The attributes of the unit of work holding the
+    wrapped repository are replaced by the wrapper, so that writes made
+    through the unit of work invalidate the cache as well. Units of work
+    building new repositories on `begin` should wrap them there instead.
+
+    Attributes:
+    -----------
+    repository: AbstractReadOnlyRepository
+        The wrapped repository.
+    backend: CacheBackend
+        Where the results are cached. Share it across units of work, and
+        across processes with a file backed backend.
+    namespace: str
+        The prefix of the cache keys, the wrapped repository class name
+        by default.
+    """
+
+    def __init__(
+        self,
+        repository: AbstractReadOnlyRepository[BaseT],
+        backend: CacheBackend | None = None,
+        namespace: str | None = None,
+        unit_of_work: TransactionHooksMixin | None = None,
+    ) -> None:
+        super().__init__()
+        self.repository = repository
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.namespace = namespace or repository.__class__.__name__
+        self.unit_of_work = unit_of_work
+        self._pending: set[str] | None = None
+
+        if unit_of_work is not None:
+            for name, value in list(vars(unit_of_work).items()):
+                if value is repository:
+                    setattr(unit_of_work, name, self)
+
+    @property
+    def stats(self):
+        return self.backend.stats
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repository, name)
+
+    # Writes
+    def create(self, data: Any) -> BaseT:
+        result = self.repository.create(data)
+        self._invalidate([])
+        return result
+
+    def create_many(self, data: Sequence[Any], **kwargs) -> list[BaseT]:
+        result = self.repository.create_many(data, **kwargs)
+        self._invalidate([])
+        return result
+
+    def update(self, id: Any, data: Any, **kwargs) -> BaseT:
+        result = self.repository.update(id, data, **kwargs)
+        self._invalidate([id])
+        return result
+
+    def update_many(self, ids: Sequence[Any], data: Any, **kwargs) -> list[BaseT]:
+        result = self.repository.update_many(ids, data, **kwargs)
+        self._invalidate(ids)
+        return result
+
+    def delete(self, id: Any) -> None:
+        self.repository.delete(id)
+        self._invalidate([id])
+
+    def delete_many(self, ids: Sequence[Any], **kwargs) -> None:
+        self.repository.delete_many(ids, **kwargs)
+        self._invalidate(ids)
+
+    def save(self, data: BaseT) -> BaseT:
+        result = self.repository.save(data)
+        self._invalidate([data.id])
+        return result
+
+    def invalidate(self, ids: Sequence[Any] = ()) -> None:
+        """
+        Drops the given ids and every cached list from the cache.
+        """
+        for id in ids:
+            self.backend.delete(self._get_key(id))
+        self.backend.delete_prefix(f"{self.namespace}:list:")
+
+    # Keys
+    def _get_key(self, id: Any) -> str:
+        # Ids are compared as strings, like the KV repositories store them,
+        # so that get(1) and get("1") share an entry
+        return f"{self.namespace}:get:{str(id)}"
+
+    def _list_key(self, filter_data: dict, options: dict) -> str:
+        arguments = json.dumps([filter_data, options], sort_keys=True, default=str)
+        return f"{self.namespace}:list:{arguments}"
+
+    def _is_pending(self, key: str) -> bool:
+        return self._pending is not None and key in self._pending
+
+    def _invalidate(self, ids: Sequence[Any]) -> None:
+        if self.unit_of_work is None:
+            self.invalidate(ids)
+            return
+
+        if self._pending is None:
+            self._pending = set()
+            self.unit_of_work.on_commit(self._commit_pending)
+            self.unit_of_work.on_rollback(self._discard_pending)
+        self._pending.update(self._get_key(id) for id in ids)
+        # Even without ids, mark the transaction as dirty to bypass lists
+        self._pending.add(f"{self.namespace}:list:")
+
+    def _discard_pending(self) -> None:
+        self._pending = None
+
+    def _commit_pending(self) -> None:
+        pending, self._pending = self._pending or set(), None
+        for key in pending:
+            self.backend.delete(key)
+        self.backend.delete_prefix(f"{self.namespace}:list:")
+
+    # Reads
+    def get(self, id: Any) -> BaseT:
+        key = self._get_key(id)
+        if self._is_pending(key):
+            return self.repository.get(id)
+
+        value = self.backend.get(key)
+        if value is MISSING:
+            value = self.repository.get(id)
+            self.backend.set(key, value)
+        return value
+
+    def list(self, filter_data: dict = {}, **kwargs) -> tuple[int, list[BaseT]]:
+        if self._pending:
+            return self.repository.list(filter_data, **kwargs)
+
+        key = self._list_key(filter_data, kwargs)
+        value = self.backend.get(key)
+        if value is MISSING:
+            value = self.repository.list(filter_data, **kwargs)
+            self.backend.set(key, value)
+        return value
@@ -0,0 +1,3 @@
+from .sqlite import SQLiteKVRepository
+
+__all__ = ["SQLiteKVRepository"]
@@ -0,0 +1,265 @@
+import sqlite3
+from typing import Any, Generic, Iterator, Sequence, TypeVar
+
+from pydantic_core import from_json, to_json
+
+from domino.base.sqlite import SQLiteConnections
+from domino.domain.filters import FilterData, as_filter
+from domino.domain.models.abstract import AbstractDTO, AbstractEntity
+from domino.domain.pagination import Page, check_limit, paginate_items
+from domino.exceptions import ItemNotFound, PrimaryKeyPropertyNotDefined
+
+BaseT = TypeVar("BaseT", bound=AbstractEntity)
+CreateT = TypeVar("CreateT", bound=AbstractDTO)
+UpdateT = TypeVar("UpdateT", bound=AbstractDTO)
+
+# SQLite limits the number of parameters of a statement
+MAX_PARAMETERS = 900
+
+
+class SQLiteKVRepository(Generic[BaseT, CreateT, UpdateT]):
+    """
+    A KV Repository storing its items in a local SQLite file, with the API
+    of MockedKVRepository.
+
+    It is meant for processes that need a durable store without a database
+    server, such as CLI tools or edge nodes. Opening a repository only opens
+    the file, so it starts in milliseconds whatever the number of items.
+
+    Items are stored as JSON documents, in one table per repository. Every
+    write is a transaction of the write-ahead log, and the log is synced
+    to disk on commit, so a crash never leaves a partial write behind.
+    Repositories referenced in `foreign_keys` are opened on the same file.
+
+    Attributes:
+    -----------
+    path: str
+        The path of the SQLite file, created if missing.
+    table: str
+        The table of the items, the lowercased name of the entity by
+        default.
+    synchronous: str
+        The SQLite synchronous mode. FULL syncs every commit, NORMAL only
+        syncs at checkpoints and may lose the last commits on power loss.
+    fixtures: list[CreateT]
+        The items created when the table is created.
+    """
+
+    entity: type[BaseT]
+    table: str | None = None
+    primary_key_property: str = "id"
+    sort_key: str = "id"
+    sort_descending: bool = True
+    foreign_keys: dict[str, Any] = {}
+    fixtures: list[CreateT] = []
+    synchronous: str = "FULL"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.table = self.table or self.entity.__name__.lower()
+        self._connections = SQLiteConnections(path, self.synchronous)
+
+        try:
+            self.__getattribute__("primary_key_property")
+        except AttributeError:
+            raise PrimaryKeyPropertyNotDefined()
+
+        self.foreign_keys = {
+            key: repo_class(path) for key, repo_class in self.foreign_keys.items()
+        }
+
+        if self._create_table():
+            for fixture in self.fixtures:
+                self.create(fixture)
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def _create_table(self) -> bool:
+        """
+        Creates the tables of the repository, and returns whether they were
+        missing.
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            exists = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (self.table,),
+            ).fetchone()
+            if exists:
+                return False
+
+            # Positions keep the insertion order, and are never reused
+            connection.execute(
+                f'CREATE TABLE "{self.table}" ('
+                "position INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "id TEXT NOT NULL UNIQUE, "
+                "data TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS domino_sequences ("
+                "name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO domino_sequences VALUES (?, 0)", (self.table,)
+            )
+        return True
+
+    def _next_id(self, connection: sqlite3.Connection) -> str:
+        connection.execute(
+            "UPDATE domino_sequences SET value = value + 1 WHERE name = ?",
+            (self.table,),
+        )
+        return str(
+            connection.execute(
+                "SELECT value FROM domino_sequences WHERE name = ?", (self.table,)
+            ).fetchone()[0]
+        )
+
+    def _read(self, item_id: str) -> dict | None:
+        row = (
+            self._connection()
+            .execute(f'SELECT data FROM "{self.table}" WHERE id = ?', (item_id,))
+            .fetchone()
+        )
+        return None if row is None else from_json(row[0])
+
+    def _read_many(self, ids: Sequence[str]) -> dict[str, dict]:
+        items = {}
+        for start in range(0, len(ids), MAX_PARAMETERS):
+            chunk = ids[start : start + MAX_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            for item_id, data in self._connection().execute(
+                f'SELECT id, data FROM "{self.table}" WHERE id IN ({placeholders})',
+                chunk,
+            ):
+                items[item_id] = from_json(data)
+        return items
+
+    def _scan(self) -> Iterator[dict]:
+        for (data,) in self._connection().execute(
+            f'SELECT data FROM "{self.table}" ORDER BY position'
+        ):
+            yield from_json(data)
+
+    def _write(self, item_id: str, data: dict) -> None:
+        self._connection().execute(
+            f'INSERT INTO "{self.table}" (id, data) VALUES (?, ?) '
+            "ON CONFLICT (id) DO UPDATE SET data = excluded.data",
+            (item_id, to_json(data)),
+        )
+
+    def get(self, id: Any) -> BaseT:
+        data = self._read(str(id))
+        if data is None:
+            raise ItemNotFound
+        return self._render_many([data])[0]
+
+    def list(self, filter_data: FilterData = {}) -> tuple[int, list[BaseT]]:
+        filter = as_filter(filter_data)
+        matches = filter.predicate() if filter is not None else None
+        results = self._render_many(
+            [data for data in self._scan() if matches is None or matches(data)]
+        )
+
+        return (
+            len(results),
+            results,
+        )
+
+    def paginate(
+        self,
+        filter_data: FilterData,
+        limit: int,
+        cursor: str | None = None,
+        sort_key: str | None = None,
+    ) -> Page[BaseT]:
+        check_limit(limit)
+        _, results = self.list(filter_data)
+        return paginate_items(
+            results,
+            limit,
+            cursor,
+            sort_key or self.sort_key,
+            self.primary_key_property,
+            self.sort_descending,
+        )
+
+    def create(self, data: CreateT) -> BaseT:
+        values = data.dump()
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            if self.primary_key_property in values:
+                item_id = str(values[self.primary_key_property])
+            else:
+                item_id = self._next_id(connection)
+
+            item = {self.primary_key_property: item_id, **values}
+            # Test for foreign keys before writing
+            entity = self._render_many([item])[0]
+            self._write(item_id, item)
+
+        return entity
+
+    def update(self, item_id: Any, data: UpdateT) -> BaseT:
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            current = self._read(str(item_id))
+            if current is None:
+                raise ItemNotFound
+            item = current | data.dump()
+
+            # Test for foreign keys before writing
+            entity = self._render_many([item])[0]
+            self._write(str(item_id), item)
+
+        return entity
+
+    def delete(self, id: Any) -> None:
+        cursor = self._connection().execute(
+            f'DELETE FROM "{self.table}" WHERE id = ?', (str(id),)
+        )
+        if cursor.rowcount == 0:
+            raise ItemNotFound
+
+    def compact(self) -> None:
+        """
+        Reclaims the space left by deleted and overwritten items, and
+        truncates the write-ahead log.
+        """
+        connection = self._connection()
+        connection.execute("VACUUM")
+        # Vacuuming goes through the log, so it is checkpointed afterwards
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        self._connections.close()
+        for repo in self.foreign_keys.values():
+            repo.close()
+
+    def _render_many(self, items: Sequence[dict]) -> Sequence[BaseT]:
+        """
+        Builds the entities of items, reading each distinct item their
+        foreign keys point to once.
+        """
+        resolved: list[dict] = [{} for _ in items]
+        for fkey, repo in self.foreign_keys.items():
+            column = f"{fkey.lower()}_id"
+            ids = list({str(item[column]) for item in items if item.get(column)})
+            references = repo._read_many(ids) if ids else {}
+            entities = dict(
+                zip(references, repo._render_many(list(references.values())))
+            )
+            for item, values in zip(items, resolved):
+                fkey_id = item.get(column)
+                if fkey_id and str(fkey_id) in entities:
+                    values[fkey] = entities[str(fkey_id)]
+
+        rows = [{**item, **values} for item, values in zip(items, resolved)]
+        load_many = getattr(self.entity, "load_many", None)
+        if load_many is None:
+            return [self.entity(**row) for row in rows]
+        return load_many(rows)
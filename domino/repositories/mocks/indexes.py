@@ -0,0 +1,189 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Hashable
+
+from domino.domain.filters import And, Condition, Filter, Or
+
+MISSING = object()
+
+# Ids are strings, so these sort before and after every id holding a value
+FIRST_ID = ""
+LAST_ID = "\U0010ffff"
+
+
+class HashIndex:
+    """
+    An index mapping each value of an attribute to the ids of the items
+    holding it, serving equality and `in` conditions.
+
+    Attributes:
+    -----------
+    field: str
+        The indexed attribute.
+    postings: dict[Hashable, set[str]]
+        The ids of the items holding each value, None for the items where
+        the attribute is missing or None.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.postings: dict[Hashable, set[str]] = {}
+
+    def add(self, id: str, value: Any) -> None:
+        self.postings.setdefault(value, set()).add(id)
+
+    def remove(self, id: str, value: Any) -> None:
+        posting = self.postings.get(value)
+        if posting is not None:
+            posting.discard(id)
+            if not posting:
+                del self.postings[value]
+
+    def lookup(self, condition: Condition) -> set[str] | None:
+        """
+        Returns the ids of the items matching the condition, or None when
+        the index can't tell.
+        """
+        operator, value = condition.operator, condition.value
+        try:
+            if operator == "eq":
+                return self.postings.get(value, set())
+            if operator == "in":
+                return set().union(*(self.postings.get(item, ()) for item in value))
+            if operator == "is_null" and value:
+                return self.postings.get(None, set())
+        except TypeError:
+            # Unhashable values can't be looked up
+            return None
+        return None
+
+
+class SortedIndex:
+    """
+    An index keeping the values of an attribute sorted, serving equality,
+    range and prefix conditions with binary searches.
+
+    Values of the attribute must be comparable with each other.
+
+    Attributes:
+    -----------
+    field: str
+        The indexed attribute.
+    entries: list[tuple[Any, str]]
+        The (value, id) pairs of the items, sorted.
+    nulls: set[str]
+        The ids of the items where the attribute is missing or None.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.entries: list[tuple[Any, str]] = []
+        self.nulls: set[str] = set()
+
+    def add(self, id: str, value: Any) -> None:
+        if value is None:
+            self.nulls.add(id)
+        else:
+            insort(self.entries, (value, id))
+
+    def remove(self, id: str, value: Any) -> None:
+        if value is None:
+            self.nulls.discard(id)
+            return
+        position = bisect_left(self.entries, (value, id))
+        if position < len(self.entries) and self.entries[position] == (value, id):
+            del self.entries[position]
+
+    def _range(
+        self,
+        low: Any = MISSING,
+        high: Any = MISSING,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> set[str]:
+        start, end = 0, len(self.entries)
+        if low is not MISSING:
+            start = bisect_left(
+                self.entries, (low, FIRST_ID if include_low else LAST_ID)
+            )
+        if high is not MISSING:
+            end = bisect_right(
+                self.entries, (high, LAST_ID if include_high else FIRST_ID)
+            )
+        return {id for _, id in self.entries[start:end]}
+
+    def lookup(self, condition: Condition) -> set[str] | None:
+        """
+        Returns the ids of the items matching the condition, or None when
+        the index can't tell.
+        """
+        operator, value = condition.operator, condition.value
+        try:
+            if operator == "is_null" and value:
+                return set(self.nulls)
+            if operator == "eq":
+                if value is None:
+                    return set(self.nulls)
+                return self._range(value, value)
+            if operator == "gt":
+                return self._range(low=value, include_low=False)
+            if operator == "ge":
+                return self._range(low=value)
+            if operator == "lt":
+                return self._range(high=value, include_high=False)
+            if operator == "le":
+                return self._range(high=value)
+            if operator == "between":
+                return self._range(*value)
+            if operator == "startswith" and isinstance(value, str) and value:
+                # The strings starting with a prefix sort before the prefix
+                # with its last character incremented
+                following = value[:-1] + chr(ord(value[-1]) + 1)
+                return self._range(value, following, include_high=False)
+        except TypeError:
+            # The value isn't comparable with the indexed ones
+            return None
+        return None
+
+
+INDEX_TYPES = {"hash": HashIndex, "sorted": SortedIndex}
+
+
+def candidates(
+    filter: Filter, indexes: dict[str, HashIndex | SortedIndex]
+) -> set[str] | None:
+    """
+    Returns the ids of the items that may match a filter, from the postings
+    of the indexes, or None when the filter needs a full scan.
+
+    The conditions of an `and` are intersected starting with the smallest
+    posting, so the most selective index bounds the work. An `or` is
+    served only when all of its branches are.
+    """
+    if isinstance(filter, Condition):
+        index = indexes.get(filter.field)
+        return None if index is None else index.lookup(filter)
+
+    if isinstance(filter, And):
+        postings = [candidates(child, indexes) for child in filter.filters]
+        served = sorted(
+            (posting for posting in postings if posting is not None), key=len
+        )
+        if not served:
+            return None
+        result = set(served[0])
+        for posting in served[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    if isinstance(filter, Or):
+        result: set[str] = set()
+        for child in filter.filters:
+            posting = candidates(child, indexes)
+            if posting is None:
+                return None
+            result |= posting
+        return result
+
+    return None
@@ -1,8 +1,15 @@
-from typing import Any, Generic, TypeVar
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Callable, Generic, Hashable, Iterable, Sequence, TypeVar
 
+from domino.domain.filters import Filter, FilterData, as_filter
 from domino.domain.models.abstract import AbstractDTO, AbstractEntity
+from domino.domain.pagination import Page, check_limit, paginate_items
 from domino.exceptions import ItemNotFound
 
+from .indexes import INDEX_TYPES, HashIndex, SortedIndex, candidates
+from .mvcc import Change, Snapshot, Transaction, VersionedStore
+
 BaseT = TypeVar("BaseT", bound=AbstractEntity)
 CreateT = TypeVar("CreateT", bound=AbstractDTO)
 UpdateT = TypeVar("UpdateT", bound=AbstractDTO)
@@ -22,21 +29,64 @@ class MockedKVRepository(Generic[BaseT, CreateT, UpdateT]):
     - BaseT: The DomainModel that will be used to store data in memory.
     - CreateT: The DTO that will be used to create new items.
     - UpdateT: The DTO that will be used to update existing items.
+
+    Attributes can be indexed by declaring them in `indexes`, mapped to the
+    kind of index to maintain: `hash` for equality and `in` conditions, or
+    `sorted` for ranges and prefixes as well. `list` then reads the ids of
+    the matching items from the postings of the indexes, and only checks
+    the rest of the filter on those items instead of scanning every item.
+
+    Rendered items, with the items their foreign keys point to nested in
+    them, are cached along with the versions of all of these items, so
+    foreign keys are only resolved again after one of them is written.
+    Reads build their entities from the rendered items in one `load_many`
+    call. Listing resolves each foreign key once per distinct id.
+
+    Between `begin` and `commit`, the thread or task reads a snapshot of
+    the items taken at `begin`, along with its own writes, which no one
+    else sees until they are committed. Commits never wait for readers,
+    and `commit` raises WriteConflict when another transaction committed
+    a write to the same item first. A rejected commit leaves nothing
+    behind, neither items nor index entries. The repositories of the
+    foreign keys begin, commit and roll back along with the repository, so
+    that the items they point to are read from the same point in time.
+    Outside of a transaction, reads see the latest committed items and
+    every write is committed at once.
     """
 
     entity: type[BaseT]
     primary_key_property: str = "id"
+    sort_key: str = "id"
+    sort_descending: bool = True
     foreign_keys: dict[str, Any] = {}
+    indexes: dict[str, str] = {}
     fixtures: list[CreateT] = []
 
     def __init__(self):
-        self.__index = 1
-        self._data = {}
+        self.__ids = count(1)
+        self._store = VersionedStore()
+        self._transaction: ContextVar[Transaction | None] = ContextVar(
+            f"{type(self).__name__}_transaction", default=None
+        )
+        self._indexes: dict[str, HashIndex | SortedIndex] = {
+            field: INDEX_TYPES[kind](field) for field, kind in self.indexes.items()
+        }
+
+        # Insertion order of the committed items, to list indexed results
+        self._positions: dict[str, int] = {}
+        self.__positions = count()
+
+        # Rendered items along with the versions they were rendered at
+        self._rendered: dict[str, tuple[Hashable, dict]] = {}
 
         # Instanciate Foreign Keys repos
         self.foreign_keys = {
             key: repo_class() for key, repo_class in self.foreign_keys.items()
         }
+        # The column holding the id of the item of each foreign key
+        self.__references = [
+            (key, f"{key.lower()}_id", repo) for key, repo in self.foreign_keys.items()
+        ]
 
         # Create Fixtures
         for fixture in self.fixtures:
@@ -46,28 +96,99 @@ class MockedKVRepository(Generic[BaseT, CreateT, UpdateT]):
         except AttributeError:
             raise PrimaryKeyPropertyNotDefined()
 
+    @property
+    def _data(self) -> Snapshot:
+        """
+        The items visible to the current thread or task.
+        """
+        return Snapshot(self._store, self._transaction.get())
+
+    def begin(self) -> None:
+        if self._transaction.get() is not None:
+            raise RuntimeError("A transaction is already in progress")
+        self._transaction.set(self._store.begin())
+        # Foreign items are read from snapshots taken along with this one
+        for repo in self.foreign_keys.values():
+            repo.begin()
+
+    def commit(self) -> None:
+        transaction = self._transaction.get()
+        if transaction is None:
+            return
+        self._transaction.set(None)
+        try:
+            self._store.commit(transaction, self.__committed)
+        except Exception:
+            for repo in self.foreign_keys.values():
+                repo.rollback()
+            raise
+        for repo in self.foreign_keys.values():
+            repo.commit()
+
+    def rollback(self) -> None:
+        transaction = self._transaction.get()
+        if transaction is not None:
+            self._transaction.set(None)
+            self._store.end(transaction)
+            for repo in self.foreign_keys.values():
+                repo.rollback()
+
     def get(self, id: int) -> BaseT:
         try:
-            return self.__render_value(self._data[str(id)])
+            _, item = self._render_one(str(id))
+            return self.entity(**item)
         except Exception:
             raise ItemNotFound
 
-    def list(self, filter_data: dict = {}) -> tuple[int, list[BaseT]]:
-        results = [
-            self.__render_value(data)
-            for data in self._data.values()
-            if all([data.get(key) == value for key, value in filter_data.items()])
-        ]
+    def list(self, filter_data: FilterData = {}) -> tuple[int, list[BaseT]]:
+        if self._transaction.get() is not None:
+            return self.__list(filter_data)
+
+        # Reads a consistent snapshot even when others write meanwhile
+        self.begin()
+        try:
+            return self.__list(filter_data)
+        finally:
+            self.rollback()
+
+    def __list(self, filter_data: FilterData) -> tuple[int, Sequence[BaseT]]:
+        filter = as_filter(filter_data)
+        if filter is None:
+            results = self._render_many(list(self._data))
+        else:
+            data = self._data
+            matches = filter.predicate()
+            ids = self.__candidates(filter, data)
+            results = self._render_many(
+                [id for id in (data if ids is None else ids) if matches(data[id])]
+            )
 
         return (
             len(results),
             results,
         )
 
+    def paginate(
+        self,
+        filter_data: FilterData,
+        limit: int,
+        cursor: str | None = None,
+        sort_key: str | None = None,
+    ) -> Page[BaseT]:
+        check_limit(limit)
+        _, results = self.list(filter_data)
+        return paginate_items(
+            results,
+            limit,
+            cursor,
+            sort_key or self.sort_key,
+            self.primary_key_property,
+            self.sort_descending,
+        )
+
     def create(self, data: CreateT) -> BaseT:
         if self.primary_key_property not in data.dump().keys():
-            item_id = str(self.__index)
-            self.__index += 1
+            item_id = str(next(self.__ids))
         else:
             item_id = str(data.dump().get(self.primary_key_property))
 
@@ -80,12 +201,16 @@ class MockedKVRepository(Generic[BaseT, CreateT, UpdateT]):
             }
         )
 
-        self._data[item_id] = {self.primary_key_property: item_id, **data.dump()}
+        item = {self.primary_key_property: item_id, **data.dump()}
+        self.__write(item_id, item)
 
-        return self._data[item_id]
+        return item
 
     def update(self, item_id: int, data: UpdateT) -> BaseT:
-        to_update = self._data[str(item_id)] | data.dump()
+        try:
+            to_update = self._data[str(item_id)] | data.dump()
+        except KeyError:
+            raise ItemNotFound
 
         # Test for foreign keys
         self.entity(
@@ -93,30 +218,190 @@ class MockedKVRepository(Generic[BaseT, CreateT, UpdateT]):
             **self.__resolve_foreign_keys(to_update),
         )
 
-        self._data[str(item_id)] = to_update
+        self.__write(str(item_id), to_update)
 
-        return self._data[str(item_id)]
+        return to_update
 
     def delete(self, id: Any) -> None:
-        del self._data[str(id)]
+        if str(id) not in self._data:
+            raise ItemNotFound
+        self.__write(str(id), None)
 
-    def __render_value(self, data: dict) -> BaseT:
-        return self.entity(
-            **data,
-            **self.__resolve_foreign_keys(data),
-        )
+    def __write(self, item_id: str, data: dict | None) -> None:
+        """
+        Writes an item in the current transaction, or commits it at once
+        outside of a transaction.
+        """
+        transaction = self._transaction.get()
+        autocommit = transaction is None
+        if autocommit:
+            transaction = self._store.begin()
+        transaction.writes[item_id] = (self._store.version_number(), data)
+        if autocommit:
+            self._store.commit(transaction, self.__committed)
 
-    def __resolve_foreign_keys(self, item: dict):
-        resolved_fkeys = dict()
-        for fkey, repo in self.foreign_keys.items():
-            fkey_id = item.get(f"{fkey.lower()}_id")
+    def __committed(self, changes: Sequence[Change]) -> None:
+        # Called by the store, which holds its lock, before publishing a
+        # commit. Indexes are updated first and restored when one of them
+        # rejects a value, so that a rejected commit leaves them unchanged.
+        undo: list[tuple[Callable[[str, Any], None], str, Any]] = []
+        try:
+            for item_id, previous, data in changes:
+                for field, index in self._indexes.items():
+                    if previous is not None:
+                        index.remove(item_id, previous.get(field))
+                        undo.append((index.add, item_id, previous.get(field)))
+                    if data is not None:
+                        index.add(item_id, data.get(field))
+                        undo.append((index.remove, item_id, data.get(field)))
+        except Exception:
+            for operation, item_id, value in reversed(undo):
+                operation(item_id, value)
+            raise
+
+        for item_id, previous, data in changes:
+            if data is None:
+                self._positions.pop(item_id, None)
+                self._rendered.pop(item_id, None)
+            elif previous is None:
+                self._positions[item_id] = next(self.__positions)
+
+    def __candidates(self, filter: Filter, data: Snapshot) -> Sequence[str] | None:
+        """
+        Returns the ids of the items that may match a filter, in order, from
+        the indexes, or None when the items must be scanned.
+
+        Indexes follow the latest committed items, so they are only used by
+        the snapshots seeing them.
+        """
+        if not self._indexes or not data.is_latest:
+            return None
+        with self._store.lock:
+            if not data.is_latest:
+                return None
+            ids = candidates(filter, self._indexes)
+            if ids is None:
+                return None
+            return sorted(ids, key=self._positions.__getitem__)
 
-            if not fkey_id:
+    def _render_many(self, ids: Sequence[str]) -> Sequence[BaseT]:
+        rendered = self.__render(ids)
+        for id, item in zip(ids, rendered):
+            if item is None:
+                raise KeyError(id)
+        return self.__load([item for _, item in rendered])  # type: ignore[misc]
+
+    def _render_found(self, ids: Iterable[str]) -> dict[str, tuple[Hashable, dict]]:
+        """
+        Returns the rendered items that exist among `ids`, by id.
+        """
+        ids = list(ids)
+        return {
+            id: item for id, item in zip(ids, self.__render(ids)) if item is not None
+        }
+
+    def _render_one(self, id: str) -> tuple[Hashable, dict] | None:
+        """
+        Returns the rendered item along with its versions, or None if it
+        doesn't exist. `get` goes through it rather than through the batched
+        rendering of `list`.
+        """
+        transaction = self._transaction.get()
+        if transaction is None:
+            # The latest committed version, without building a snapshot
+            number, data = self._store.visible(id, None)
+        else:
+            number, data = Snapshot(self._store, transaction).entry(id)
+        if data is None:
+            return None
+        if not self.__references:
+            return number, data
+
+        key = [number]
+        references = []
+        for fkey, column, repo in self.__references:
+            fkey_id = data.get(column)
+            rendered = repo._render_one(str(fkey_id)) if fkey_id else None
+            key.append(None if rendered is None else rendered[0])
+            references.append((fkey, rendered))
+        return self.__cached(id, tuple(key), data, references)
+
+    def __render(self, ids: Sequence[str]) -> Sequence[tuple[Hashable, dict] | None]:
+        """
+        Returns the rendered items along with their versions, and the
+        versions of the items their foreign keys point to, None for the
+        items that don't exist.
+        """
+        entry = self._data.entry
+        entries = [entry(id) for id in ids]
+        if not self.__references:
+            # Items are rendered as they are stored
+            return [
+                None if data is None else (number, data) for number, data in entries
+            ]
+
+        # Each distinct item referenced is rendered once
+        found = [
+            (
+                fkey,
+                column,
+                repo._render_found(
+                    {
+                        str(data[column])
+                        for _, data in entries
+                        if data and data.get(column)
+                    }
+                ),
+            )
+            for fkey, column, repo in self.__references
+        ]
+
+        rendered: list[tuple[Hashable, dict] | None] = []
+        for id, (number, data) in zip(ids, entries):
+            if data is None:
+                rendered.append(None)
                 continue
+            key = [number]
+            references = []
+            for fkey, column, items in found:
+                fkey_id = data.get(column)
+                item = items.get(str(fkey_id)) if fkey_id else None
+                key.append(None if item is None else item[0])
+                references.append((fkey, item))
+            rendered.append(self.__cached(id, tuple(key), data, references))
+        return rendered
 
-            try:
-                resolved_fkeys[fkey] = repo.get(fkey_id)
-            except ItemNotFound:
-                pass
+    def __cached(
+        self,
+        id: str,
+        key: Hashable,
+        data: dict,
+        references: Sequence[tuple[str, tuple[Hashable, dict] | None]],
+    ) -> tuple[Hashable, dict]:
+        """
+        Returns the rendered item from the cache, rendering it again when
+        it or one of the items it references was written since.
+        """
+        cached = self._rendered.get(id)
+        if cached is None or cached[0] != key:
+            item = dict(data)
+            for fkey, rendered in references:
+                if rendered is not None:
+                    item[fkey] = rendered[1]
+            cached = self._rendered[id] = (key, item)
+        return cached
 
-        return resolved_fkeys
+    def __load(self, items: Sequence[dict]) -> Sequence[BaseT]:
+        load_many = getattr(self.entity, "load_many", None)
+        if load_many is None:
+            return [self.entity(**data) for data in items]
+        return load_many(items)
+
+    def __resolve_foreign_keys(self, item: dict):
+        resolved = {}
+        for fkey, column, repo in self.__references:
+            fkey_id = item.get(column)
+            rendered = repo._render_one(str(fkey_id)) if fkey_id else None
+            if rendered is not None:
+                resolved[fkey] = rendered[1]
+        return resolved
@@ -0,0 +1,199 @@
+import threading
+from itertools import count
+from typing import Callable, Iterator, Mapping
+
+from domino.exceptions import WriteConflict
+
+# A version of an item: the clock it was committed at, a number identifying
+# its content, and its data, None once the item is deleted
+Version = tuple[int, int, dict | None]
+
+# A committed write: the item, its previous data and its new data
+Change = tuple[str, dict | None, dict | None]
+
+OnCommit = Callable[[list[Change]], None]
+
+
+class Transaction:
+    """
+    The writes of a unit of work, not visible to others until committed.
+
+    Attributes:
+    -----------
+    snapshot: int
+        The clock of the last commit visible to the transaction.
+    writes: dict[str, tuple[int, dict | None]]
+        The version number and data written to each item, None for deleted
+        items.
+    """
+
+    def __init__(self, snapshot: int) -> None:
+        self.snapshot = snapshot
+        self.writes: dict[str, tuple[int, dict | None]] = {}
+
+
+class VersionedStore:
+    """
+    The committed versions of the items of a repository.
+
+    Each commit appends new versions to the items it wrote instead of
+    modifying them, so readers never wait for writers: a transaction reads
+    the versions committed up to its snapshot, whatever was committed
+    since. Versions no transaction can read anymore are dropped on commit.
+
+    Commits are checked with first-committer-wins: a transaction writing an
+    item another transaction committed after its snapshot is rejected with
+    WriteConflict.
+    """
+
+    def __init__(self) -> None:
+        self.clock = 0
+        self.lock = threading.Lock()
+        self._chains: dict[str, tuple[Version, ...]] = {}
+        self._active: dict[int, int] = {}
+        # The items with versions that may become unreadable
+        self._stale: set[str] = set()
+        self._numbers = count(1)
+
+    def begin(self) -> Transaction:
+        with self.lock:
+            transaction = Transaction(self.clock)
+            self._active[id(transaction)] = transaction.snapshot
+        return transaction
+
+    def end(self, transaction: Transaction) -> None:
+        with self.lock:
+            self._active.pop(id(transaction), None)
+
+    def version_number(self) -> int:
+        return next(self._numbers)
+
+    def visible(self, item_id: str, snapshot: int | None) -> tuple[int, dict | None]:
+        """
+        Returns the version number and data of an item as of a snapshot,
+        the latest committed ones when the snapshot is None.
+        """
+        for clock, number, data in reversed(self._chains.get(item_id, ())):
+            if snapshot is None or clock <= snapshot:
+                return number, data
+        return 0, None
+
+    def ids(self) -> list[str]:
+        return list(self._chains)
+
+    def commit(self, transaction: Transaction, on_commit: OnCommit) -> None:
+        """
+        Publishes the writes of a transaction.
+
+        `on_commit` is called first with the previous and new data of each
+        written item, while holding the lock. When it raises, the commit is
+        rejected and nothing is published, so it must leave its own state
+        unchanged as well.
+        """
+        with self.lock:
+            try:
+                changes = []
+                for item_id, (_, data) in transaction.writes.items():
+                    chain = self._chains.get(item_id, ())
+                    if chain and chain[-1][0] > transaction.snapshot:
+                        raise WriteConflict(item_id)
+                    changes.append((item_id, chain[-1][2] if chain else None, data))
+                on_commit(changes)
+
+                self.clock += 1
+                self._active.pop(id(transaction), None)
+                oldest = min(self._active.values(), default=self.clock)
+                for item_id, (number, data) in transaction.writes.items():
+                    chain = self._chains.get(item_id, ())
+                    if not chain or chain[-1][2] is None:
+                        # Items created again are listed last, like new ones
+                        self._chains.pop(item_id, None)
+                    self._chains[item_id] = (*chain, (self.clock, number, data))
+                    self._stale.add(item_id)
+                self._vacuum(oldest)
+            finally:
+                self._active.pop(id(transaction), None)
+
+    def _vacuum(self, oldest: int) -> None:
+        for item_id in list(self._stale):
+            chain = self._prune(self._chains[item_id], oldest)
+            if chain:
+                self._chains[item_id] = chain
+            else:
+                del self._chains[item_id]
+            if not chain or (len(chain) == 1 and chain[0][2] is not None):
+                self._stale.discard(item_id)
+
+    @staticmethod
+    def _prune(chain: tuple[Version, ...], oldest: int) -> tuple[Version, ...]:
+        # Keeps the versions committed after the oldest snapshot, and the
+        # one that snapshot reads
+        start = 0
+        for index, (clock, _, _) in enumerate(chain):
+            if clock <= oldest:
+                start = index
+        chain = chain[start:]
+        if len(chain) == 1 and chain[0][2] is None and chain[0][0] <= oldest:
+            return ()
+        return chain
+
+
+class Snapshot(Mapping[str, dict]):
+    """
+    The items of a repository as seen by a transaction: the versions
+    committed up to its snapshot, overlaid with its own writes.
+
+    Without a transaction, the latest committed versions are read.
+    """
+
+    def __init__(
+        self, store: VersionedStore, transaction: Transaction | None = None
+    ) -> None:
+        self.store = store
+        self.transaction = transaction
+
+    @property
+    def is_latest(self) -> bool:
+        """
+        Whether the snapshot sees the latest committed versions, and only
+        them.
+        """
+        transaction = self.transaction
+        return transaction is None or (
+            not transaction.writes and transaction.snapshot == self.store.clock
+        )
+
+    def entry(self, item_id: str) -> tuple[int, dict | None]:
+        """
+        Returns the version number and data of an item, read at once.
+        """
+        transaction = self.transaction
+        if transaction is None:
+            return self.store.visible(item_id, None)
+        written = transaction.writes.get(item_id)
+        if written is not None:
+            return written
+        return self.store.visible(item_id, transaction.snapshot)
+
+    def __getitem__(self, item_id: str) -> dict:
+        data = self.entry(item_id)[1]
+        if data is None:
+            raise KeyError(item_id)
+        return data
+
+    def __contains__(self, item_id: object) -> bool:
+        return isinstance(item_id, str) and self.entry(item_id)[1] is not None
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self.store.ids()
+        for item_id in ids:
+            if item_id in self:
+                yield item_id
+        if self.transaction is not None:
+            known = set(ids)
+            for item_id, (_, data) in list(self.transaction.writes.items()):
+                if data is not None and item_id not in known:
+                    yield item_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
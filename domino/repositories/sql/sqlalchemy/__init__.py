@@ -1,4 +1,15 @@
-from .database import SQLDatabase
+from .counting import CountStrategy
+from .database import AsyncSQLDatabase, SQLDatabase
 from .repository import SQLRepository
+from .async_repository import AsyncSQLRepository
+from .uow import AsyncSQLUnitOfWork, SQLUnitOfWork
 
-__all__ = ["SQLDatabase", "SQLRepository"]
+__all__ = [
+    "SQLDatabase",
+    "SQLRepository",
+    "AsyncSQLDatabase",
+    "AsyncSQLRepository",
+    "CountStrategy",
+    "SQLUnitOfWork",
+    "AsyncSQLUnitOfWork",
+]
@@ -0,0 +1,364 @@
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domino.domain.filters import FilterData
+from domino.domain.pagination import Page
+from domino.domain.repositories import (
+    AsyncCreateRepositoryMixin,
+    AsyncDeleteRepositoryMixin,
+    AsyncGetRepositoryMixin,
+    AsyncListRepositoryMixin,
+    AsyncPaginateRepositoryMixin,
+    AsyncSaveRepositoryMixin,
+    AsyncUpdateRepositoryMixin,
+    BaseT,
+    CreateT,
+    UpdateT,
+)
+from domino.exceptions import ItemNotFound
+
+from .counting import CountStrategy, plan_rows
+from .repository import SQLRepository, chunked
+
+
+class AsyncSQLRepository(SQLRepository[BaseT]):
+    """
+    A class representing an asynchronous SQL repository.
+
+    It shares its configuration and statements with SQLRepository, but runs
+    them on an AsyncSession.
+    """
+
+    session: AsyncSession
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def _load(self, rows: Sequence[Any]) -> list[BaseT]:
+        """
+        Hydrates rows into domain entities.
+
+        Hydration runs in the synchronous context of the session, so that
+        relationships not loaded yet can still be lazy loaded.
+        """
+        return await self.session.run_sync(lambda _: self._hydrate_all(rows))
+
+
+class AsyncSQLGetMixin(AsyncGetRepositoryMixin[BaseT], AsyncSQLRepository):
+    """
+    A class representing an asynchronous SQL get mixin.
+    """
+
+    async def get(self, id: int) -> BaseT:
+        plan = self._trusted_plan()
+        if self._in_identity_map(id):
+            data = await self.session.get(
+                self.sql_mapping, id, options=self._loader_options()
+            )
+        elif plan is not None:
+            result = await self.session.execute(
+                self._trusted_get_statement(plan), {"pk": id}
+            )
+            data = result.one_or_none()
+            if data is None:
+                raise ItemNotFound
+            return plan.build(data)
+        else:
+            data = (
+                (await self.session.scalars(self._get_statement(), {"pk": id}))
+                .unique()
+                .one_or_none()
+            )
+        if data is None:
+            raise ItemNotFound
+        return (await self._load([data]))[0]
+
+
+class AsyncSQLCreateMixin(
+    AsyncCreateRepositoryMixin[BaseT, CreateT], AsyncSQLRepository
+):
+    """
+    A class representing an asynchronous SQL create mixin.
+    """
+
+    async def create(self, data: CreateT) -> BaseT:
+        sql_obj = self.sql_mapping(**data.dump())
+        self.session.add(sql_obj)
+        await self.session.flush()
+        await self.session.refresh(sql_obj)
+        return (await self._load([sql_obj]))[0]
+
+    async def create_many(
+        self, data: Sequence[CreateT], chunk_size: int | None = None
+    ) -> list[BaseT]:
+        """
+        Creates several rows with one INSERT ... RETURNING per chunk.
+        """
+        if not self._supports("insert_executemany_returning_sort_by_parameter_order"):
+            return [await self.create(item) for item in data]
+
+        rows = []
+        for chunk in chunked(data, chunk_size or self.bulk_chunk_size):
+            rows += await self.session.scalars(
+                self._insert_many_statement(), [item.dump() for item in chunk]
+            )
+        return await self._load(rows)
+
+
+class AsyncSQLListMixin(
+    AsyncListRepositoryMixin[BaseT],
+    AsyncPaginateRepositoryMixin[BaseT],
+    AsyncSQLRepository,
+):
+    """
+    A class representing an asynchronous SQL list mixin.
+    """
+
+    async def list(
+        self, filter_data: FilterData, count: CountStrategy | str | None = None
+    ) -> tuple[int | None, list[BaseT]]:
+        """
+        Returns the number of rows matching the filter, counted with the
+        `count` strategy, and the matching entities.
+        """
+        strategy = CountStrategy(count or self.count_strategy)
+        if strategy is CountStrategy.WINDOWED:
+            statement, params = self._windowed_list_statement(filter_data)
+            rows = (await self.session.execute(statement, params)).unique().all()
+            return (
+                rows[0][1] if rows else 0,
+                await self._load([row[0] for row in rows]),
+            )
+
+        total = await self._count(filter_data, strategy)
+        plan = self._trusted_plan()
+        if plan is not None:
+            statement, params = self._trusted_list_statement(plan, filter_data)
+            result = await self.session.execute(statement, params)
+            return total, plan.build_all(result)
+
+        statement, params = self._list_statement(filter_data)
+        rows = (await self.session.scalars(statement, params)).unique().all()
+
+        return total, await self._load(rows)
+
+    async def _count(
+        self, filter_data: FilterData, strategy: CountStrategy
+    ) -> int | None:
+        if strategy is CountStrategy.NONE:
+            return None
+
+        if strategy is CountStrategy.ESTIMATED and self._can_estimate():
+            if not filter_data:
+                reltuples = await self.session.scalar(self._reltuples_statement())
+                if self._valid_estimate(reltuples):
+                    return int(reltuples)
+            connection = await self.session.connection()
+            result = await connection.exec_driver_sql(
+                self._explain_statement(filter_data)
+            )
+            return plan_rows(result.scalar())
+
+        if strategy is CountStrategy.CAPPED:
+            statement, params = self._capped_count_statement(filter_data)
+        else:
+            statement, params = self._count_statement(filter_data)
+        return await self.session.scalar(statement, params)
+
+    async def iter_list(
+        self, filter_data: FilterData, batch_size: int | None = None
+    ) -> AsyncIterator[BaseT]:
+        """
+        Yields the entities matching the filter, fetching and hydrating
+        `batch_size` rows at a time through a server-side cursor.
+        """
+        plan = self._trusted_plan()
+        if plan is not None:
+            statement, params = self._trusted_list_statement(plan, filter_data)
+            statement = statement.execution_options(
+                yield_per=batch_size or self.stream_batch_size
+            )
+            result = await self.session.stream(statement, params)
+            async for rows in result.partitions():
+                for entity in plan.build_all(rows):
+                    yield entity
+            return
+
+        statement, params = self._list_statement(filter_data, joins=False)
+        statement = statement.execution_options(
+            yield_per=batch_size or self.stream_batch_size
+        )
+
+        result = await self.session.stream_scalars(statement, params)
+        async for rows in result.partitions():
+            for entity in await self._load(rows):
+                yield entity
+
+    async def paginate(
+        self,
+        filter_data: FilterData,
+        limit: int,
+        cursor: str | None = None,
+        sort_key: str | None = None,
+    ) -> Page[BaseT]:
+        """
+        Returns at most `limit` entities after `cursor`, sorted on `sort_key`
+        then on the primary key.
+        """
+        statement, keys = self._page_statement(filter_data, limit, cursor, sort_key)
+        rows, next_cursor = self._page_rows(
+            (await self.session.scalars(statement)).all(), limit, keys
+        )
+
+        return Page(items=await self._load(rows), next_cursor=next_cursor)
+
+
+class AsyncSQLUpdateMixin(
+    AsyncUpdateRepositoryMixin[BaseT, UpdateT], AsyncSQLRepository
+):
+    """
+    A class representing an asynchronous SQL update mixin.
+    """
+
+    async def update(
+        self, id: int, data: UpdateT, returning: bool = True
+    ) -> BaseT | None:
+        """
+        Updates a row and returns the updated entity, in a single
+        UPDATE ... RETURNING round trip where the dialect supports it.
+        """
+        if not returning or not self._supports("update_returning"):
+            result = await self.session.execute(
+                self._update_statement(id, data.dump(), returning=False)
+            )
+            if result.rowcount == 0:
+                raise ItemNotFound
+            if not returning:
+                return None
+            obj = await self.session.get(
+                self.sql_mapping,
+                id,
+                options=self._loader_options(),
+                populate_existing=True,
+            )
+        else:
+            obj = (
+                await self.session.scalars(
+                    self._update_statement(id, data.dump(), returning=True)
+                )
+            ).one_or_none()
+
+        if obj is None:
+            raise ItemNotFound
+        return (await self._load([obj]))[0]
+
+    async def update_many(
+        self, ids: Sequence[Any], data: UpdateT, chunk_size: int | None = None
+    ) -> list[BaseT]:
+        """
+        Applies the same update to several rows with one
+        UPDATE ... WHERE id IN (...) per chunk.
+
+        Raises ItemNotFound if one of the ids does not exist, before any row
+        is updated.
+        """
+        chunks = list(chunked(ids, chunk_size or self.bulk_chunk_size))
+        for chunk in chunks:
+            found = await self.session.scalars(self._existing_statement(chunk))
+            if not set(found) >= set(chunk):
+                raise ItemNotFound
+
+        values = data.dump()
+        returning = self._supports("update_returning")
+        rows = []
+
+        for chunk in chunks:
+            statement = self._update_many_statement(chunk, values)
+            if returning:
+                rows += await self.session.scalars(
+                    statement.returning(self.sql_mapping)
+                )
+            else:
+                await self.session.execute(statement)
+                rows += await self.session.scalars(
+                    self._select_many(chunk).execution_options(populate_existing=True)
+                )
+
+        return await self._load(self._in_order(ids, rows))
+
+
+class AsyncSQLDeleteMixin(AsyncDeleteRepositoryMixin[BaseT], AsyncSQLRepository):
+    """
+    A class representing an asynchronous SQL delete mixin.
+    """
+
+    async def delete(self, id: int) -> None:
+        await self.session.execute(
+            delete(self.sql_mapping).where(self._primary_key == id)
+        )
+
+    async def delete_many(
+        self, ids: Sequence[Any], chunk_size: int | None = None
+    ) -> None:
+        """
+        Deletes several rows with one DELETE ... WHERE id IN (...) per chunk.
+        """
+        for chunk in chunked(ids, chunk_size or self.bulk_chunk_size):
+            await self.session.execute(
+                delete(self.sql_mapping).where(self._primary_key.in_(chunk))
+            )
+
+
+class AsyncSQLSaveMixin(AsyncSaveRepositoryMixin[BaseT], AsyncSQLRepository):
+    """
+    A class representing an asynchronous SQL save mixin.
+    """
+
+    async def save(self, data: BaseT) -> BaseT:
+        return (await self.save_many([data]))[0]
+
+    async def save_many(
+        self, data: Sequence[BaseT], chunk_size: int | None = None
+    ) -> list[BaseT]:
+        """
+        Creates or updates several entities with one
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING per chunk. Entities
+        without primary key value are created with a plain INSERT.
+        """
+        values = [self._column_values(item.dump()) for item in data]
+        if not self._can_upsert():
+            rows = [await self.session.merge(self.sql_mapping(**row)) for row in values]
+            await self.session.flush()
+            return await self._load(rows)
+
+        new, keyed = self._split_new(values)
+        inserted = []
+        for chunk in chunked(new, chunk_size or self.bulk_chunk_size):
+            inserted += await self.session.scalars(self._insert_many_statement(), chunk)
+        upserted = []
+        for statement, params in self._upsert_batches(keyed, chunk_size):
+            upserted += await self.session.scalars(statement, params)
+
+        return await self._load(self._saved_in_order(values, inserted, upserted))
+
+
+class AsyncSQLReadOnlyRepository(AsyncSQLGetMixin[BaseT], AsyncSQLListMixin[BaseT]):
+    pass
+
+
+class AsyncSQLWriteOnlyRepository(
+    AsyncSQLCreateMixin[BaseT, CreateT],
+    AsyncSQLUpdateMixin[BaseT, UpdateT],
+    AsyncSQLDeleteMixin[BaseT],
+    AsyncSQLSaveMixin[BaseT],
+):
+    pass
+
+
+class AsyncSQLCRUDRepository(
+    AsyncSQLReadOnlyRepository[BaseT],
+    AsyncSQLWriteOnlyRepository[BaseT, CreateT, UpdateT],
+):
+    pass
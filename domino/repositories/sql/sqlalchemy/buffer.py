@@ -0,0 +1,182 @@
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+from sqlalchemy import delete, event, update
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from domino.exceptions import ItemNotFound
+
+from .bulk import batched
+
+if TYPE_CHECKING:
+    from .repository import SQLRepository
+
+T = TypeVar("T")
+
+MISSING = object()
+
+
+class Pending(Generic[T]):
+    """
+    A placeholder returned by the writes of a deferred session, standing for
+    the entity they will return.
+
+    Reading any attribute of the placeholder, such as the id generated for
+    a created row, flushes the write buffer and resolves the placeholder to
+    the actual entity.
+    """
+
+    def __init__(self, buffer: "WriteBuffer", resolver: Callable[[], T] | None = None):
+        self._buffer = buffer
+        self._resolver = resolver
+        self._value: Any = MISSING
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._value is not MISSING
+
+    def resolve(self) -> T:
+        if self._value is MISSING:
+            self._buffer.flush()
+        if self._value is MISSING and self._resolver is not None:
+            self._value = self._resolver()
+        return self._value
+
+    def _set(self, value: T) -> None:
+        self._value = value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        if self.is_resolved:
+            return f"Pending({self._value!r})"
+        return "Pending(<unresolved>)"
+
+
+class WriteBuffer:
+    """
+    The writes of a session, queued instead of being sent one at a time.
+
+    Queued writes are sent in the order they were queued: before the session
+    commits, before it runs any other statement, or as soon as `limit`
+    writes are queued. Consecutive writes with the same mapping, operation
+    and written attributes are sent as one batched statement.
+
+    Attributes:
+    -----------
+    session: Session
+        The session the writes are sent on.
+    limit: int
+        The number of queued writes that triggers a flush.
+    """
+
+    def __init__(self, session: Session, limit: int = 1000) -> None:
+        self.session = session
+        self.limit = limit
+        # Runs of consecutive writes of the same shape, as [shape, repository,
+        # *entries]
+        self._runs: list[list] = []
+        self._size = 0
+        self._flushing = False
+
+        session.info["write_buffer"] = self
+        event.listen(session, "before_commit", self._before_commit)
+        event.listen(session, "after_rollback", self._after_rollback)
+        event.listen(session, "do_orm_execute", self._before_execute)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # Queueing
+    def create(self, repository: "SQLRepository", values: dict) -> Pending:
+        pending: Pending = Pending(self)
+        self._queue(repository, "create", tuple(values), (values, pending))
+        return pending
+
+    def update(self, repository: "SQLRepository", id: Any, values: dict) -> Pending:
+        pending: Pending = Pending(self, lambda: repository.get(id))
+        self._queue(repository, "update", tuple(values), (id, values))
+        return pending
+
+    def delete(self, repository: "SQLRepository", id: Any) -> None:
+        self._queue(repository, "delete", (), id)
+
+    def _queue(
+        self, repository: "SQLRepository", operation: str, keys: tuple, entry: Any
+    ) -> None:
+        shape = (repository.sql_mapping, operation, keys)
+        if not self._runs or self._runs[-1][0] != shape:
+            self._runs.append([shape, repository])
+        self._runs[-1].append(entry)
+        self._size += 1
+        if self._size >= self.limit:
+            self.flush()
+
+    # Flushing
+    def flush(self) -> None:
+        """
+        Sends every queued write to the database.
+        """
+        if self._flushing or not self._runs:
+            return
+
+        runs, self._runs, self._size = self._runs, [], 0
+        self._flushing = True
+        try:
+            for (_, operation, _), repository, *entries in runs:
+                getattr(self, f"_flush_{operation}")(repository, entries)
+        finally:
+            self._flushing = False
+
+    def clear(self) -> None:
+        self._runs, self._size = [], 0
+
+    def _flush_create(self, repository: "SQLRepository", entries: list) -> None:
+        if repository._supports("insert_executemany_returning_sort_by_parameter_order"):
+            for chunk in batched(entries, repository.bulk_chunk_size):
+                rows = self.session.scalars(
+                    repository._insert_many_statement(),
+                    [values for values, _ in chunk],
+                )
+                for (_, pending), row in zip(chunk, rows):
+                    pending._set(repository._hydrate(row))
+            return
+
+        rows = [repository.sql_mapping(**values) for values, _ in entries]
+        self.session.add_all(rows)
+        self.session.flush()
+        for (_, pending), row in zip(entries, rows):
+            pending._set(repository._hydrate(row))
+
+    def _flush_update(self, repository: "SQLRepository", entries: list) -> None:
+        mapping = repository.sql_mapping
+        pk = repository._primary_key.key
+        try:
+            self.session.execute(
+                update(mapping), [{**values, pk: id} for id, values in entries]
+            )
+        except StaleDataError:
+            raise ItemNotFound
+        # Updates by primary key don't refresh the rows loaded in the session
+        for id, _ in entries:
+            row = self.session.identity_map.get(self.session.identity_key(mapping, id))
+            if row is not None:
+                self.session.expire(row)
+
+    def _flush_delete(self, repository: "SQLRepository", ids: list) -> None:
+        for chunk in batched(ids, repository.bulk_chunk_size):
+            self.session.execute(
+                delete(repository.sql_mapping).where(repository._primary_key.in_(chunk))
+            )
+
+    # Session events
+    def _before_commit(self, session: Session) -> None:
+        self.flush()
+
+    def _after_rollback(self, session: Session) -> None:
+        self.clear()
+
+    def _before_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        # Statements sent by the flush itself don't trigger another one
+        self.flush()
@@ -0,0 +1,62 @@
+import json
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+@dataclass
+class BulkLoadReport:
+    """
+    The outcome of a bulk load.
+
+    Attributes:
+    -----------
+    rows: int
+        The number of rows loaded.
+    seconds: float
+        The time spent loading them, including the time spent reading the
+        input iterable.
+    method: str
+        How rows were sent, `copy` or `executemany`.
+    """
+
+    rows: int
+    seconds: float
+    method: str
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Yields successive lists of `size` items from any iterable.
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def copy_value(value: Any) -> str:
+    """
+    Renders a value in the text format of Postgres COPY.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # The bytea hex format, with its backslash escaped for COPY
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_line(values: Iterable[Any]) -> str:
+    return "\t".join(copy_value(value) for value in values) + "\n"
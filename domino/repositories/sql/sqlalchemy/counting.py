@@ -0,0 +1,39 @@
+import json
+from enum import Enum
+from typing import Any
+
+
+class CountStrategy(str, Enum):
+    """
+    How `list` counts the rows matching a filter.
+
+    EXACT
+        A separate SELECT COUNT(*).
+    ESTIMATED
+        The estimate of the Postgres planner, from `pg_class.reltuples`
+        without filters and from EXPLAIN otherwise. Other dialects count
+        exactly.
+    CAPPED
+        An exact count of at most `count_cap + 1` rows, so that a count above
+        the cap means "more than the cap".
+    WINDOWED
+        COUNT(*) OVER () selected along with the rows, in the same query.
+    NONE
+        No count, None is returned instead.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CAPPED = "capped"
+    WINDOWED = "windowed"
+    NONE = "none"
+
+
+def plan_rows(plan: Any) -> int:
+    """
+    Returns the number of rows estimated by the top node of an
+    `EXPLAIN (FORMAT JSON)` output.
+    """
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -1,5 +1,21 @@
-from sqlalchemy import create_engine
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import Pool
+
+from .buffer import WriteBuffer
+from .metrics import PoolMetrics
+from .routing import RoutingSession
 
 
 class SQLDatabase:
@@ -11,18 +27,134 @@ class SQLDatabase:
     database: str | None = None
     driver: str = "postgresql"
 
+    # Pool configuration, SQLAlchemy defaults are used when left to None
+    poolclass: type[Pool] | None = None
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_timeout: float | None = None
+    pool_recycle: int | None = None
+    pool_pre_ping: bool | None = None
+    connect_args: dict[str, Any] | None = None
+
+    # Read replicas, chosen by "round_robin" or "least_connections"
+    replica_dsns: list[str] = []
+    replica_strategy: str = "round_robin"
+
+    # The number of queued writes flushing the buffer of deferred sessions
+    write_buffer_limit: int = 1000
+
     def __init__(self):
         """
         Initializes a new instance of the SQLDatabase class.
         """
-        self._engine = create_engine(self.computed_dsn)
-        self._sessionmaker = sessionmaker(bind=self._engine)
+        self._engine, self.pool_metrics = self._create_engine(self.computed_dsn)
+        self._replicas = [self._create_engine(dsn) for dsn in self.replica_dsns]
+        self._replica_cycle = itertools.cycle(range(len(self._replicas)))
+        # None outside of a request scope, where writes don't pin anything
+        self._primary_pinned: ContextVar[bool | None] = ContextVar(
+            f"primary_pinned_{id(self)}", default=None
+        )
+        self._sessionmaker = self._create_sessionmaker()
+
+    def _create_sessionmaker(self) -> sessionmaker:
+        return sessionmaker(bind=self._engine, class_=RoutingSession, database=self)
+
+    def _create_engine(self, dsn: str) -> tuple[Engine, PoolMetrics]:
+        metrics = PoolMetrics()
+        options = self.engine_options(dsn)
+        options["poolclass"] = metrics.pool_class(options["poolclass"])
+
+        engine = create_engine(dsn, **options)
+        metrics.instrument(engine)
+        return engine, metrics
+
+    def engine_options(self, dsn: str | None = None) -> dict[str, Any]:
+        """
+        Returns the keyword arguments the engine of a DSN (the primary one by
+        default) is created with, built from the pool configuration
+        attributes that are set.
+        """
+        options = {
+            key: getattr(self, key)
+            for key in (
+                "pool_size",
+                "max_overflow",
+                "pool_timeout",
+                "pool_recycle",
+                "pool_pre_ping",
+                "connect_args",
+            )
+            if getattr(self, key) is not None
+        }
 
-    def generate_session(self) -> Session:
+        url = make_url(dsn or self.computed_dsn)
+        options["poolclass"] = self.poolclass or url.get_dialect().get_pool_class(url)
+        return options
+
+    def generate_session(
+        self, read_only: bool = False, deferred: bool = False
+    ) -> Session:
         """
         Generates a new session for the database.
+
+        Parameters:
+        -----------
+        read_only : bool
+            Whether the reads of the session can be sent to a replica.
+        deferred : bool
+            Whether the repository writes of the session are queued in a
+            WriteBuffer and sent in batches, instead of one at a time.
+        """
+        session = self._sessionmaker(read_only=read_only)
+        if deferred:
+            WriteBuffer(session, self.write_buffer_limit)
+        return session
+
+    # Replica routing
+    @property
+    def primary_bind(self) -> Engine:
+        return self._engine
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    @property
+    def replica_metrics(self) -> list[PoolMetrics]:
+        return [metrics for _, metrics in self._replicas]
+
+    def choose_replica(self) -> Engine:
+        """
+        Returns the replica engine to read from, according to
+        `replica_strategy`.
+        """
+        if self.replica_strategy == "least_connections":
+            engine, _ = min(self._replicas, key=lambda replica: replica[1].checked_out)
+            return engine
+        return self._replicas[next(self._replica_cycle)][0]
+
+    def pin_primary(self) -> None:
+        """
+        Sends the reads of the current request to the primary, so that it
+        reads its own writes. Outside of a request scope, nothing is pinned.
+        """
+        if self._primary_pinned.get() is not None:
+            self._primary_pinned.set(True)
+
+    def is_primary_pinned(self) -> bool:
+        return bool(self._primary_pinned.get())
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
         """
-        return self._sessionmaker()
+        Delimits a request: once it ends, reads are no longer pinned to the
+        primary by the writes made in it.
+        """
+        token = self._primary_pinned.set(False)
+        try:
+            yield
+        finally:
+            self._primary_pinned.reset(token)
 
     def create_database_from_declarative_base(self, base: type[DeclarativeBase]):
         """
@@ -49,4 +181,65 @@ class SQLDatabase:
         else:
             credentials = ""
 
-        return f"postgresql://{credentials}{self.host}:{self.port}/{self.database}"
+        return f"{self.driver}://{credentials}{self.host}:{self.port}/{self.database}"
+
+
+class AsyncSQLDatabase(SQLDatabase):
+    """
+    The asyncio counterpart of SQLDatabase, built on an AsyncEngine.
+
+    The DSN must name an async driver, such as `postgresql+asyncpg` or
+    `sqlite+aiosqlite`.
+    """
+
+    driver: str = "postgresql+asyncpg"
+
+    def _create_sessionmaker(self) -> async_sessionmaker:
+        return async_sessionmaker(
+            bind=self._engine,
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            database=self,
+        )
+
+    def _create_engine(self, dsn: str) -> tuple[AsyncEngine, PoolMetrics]:
+        metrics = PoolMetrics()
+        options = self.engine_options(dsn)
+        options["poolclass"] = metrics.pool_class(options["poolclass"])
+
+        engine = create_async_engine(dsn, **options)
+        metrics.instrument(engine.sync_engine)
+        return engine, metrics
+
+    def generate_session(self, read_only: bool = False) -> AsyncSession:
+        """
+        Generates a new asynchronous session for the database.
+        """
+        return self._sessionmaker(read_only=read_only)
+
+    @property
+    def primary_bind(self) -> Engine:
+        return self._engine.sync_engine
+
+    def choose_replica(self) -> Engine:
+        return super().choose_replica().sync_engine
+
+    async def create_database_from_declarative_base(self, base: type[DeclarativeBase]):
+        """
+        Creates the database from a declarative base.
+
+        Parameters:
+        -----------
+        base : DeclarativeBase
+            The declarative base to create the database from.
+        """
+        async with self._engine.begin() as connection:
+            await connection.run_sync(base.metadata.create_all)
+
+    async def dispose(self):
+        """
+        Closes all the connections of the engine pools.
+        """
+        await self._engine.dispose()
+        for engine, _ in self._replicas:
+            await engine.dispose()
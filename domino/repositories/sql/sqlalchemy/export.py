@@ -0,0 +1,106 @@
+import datetime
+import json
+from decimal import Decimal
+from importlib import import_module
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import Column
+
+Chunk = dict[str, list[Any]]
+
+# The Arrow type of the columns holding these Python types
+ARROW_TYPES = {
+    bool: "bool_",
+    int: "int64",
+    float: "float64",
+    str: "string",
+    bytes: "binary",
+    datetime.date: "date32",
+    dict: "string",
+    list: "string",
+}
+
+
+def require_pyarrow(module: str = "pyarrow") -> Any:
+    """
+    Imports pyarrow, an optional dependency only needed to export Arrow
+    record batches and Parquet files.
+    """
+    try:
+        return import_module(module)
+    except ImportError as error:
+        raise ImportError(
+            "Exporting to Arrow or Parquet requires pyarrow: pip install pyarrow"
+        ) from error
+
+
+def chunk_of(names: Sequence[str], rows: Sequence[Sequence[Any]]) -> Chunk:
+    """
+    Transposes rows into a mapping of column names to their values.
+    """
+    if not rows:
+        return {name: [] for name in names}
+    return dict(zip(names, map(list, zip(*rows))))
+
+
+def arrow_type(pa: Any, column: Column) -> Any:
+    """
+    Returns the Arrow type of a column, or None when it should be inferred
+    from the exported values.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+
+    if python_type is datetime.datetime:
+        timezone = getattr(column.type, "timezone", False)
+        return pa.timestamp("us", tz="UTC" if timezone else None)
+    if python_type is Decimal:
+        return None
+    name = ARROW_TYPES.get(python_type)
+    return getattr(pa, name)() if name else None
+
+
+def arrow_schema(pa: Any, columns: Sequence[Column], chunk: Chunk) -> Any:
+    """
+    Returns the schema of the exported columns, from their SQL types or,
+    for types without an obvious Arrow equivalent, from the values of the
+    first chunk.
+    """
+    fields = []
+    for column in columns:
+        type_ = arrow_type(pa, column)
+        if type_ is None:
+            type_ = pa.array(chunk[column.key]).type
+        fields.append(pa.field(column.key, type_, nullable=bool(column.nullable)))
+    return pa.schema(fields)
+
+
+def arrow_values(pa: Any, values: list[Any], type_: Any) -> list[Any]:
+    # JSON columns are exported as their JSON text
+    if type_ == pa.string():
+        return [
+            json.dumps(value) if isinstance(value, (dict, list)) else value
+            for value in values
+        ]
+    return values
+
+
+def json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def ndjson_lines(names: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """
+    Renders rows as newline delimited JSON documents.
+    """
+    encode = json.JSONEncoder(default=json_default).encode
+    return "".join(encode(dict(zip(names, row))) + "\n" for row in rows)
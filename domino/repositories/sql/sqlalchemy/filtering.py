@@ -0,0 +1,82 @@
+from itertools import count
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, bindparam, or_
+from sqlalchemy.orm import DeclarativeBase
+
+from domino.domain.filters import And, Condition, Filter, Or
+from domino.exceptions import InvalidFilter
+
+LIKE_ESCAPE = "/"
+
+
+def compile_filter(filter: Filter, sql_mapping: type[DeclarativeBase]) -> ColumnElement:
+    """
+    Compiles a filter into a SQL expression on the columns of a mapping.
+
+    Values are bound parameters named after their position in the filter,
+    given by `filter_params`, so that the expression can be reused for every
+    filter of the same shape. Every condition is a plain comparison of a
+    column, which indexes on the column can serve: prefix matches are
+    `LIKE 'prefix%'` and ranges are `BETWEEN`.
+    """
+    names = (f"filter_{index}" for index in count())
+
+    def visit(filter: Filter) -> ColumnElement:
+        if isinstance(filter, And):
+            return and_(*(visit(item) for item in filter.filters))
+        if isinstance(filter, Or):
+            return or_(*(visit(item) for item in filter.filters))
+        if not isinstance(filter, Condition):
+            raise InvalidFilter(f"Unknown filter {filter!r}")
+
+        try:
+            column = getattr(sql_mapping, filter.field)
+        except AttributeError:
+            raise InvalidFilter(f"Unknown attribute {filter.field!r}")
+
+        operator = filter.operator
+        if operator == "is_null":
+            return column.is_(None) if filter.value else column.is_not(None)
+        if operator == "eq":
+            return column.is_(None) if filter.value is None else column == bind()
+        if operator == "ne":
+            return column.is_not(None) if filter.value is None else column != bind()
+        if operator == "in":
+            return column.in_(bindparam(next(names), expanding=True))
+        if operator == "between":
+            return column.between(bind(), bind())
+        if operator == "startswith":
+            return column.startswith(bind(), escape=LIKE_ESCAPE)
+        return getattr(column, f"__{operator}__")(bind())
+
+    def bind():
+        return bindparam(next(names))
+
+    return visit(filter)
+
+
+def filter_params(filter: Filter) -> dict[str, Any]:
+    """
+    Returns the values of the parameters bound by `compile_filter`.
+    """
+    values: list[Any] = []
+    for condition in filter.conditions():
+        operator, value = condition.operator, condition.value
+        if operator == "is_null" or (operator in ("eq", "ne") and value is None):
+            continue
+        if operator == "in":
+            values.append(list(value))
+        elif operator == "between":
+            values.extend(value)
+        elif operator == "startswith":
+            values.append(escape_like(value))
+        else:
+            values.append(value)
+    return {f"filter_{index}": value for index, value in enumerate(values)}
+
+
+def escape_like(value: str) -> str:
+    for character in (LIKE_ESCAPE, "%", "_"):
+        value = value.replace(character, LIKE_ESCAPE + character)
+    return value
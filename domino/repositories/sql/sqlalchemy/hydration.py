@@ -0,0 +1,147 @@
+import types
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Union, get_args, get_origin
+
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.orm import DeclarativeBase, aliased
+
+from domino.domain.models.pydantic import nested_model, trusted_constructor
+
+RowBuilder = Callable[[Any], Any]
+
+
+class TrustedPlan:
+    """
+    How the entities of a repository are built from the columns of its
+    rows, without going through ORM instances nor pydantic validation.
+
+    The columns of the SQL mapping backing the fields of the domain mapping
+    are selected, along with those of its many-to-one relationships, which
+    are outer joined. Each row is then turned into an entity by a builder
+    compiled once: the values of the fields are picked from the row with a
+    single `itemgetter` call and used as they are.
+
+    Attributes:
+    -----------
+    columns: list
+        The selected columns, in the order of the rows.
+    joins: list[tuple]
+        The outer joins of the statement, as `(target, onclause)` pairs.
+    build: RowBuilder
+        Builds an entity from a row.
+    """
+
+    def __init__(self, columns: list, joins: list[tuple], build: RowBuilder) -> None:
+        self.columns = columns
+        self.joins = joins
+        self.build = build
+
+    def select(self, sql_mapping: type[DeclarativeBase]) -> Select:
+        """
+        Returns the statement selecting the columns of the plan.
+        """
+        statement = select(*self.columns).select_from(sql_mapping)
+        for target, onclause in self.joins:
+            statement = statement.outerjoin(target, onclause)
+        return statement
+
+    def build_all(self, rows: Iterable[Any]) -> list:
+        build = self.build
+        return [build(row) for row in rows]
+
+
+def _matches(column: Any, annotation: Any) -> bool:
+    """
+    Returns whether the values of a column always validate as themselves
+    against a field annotation, so that validating them can be skipped.
+    """
+    optional = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        arguments = get_args(annotation)
+        optional = type(None) in arguments
+        arguments = [argument for argument in arguments if argument is not type(None)]
+        if len(arguments) != 1:
+            return False
+        annotation = arguments[0]
+
+    if not isinstance(annotation, type) or (column.nullable and not optional):
+        return False
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return False
+    return issubclass(python_type, annotation)
+
+
+def plan_trusted_rows(
+    sql_mapping: type[DeclarativeBase], domain_mapping: type
+) -> TrustedPlan | None:
+    """
+    Plans how entities of a pydantic domain mapping are built from the
+    columns of a SQL mapping, or returns None when they can't be.
+
+    Every field has to be backed by a column of the same name whose Python
+    type is the type of the field, or by a many-to-one relationship to a
+    model planned the same way. Collections, fields computed by the SQL
+    mapping and columns that would need to be coerced are not supported.
+    """
+    columns: list = []
+    joins: list[tuple] = []
+
+    def plan(entity: Any, model: type, seen: frozenset) -> RowBuilder | None:
+        mapper = inspect(entity).mapper
+        names, indexes, nested = [], [], []
+        for name, field in model.model_fields.items():
+            names.append(name)
+            indexes.append(len(columns))
+
+            if name in mapper.column_attrs:
+                column = mapper.column_attrs[name].columns[0]
+                if not _matches(column, field.annotation):
+                    return None
+                columns.append(getattr(entity, name))
+                continue
+
+            target = nested_model(field.annotation)
+            relationship = mapper.relationships.get(name)
+            if (
+                target is None
+                or target in seen
+                or relationship is None
+                or relationship.uselist
+            ):
+                return None
+
+            related = relationship.mapper
+            alias = aliased(related.class_)
+            joins.append((alias, getattr(entity, name).of_type(alias)))
+            # A missing related row is told apart by its primary key
+            key = related.get_property_by_column(related.primary_key[0]).key
+            columns.append(getattr(alias, key))
+            build = plan(alias, target, seen | {target})
+            if build is None:
+                return None
+            nested.append((name, build))
+
+        if not indexes:
+            return None
+        # itemgetter returns a tuple only when given several indexes, the
+        # repeated one is dropped by zip
+        read = itemgetter(*indexes, indexes[0])
+        construct = trusted_constructor(model)
+
+        def build(row: Any) -> Any:
+            values = dict(zip(names, read(row)))
+            for name, build_nested in nested:
+                if values[name] is not None:
+                    values[name] = build_nested(row)
+            return construct(values)
+
+        return build
+
+    if not hasattr(domain_mapping, "model_fields"):
+        return None
+    build = plan(sql_mapping, domain_mapping, frozenset({domain_mapping}))
+    if build is None:
+        return None
+    return TrustedPlan(columns, joins, build)
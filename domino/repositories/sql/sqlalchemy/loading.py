@@ -0,0 +1,72 @@
+from typing import Any, Callable
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import DeclarativeBase, defaultload, joinedload, selectinload
+
+from domino.domain.models.pydantic import nested_model
+
+LoaderStrategy = Callable[..., Any]
+
+
+def derive_eager_loads(
+    sql_mapping: type[DeclarativeBase], domain_mapping: type
+) -> dict[str, LoaderStrategy]:
+    """
+    Derives the relationships to eager load from the nested fields of a
+    pydantic domain mapping.
+
+    Every nested field backed by a relationship of the same name is loaded,
+    with `joinedload` for many-to-one relationships and `selectinload` for
+    collections. Nested fields of nested models are followed as well.
+    """
+    loads: dict[str, LoaderStrategy] = {}
+
+    def walk(mapping: type, model: type, path: str, seen: frozenset):
+        relationships = inspect(mapping).relationships
+        for name, field in getattr(model, "model_fields", {}).items():
+            nested = nested_model(field.annotation)
+            if nested is None or nested in seen or name not in relationships:
+                continue
+
+            relationship = relationships[name]
+            loads[path + name] = selectinload if relationship.uselist else joinedload
+            walk(relationship.mapper.class_, nested, f"{path}{name}.", seen | {nested})
+
+    walk(sql_mapping, domain_mapping, "", frozenset({domain_mapping}))
+    return loads
+
+
+def build_loader_options(
+    sql_mapping: type[DeclarativeBase],
+    eager_loads: dict[str, LoaderStrategy],
+    joins: bool = True,
+) -> tuple:
+    """
+    Builds the loader options for a mapping from dotted relationship paths,
+    such as `{"user": joinedload, "user.tasks": selectinload}`.
+
+    Intermediate relationships that are not declared are chained with
+    `defaultload`. When `joins` is unset, `joinedload` is replaced by
+    `selectinload`, for statements that can't be joined such as
+    INSERT/UPDATE ... RETURNING or results streamed with `yield_per`.
+    """
+    options = []
+    for path in sorted(eager_loads):
+        option = None
+        mapping = sql_mapping
+        parts = path.split(".")
+
+        for depth, name in enumerate(parts):
+            loader = eager_loads.get(".".join(parts[: depth + 1]), defaultload)
+            if not joins and loader is joinedload:
+                loader = selectinload
+
+            attribute = getattr(mapping, name)
+            if option is None:
+                option = loader(attribute)
+            else:
+                option = getattr(option, loader.__name__)(attribute)
+            mapping = attribute.property.mapper.class_
+
+        options.append(option)
+    return tuple(options)
@@ -0,0 +1,140 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import Pool
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    A cumulative histogram of durations, in seconds.
+
+    Attributes:
+    -----------
+    buckets: tuple[float, ...]
+        The upper bounds of the buckets. Observations above the last bound
+        are only counted in `count` and `total`.
+    counts: list[int]
+        The number of observations lower or equal to each bucket bound.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.maximum = max(self.maximum, value)
+            for index in range(bisect_left(self.buckets, value), len(self.buckets)):
+                self.counts[index] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.maximum,
+            "buckets": dict(zip(self.buckets, self.counts)),
+        }
+
+
+class PoolMetrics:
+    """
+    Telemetry of a connection pool, fed by SQLAlchemy pool and dialect events.
+
+    Attributes:
+    -----------
+    checked_out: int
+        The number of connections currently in use.
+    connections: int
+        The number of DBAPI connections opened since the engine was created.
+    wait_time: Histogram
+        The time spent waiting for a connection from the pool, including
+        the time to open it when the pool had none available.
+    connect_latency: Histogram
+        The time spent opening new DBAPI connections.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.checked_out = 0
+        self.connections = 0
+        self.wait_time = Histogram(buckets)
+        self.connect_latency = Histogram(buckets)
+        self._engine: Engine | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def overflow(self) -> int | None:
+        """
+        The number of overflow connections in use, for pools that have them.
+        """
+        overflow = getattr(self._engine and self._engine.pool, "overflow", None)
+        return overflow() if overflow is not None else None
+
+    @property
+    def pool_status(self) -> str | None:
+        return self._engine.pool.status() if self._engine is not None else None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "checked_out": self.checked_out,
+            "overflow": self.overflow,
+            "connections": self.connections,
+            "wait_time": self.wait_time.snapshot(),
+            "connect_latency": self.connect_latency.snapshot(),
+        }
+
+    def pool_class(self, base: type[Pool]) -> type[Pool]:
+        """
+        Returns a subclass of the pool class timing every checkout.
+        """
+        metrics = self
+
+        class TimedPool(base):  # type: ignore[valid-type, misc]
+            def connect(self):
+                start = perf_counter()
+                try:
+                    return super().connect()
+                finally:
+                    metrics.wait_time.observe(perf_counter() - start)
+
+        TimedPool.__name__ = f"Timed{base.__name__}"
+        return TimedPool
+
+    def instrument(self, engine: Engine) -> None:
+        """
+        Listens to the pool and dialect events of a synchronous engine.
+        """
+        self._engine = engine
+
+        @event.listens_for(engine, "do_connect")
+        def do_connect(dialect, connection_record, cargs, cparams):
+            start = perf_counter()
+            connection = dialect.connect(*cargs, **cparams)
+            self.connect_latency.observe(perf_counter() - start)
+            with self._lock:
+                self.connections += 1
+            return connection
+
+        @event.listens_for(engine.pool, "checkout")
+        def checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                self.checked_out += 1
+
+        @event.listens_for(engine.pool, "checkin")
+        def checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self.checked_out -= 1
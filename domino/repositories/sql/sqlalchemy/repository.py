@@ -1,21 +1,96 @@
-from typing import Generic, Type
+import io
+from os import PathLike
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Sequence,
+    TextIO,
+    Type,
+    TypeVar,
+)
+
+from uuid import uuid4
 
-from sqlalchemy import desc
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    Select,
+    Update,
+    and_,
+    asc,
+    bindparam,
+    cast,
+    column,
+    delete,
+    desc,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import REGCLASS
 from sqlalchemy.orm import DeclarativeBase, Session
 
 from domino.base.baseclass import DominoBaseClass
+from domino.domain.filters import FilterData, as_filter
+from domino.domain.pagination import Page, check_limit, decode_cursor, encode_cursor
 from domino.domain.repositories import (
     BaseT,
+    BulkCreateRepositoryMixin,
+    BulkDeleteRepositoryMixin,
+    BulkSaveRepositoryMixin,
+    BulkUpdateRepositoryMixin,
     CreateRepositoryMixin,
     CreateT,
     DeleteRepositoryMixin,
     GetRepositoryMixin,
     ListRepositoryMixin,
+    PaginateRepositoryMixin,
+    SaveRepositoryMixin,
     UpdateRepositoryMixin,
     UpdateT,
 )
 from domino.exceptions import ItemNotFound
 
+from .buffer import WriteBuffer
+from .bulk import BulkLoadReport, batched, copy_line
+from .counting import CountStrategy, plan_rows
+from .export import (
+    Chunk,
+    arrow_schema,
+    arrow_values,
+    chunk_of,
+    ndjson_lines,
+    require_pyarrow,
+)
+from .filtering import compile_filter, filter_params
+from .hydration import TrustedPlan, plan_trusted_rows
+from .loading import LoaderStrategy, build_loader_options, derive_eager_loads
+from .statements import StatementCache
+
+T = TypeVar("T")
+
+# Dialects with an INSERT ... ON CONFLICT DO UPDATE construct
+UPSERT_DIALECTS = {"postgresql": postgresql, "sqlite": sqlite}
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Yields successive slices of `size` items from a sequence.
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class SQLRepository(Generic[BaseT], DominoBaseClass):
     """
@@ -25,15 +100,590 @@ class SQLRepository(Generic[BaseT], DominoBaseClass):
     -----------
     _db: SQLDatabase
         The SQL database object.
+    bulk_chunk_size: int
+        The maximum number of rows sent in a single bulk statement.
+    sort_key: str
+        The attribute of the SQL mapping pages are sorted on.
+    sort_descending: bool
+        Whether pages are sorted in descending order.
+    stream_batch_size: int
+        The number of rows fetched per round trip by `iter_list`.
+    eager_loads: dict[str, LoaderStrategy] | None
+        The relationships to load along with the rows, as dotted paths mapped
+        to a loader such as `selectinload` or `joinedload`. When None, they
+        are derived from the nested fields of the domain mapping.
+    trusted_hydration: bool | None
+        Whether `get`, `list` and `iter_list` build entities straight from
+        the selected columns, without ORM instances nor validation. When
+        None, the `trusted_hydration` flag of the domain mapping is used.
+        Domain mappings whose fields can't all be read as they are from
+        columns are validated anyway, see `plan_trusted_rows`.
+    count_strategy: CountStrategy
+        How `list` counts the matching rows, unless told otherwise.
+    count_cap: int
+        The number of rows the `capped` count strategy stops at.
+    statement_cache: StatementCache
+        The get and list statements of the repository class, built once per
+        set of filtered attributes. Its hit rate tells whether the filters
+        in use are reusing them.
+    statement_cache_size: int
+        The number of statements the statement cache keeps.
     """
 
     sql_mapping: Type[DeclarativeBase]
     domain_mapping: Type[BaseT]
+    bulk_chunk_size: int = 1000
+    sort_key: str = "id"
+    sort_descending: bool = True
+    stream_batch_size: int = 1000
+    eager_loads: dict[str, LoaderStrategy] | None = None
+    trusted_hydration: bool | None = None
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cap: int = 1000
+    statement_cache_size: int = 256
 
     def __init__(self, session: Session) -> None:
         super().__init__()
         self.session = session
 
+    def bind(self, session: Session) -> None:
+        """
+        Rebinds the repository to another session, so that it can be reused
+        by the next transaction instead of being built again.
+        """
+        self.session = session
+
+    @classmethod
+    def _trusted_plan(cls) -> TrustedPlan | None:
+        """
+        Returns how entities are built from the columns of their rows, or
+        None when they are validated, planned once per repository class.
+        """
+        if "_trusted_plan_cache" not in cls.__dict__:
+            trusted = cls.trusted_hydration
+            if trusted is None:
+                trusted = getattr(cls.domain_mapping, "trusted_hydration", False)
+            cls._trusted_plan_cache = (
+                plan_trusted_rows(cls.sql_mapping, cls.domain_mapping)
+                if trusted
+                else None
+            )
+        return cls._trusted_plan_cache
+
+    @property
+    def _hydrate(self) -> Callable[[Any], BaseT]:
+        """
+        Returns the function turning a row into a domain entity.
+        """
+        return self.domain_mapping.load
+
+    def _hydrate_all(self, rows: Iterable[Any]) -> list[BaseT]:
+        """
+        Turns rows into domain entities, validating them all in one call
+        when the domain mapping has a `load_many` loader.
+        """
+        if hasattr(self.domain_mapping, "load_many"):
+            return self.domain_mapping.load_many(rows)
+        hydrate = self._hydrate
+        return [hydrate(row) for row in rows]
+
+    @classmethod
+    def _loader_options(cls, joins: bool = True) -> tuple:
+        """
+        Returns the loader options applied to the statements of the
+        repository, built once per repository class.
+        """
+        cache = cls.__dict__.get("_loader_options_cache")
+        if cache is None:
+            eager_loads = cls.eager_loads
+            if eager_loads is None:
+                eager_loads = derive_eager_loads(cls.sql_mapping, cls.domain_mapping)
+            cache = {
+                joins: build_loader_options(cls.sql_mapping, eager_loads, joins)
+                for joins in (False, True)
+            }
+            cls._loader_options_cache = cache
+        return cache[joins]
+
+    @classmethod
+    def _statement_cache(cls) -> StatementCache:
+        cache = cls.__dict__.get("_statement_cache_instance")
+        if cache is None:
+            cache = cls._statement_cache_instance = StatementCache(
+                cls.statement_cache_size
+            )
+        return cache
+
+    @property
+    def statement_cache(self) -> StatementCache:
+        return self._statement_cache()
+
+    @property
+    def _write_buffer(self) -> WriteBuffer | None:
+        """
+        Returns the buffer writes are queued in when the session defers
+        them, None otherwise.
+        """
+        return self.session.info.get("write_buffer")
+
+    @property
+    def _primary_key(self):
+        """
+        Returns the primary key column of the SQL mapping.
+        """
+        return inspect(self.sql_mapping).primary_key[0]
+
+    def _supports(self, feature: str) -> bool:
+        """
+        Returns whether the dialect bound to the session supports a feature,
+        such as `insert_executemany_returning` or `update_returning`.
+        """
+        return bool(getattr(self.session.get_bind().dialect, feature, False))
+
+    @staticmethod
+    def _filter_shape(filter_data: FilterData) -> Hashable:
+        """
+        Returns what the statements filtering on `filter_data` depend on,
+        the shape of the filter without its values.
+        """
+        filter = as_filter(filter_data)
+        return None if filter is None else filter.shape
+
+    @staticmethod
+    def _filter_params(filter_data: FilterData) -> dict[str, Any]:
+        filter = as_filter(filter_data)
+        return {} if filter is None else filter_params(filter)
+
+    def _filter_clauses(self, filter_data: FilterData) -> list:
+        filter = as_filter(filter_data)
+        return [] if filter is None else [compile_filter(filter, self.sql_mapping)]
+
+    def _get_statement(self) -> Select:
+        """
+        Returns the statement selecting a row by primary key, bound to the
+        `pk` parameter.
+        """
+        return self._statement_cache().get(
+            "get",
+            lambda: select(self.sql_mapping)
+            .options(*self._loader_options())
+            .where(self._primary_key == bindparam("pk")),
+        )
+
+    def _list_statement(
+        self, filter_data: FilterData, joins: bool = True
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement selecting the rows matching the filter, along
+        with its parameters.
+        """
+        shape = self._filter_shape(filter_data)
+        statement = self._statement_cache().get(
+            ("list", joins, shape),
+            lambda: select(self.sql_mapping)
+            .options(*self._loader_options(joins))
+            .where(*self._filter_clauses(filter_data))
+            .order_by(desc("id")),
+        )
+        return statement, self._filter_params(filter_data)
+
+    def _trusted_get_statement(self, plan: TrustedPlan) -> Select:
+        """
+        Returns the statement selecting the columns of a row by primary key,
+        bound to the `pk` parameter, for entities built by `plan`.
+        """
+        return self._statement_cache().get(
+            "trusted get",
+            lambda: plan.select(self.sql_mapping).where(
+                self._primary_key == bindparam("pk")
+            ),
+        )
+
+    def _trusted_list_statement(
+        self, plan: TrustedPlan, filter_data: FilterData
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement selecting the columns of the rows matching the
+        filter, for entities built by `plan`, along with its parameters.
+        """
+        shape = self._filter_shape(filter_data)
+        statement = self._statement_cache().get(
+            ("trusted list", shape),
+            lambda: plan.select(self.sql_mapping)
+            .where(*self._filter_clauses(filter_data))
+            .order_by(desc(self._primary_key)),
+        )
+        return statement, self._filter_params(filter_data)
+
+    def _export_columns(self, columns: Sequence[str] | None) -> list[Column]:
+        """
+        Returns the exported columns of the SQL mapping, all of them when
+        `columns` is None.
+        """
+        mapped = inspect(self.sql_mapping).columns
+        if columns is None:
+            return list(mapped)
+        return [mapped[name] for name in columns]
+
+    def _export_statement(
+        self, filter_data: FilterData, columns: Sequence[Column]
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement selecting the values of `columns` for the rows
+        matching the filter, along with its parameters. Rows are sorted on
+        the repository `sort_key` then on the primary key, like `paginate`.
+        """
+        pk = getattr(self.sql_mapping, self._primary_key.key)
+        column = getattr(self.sql_mapping, self.sort_key)
+        order = desc if self.sort_descending else asc
+        ordering = [order(pk)] if column.key == pk.key else [order(column), order(pk)]
+
+        shape = self._filter_shape(filter_data)
+        statement = self._statement_cache().get(
+            (
+                "export",
+                tuple(column.key for column in columns),
+                shape,
+                self.sort_key,
+                self.sort_descending,
+            ),
+            lambda: select(*columns)
+            .where(*self._filter_clauses(filter_data))
+            .order_by(*ordering),
+        )
+        return statement, self._filter_params(filter_data)
+
+    def _count_statement(
+        self, filter_data: FilterData
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement counting the rows matching the filter, along
+        with its parameters.
+        """
+        shape = self._filter_shape(filter_data)
+        statement = self._statement_cache().get(
+            ("count", shape),
+            lambda: select(func.count())
+            .select_from(self.sql_mapping)
+            .where(*self._filter_clauses(filter_data)),
+        )
+        return statement, self._filter_params(filter_data)
+
+    def _capped_count_statement(
+        self, filter_data: FilterData
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement counting at most `count_cap + 1` rows matching
+        the filter, along with its parameters.
+        """
+        shape = self._filter_shape(filter_data)
+        statement = self._statement_cache().get(
+            ("capped", shape),
+            lambda: select(func.count()).select_from(
+                select(self._primary_key)
+                .where(*self._filter_clauses(filter_data))
+                .limit(bindparam("cap"))
+                .subquery()
+            ),
+        )
+        return statement, {
+            **self._filter_params(filter_data),
+            "cap": self.count_cap + 1,
+        }
+
+    def _windowed_list_statement(
+        self, filter_data: FilterData
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement selecting the rows matching the filter along
+        with their total count, as `(row, count)` tuples.
+
+        Joined eager loads of collections would multiply the counted rows,
+        which is why derived eager loads only join many-to-one relationships.
+        """
+        shape = self._filter_shape(filter_data)
+        statement = self._statement_cache().get(
+            ("windowed", shape),
+            lambda: select(self.sql_mapping, func.count().over())
+            .options(*self._loader_options())
+            .where(*self._filter_clauses(filter_data))
+            .order_by(desc("id")),
+        )
+        return statement, self._filter_params(filter_data)
+
+    def _reltuples_statement(self) -> Select:
+        """
+        Returns the statement reading the number of rows of the table from
+        the Postgres statistics.
+        """
+        return (
+            select(column("reltuples"))
+            .select_from(table("pg_class"))
+            .where(column("oid") == cast(self.sql_mapping.__table__.fullname, REGCLASS))
+        )
+
+    def _explain_statement(self, filter_data: FilterData) -> str:
+        """
+        Returns the EXPLAIN statement estimating the number of rows matching
+        the filter, with the filter values rendered inline.
+        """
+        statement = (
+            select(self._primary_key)
+            .where(*self._filter_clauses(filter_data))
+            .params(self._filter_params(filter_data))
+        )
+        compiled = statement.compile(
+            dialect=self.session.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        return f"EXPLAIN (FORMAT JSON) {compiled}"
+
+    def _can_estimate(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    @staticmethod
+    def _valid_estimate(reltuples: float | None) -> bool:
+        # Tables that were never analyzed or vacuumed have -1 (or 0 before
+        # Postgres 14) reltuples
+        return reltuples is not None and reltuples > 0
+
+    def _in_identity_map(self, id: Any) -> bool:
+        """
+        Returns whether the row is already loaded in the session, in which
+        case `session.get` returns it without a round trip.
+        """
+        key = self.session.identity_key(self.sql_mapping, id)
+        return key in self.session.identity_map
+
+    def _page_statement(
+        self,
+        filter_data: FilterData,
+        limit: int,
+        cursor: str | None = None,
+        sort_key: str | None = None,
+    ) -> tuple[Select, list[str]]:
+        """
+        Returns the statement selecting the page after `cursor`, along with
+        the attributes the next cursor is built from.
+
+        One extra row is selected to know whether a next page exists.
+        """
+        check_limit(limit)
+        pk = getattr(self.sql_mapping, self._primary_key.key)
+        column = getattr(self.sql_mapping, sort_key or self.sort_key)
+        order, after = (desc, "__lt__") if self.sort_descending else (asc, "__gt__")
+        unique_sort = column.key == pk.key
+
+        statement = (
+            select(self.sql_mapping)
+            .options(*self._loader_options())
+            .where(*self._filter_clauses(filter_data))
+            .params(self._filter_params(filter_data))
+        )
+        if cursor is not None:
+            values = decode_cursor(cursor)
+            if unique_sort:
+                statement = statement.where(getattr(pk, after)(values[-1]))
+            else:
+                value, last_id = values[0], values[-1]
+                statement = statement.where(
+                    or_(
+                        getattr(column, after)(value),
+                        and_(column == value, getattr(pk, after)(last_id)),
+                    )
+                )
+
+        if unique_sort:
+            return statement.order_by(order(pk)).limit(limit + 1), [pk.key]
+        return (
+            statement.order_by(order(column), order(pk)).limit(limit + 1),
+            [column.key, pk.key],
+        )
+
+    def _page_rows(
+        self, rows: Sequence[Any], limit: int, keys: list[str]
+    ) -> tuple[Sequence[Any], str | None]:
+        """
+        Trims the extra row selected by `_page_statement` and builds the
+        cursor of the next page from the last row.
+        """
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        return rows, encode_cursor(*(getattr(rows[-1], key) for key in keys))
+
+    def _insert_many_statement(self):
+        return (
+            insert(self.sql_mapping)
+            .returning(self.sql_mapping, sort_by_parameter_order=True)
+            .options(*self._loader_options(joins=False))
+        )
+
+    def _update_statement(self, id: Any, values: dict, returning: bool) -> Update:
+        statement = (
+            update(self.sql_mapping).where(self._primary_key == id).values(**values)
+        )
+        # No eager loading here: many-to-one relationships of a single row are
+        # lazy loaded from the identity map, without a round trip
+        return statement.returning(self.sql_mapping) if returning else statement
+
+    def _update_many_statement(self, ids: Sequence[Any], values: dict) -> Update:
+        return (
+            update(self.sql_mapping)
+            .where(self._primary_key.in_(ids))
+            .values(**values)
+            .options(*self._loader_options(joins=False))
+        )
+
+    def _existing_statement(self, ids: Sequence[Any]) -> Select:
+        # Found rows are locked, so they can't be deleted before the update
+        return (
+            select(self._primary_key)
+            .where(self._primary_key.in_(ids))
+            .with_for_update()
+        )
+
+    def _select_many(self, ids: Sequence[Any]) -> Select:
+        return (
+            select(self.sql_mapping)
+            .options(*self._loader_options())
+            .where(self._primary_key.in_(ids))
+        )
+
+    @classmethod
+    def _save_plan(cls) -> tuple[dict[str, Any], dict[str, list[tuple[str, str]]]]:
+        """
+        Returns how dumped entities map onto the columns of the SQL mapping,
+        computed once per repository class: the column attributes, and for
+        each many-to-one relationship the pairs of foreign key attribute and
+        attribute of the nested entity it is read from.
+        """
+        plan = cls.__dict__.get("_save_plan_cache")
+        if plan is None:
+            mapper = inspect(cls.sql_mapping)
+            columns = {attribute.key: attribute for attribute in mapper.column_attrs}
+            relationships = {
+                relationship.key: [
+                    (
+                        mapper.get_property_by_column(local).key,
+                        relationship.mapper.get_property_by_column(remote).key,
+                    )
+                    for local, remote in relationship.local_remote_pairs
+                ]
+                for relationship in mapper.relationships
+                if not relationship.uselist
+            }
+            plan = cls._save_plan_cache = (columns, relationships)
+        return plan
+
+    def _column_values(self, data: dict) -> dict[str, Any]:
+        """
+        Returns the column values of a dumped entity. Nested entities are
+        replaced by the foreign keys pointing to them, and collections are
+        left out.
+        """
+        columns, relationships = self._save_plan()
+        values = {key: data[key] for key in columns if key in data}
+        for key, pairs in relationships.items():
+            if key not in data:
+                continue
+            nested = data[key]
+            for local, remote in pairs:
+                values.setdefault(local, None if nested is None else nested[remote])
+        return values
+
+    def _can_upsert(self) -> bool:
+        return self.session.get_bind().dialect.name in UPSERT_DIALECTS and (
+            self._supports("insert_executemany_returning_sort_by_parameter_order")
+        )
+
+    def _upsert_statement(self, keys: tuple[str, ...]):
+        """
+        Returns the INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement
+        saving rows with the given attributes.
+        """
+        dialect = self.session.get_bind().dialect.name
+
+        def build():
+            columns = inspect(self.sql_mapping).columns
+            statement = UPSERT_DIALECTS[dialect].insert(self.sql_mapping)
+            updated = [key for key in keys if key != self._primary_key.key] or keys
+            return (
+                statement.on_conflict_do_update(
+                    index_elements=[self._primary_key],
+                    set_={
+                        columns[key]: statement.excluded[columns[key].name]
+                        for key in updated
+                    },
+                )
+                .returning(self.sql_mapping, sort_by_parameter_order=True)
+                .options(*self._loader_options(joins=False))
+                .execution_options(populate_existing=True)
+            )
+
+        return self._statement_cache().get(("save", dialect, keys), build)
+
+    def _upsert_batches(
+        self, values: Sequence[dict], chunk_size: int | None = None
+    ) -> Iterator[tuple[Any, list[dict]]]:
+        """
+        Yields the upsert statements saving the given column values, along
+        with their parameters, one per chunk and set of attributes.
+        """
+        pk = self._primary_key.key
+        for chunk in chunked(values, chunk_size or self.bulk_chunk_size):
+            # A statement can't upsert the same row twice, the last one wins
+            by_keys: dict[tuple[str, ...], dict] = {}
+            for row in chunk:
+                by_keys.setdefault(tuple(row), {})[row[pk]] = row
+            for keys, rows in by_keys.items():
+                yield self._upsert_statement(keys), list(rows.values())
+
+    def _split_new(self, values: Sequence[dict]) -> tuple[list[dict], list[dict]]:
+        """
+        Splits the column values of saved entities into those of new rows,
+        without primary key value, and those of the rows to upsert.
+        """
+        pk = self._primary_key.key
+        new = [
+            {key: value for key, value in row.items() if key != pk}
+            for row in values
+            if row.get(pk) is None
+        ]
+        return new, [row for row in values if row.get(pk) is not None]
+
+    def _saved_in_order(
+        self, values: Sequence[dict], inserted: Sequence[Any], upserted: Sequence[Any]
+    ) -> list[Any]:
+        """
+        Returns the rows saved for the given column values, in their order:
+        inserted rows for values without primary key value, upserted rows
+        matched on their primary key for the others.
+        """
+        pk = self._primary_key.key
+        keyed = self._in_order(
+            [row[pk] for row in values if row.get(pk) is not None], upserted
+        )
+        inserted_rows, keyed_rows = iter(inserted), iter(keyed)
+        return [
+            next(inserted_rows) if row.get(pk) is None else next(keyed_rows)
+            for row in values
+        ]
+
+    @staticmethod
+    def _in_order(ids: Sequence[Any], rows: Sequence[Any]) -> list[Any]:
+        """
+        Returns the rows in the order of the given ids.
+
+        Raises ItemNotFound if one of the ids has no matching row.
+        """
+        by_identity = {inspect(row).identity[0]: row for row in rows}
+        try:
+            return [by_identity[id] for id in ids]
+        except KeyError:
+            raise ItemNotFound
+
 
 class SQLGetMixin(GetRepositoryMixin[BaseT], SQLRepository):
     """
@@ -41,65 +691,630 @@ class SQLGetMixin(GetRepositoryMixin[BaseT], SQLRepository):
     """
 
     def get(self, id: int) -> BaseT:
-        data = self.session.get(self.sql_mapping, id)
+        if self._write_buffer is not None:
+            # Rows loaded in the session are read without a statement
+            self._write_buffer.flush()
+        plan = self._trusted_plan()
+        if self._in_identity_map(id):
+            data = self.session.get(
+                self.sql_mapping, id, options=self._loader_options()
+            )
+        elif plan is not None:
+            data = self.session.execute(
+                self._trusted_get_statement(plan), {"pk": id}
+            ).one_or_none()
+            if data is None:
+                raise ItemNotFound
+            return plan.build(data)
+        else:
+            data = (
+                self.session.scalars(self._get_statement(), {"pk": id})
+                .unique()
+                .one_or_none()
+            )
         if data is None:
             raise ItemNotFound
-        return self.domain_mapping.load(data)
+        return self._hydrate(data)
 
 
-class SQLCreateMixin(CreateRepositoryMixin[BaseT, CreateT], SQLRepository):
+class SQLCreateMixin(
+    CreateRepositoryMixin[BaseT, CreateT],
+    BulkCreateRepositoryMixin[BaseT, CreateT],
+    SQLRepository,
+):
     """
     A class representing a SQL create mixin.
     """
 
     def create(self, data: CreateT) -> BaseT:
+        """
+        Creates a row and returns the created entity.
+
+        When the session defers writes, the row is queued and a Pending
+        placeholder resolving to the entity is returned instead.
+        """
+        if self._write_buffer is not None:
+            return self._write_buffer.create(self, data.dump())
+
         sql_obj = self.sql_mapping(**data.dump())
         self.session.add(sql_obj)
         self.session.flush()
         self.session.refresh(sql_obj)
-        return self.domain_mapping.load(sql_obj)
+        return self._hydrate(sql_obj)
+
+    def create_many(
+        self, data: Sequence[CreateT], chunk_size: int | None = None
+    ) -> list[BaseT]:
+        """
+        Creates several rows with one INSERT ... RETURNING per chunk.
 
+        Falls back to `create` for each item on dialects that can't return
+        rows from an executemany INSERT.
+        """
+        if not self._supports("insert_executemany_returning_sort_by_parameter_order"):
+            return [self.create(item) for item in data]
 
-class SQLListMixin(ListRepositoryMixin[BaseT], SQLRepository):
+        results = []
+        for chunk in chunked(data, chunk_size or self.bulk_chunk_size):
+            rows = self.session.scalars(
+                self._insert_many_statement(), [item.dump() for item in chunk]
+            )
+            results += self._hydrate_all(rows)
+        return results
+
+
+class SQLListMixin(
+    ListRepositoryMixin[BaseT], PaginateRepositoryMixin[BaseT], SQLRepository
+):
     """
     A class representing a SQL list mixin.
     """
 
-    def list(self, filter_data: dict) -> tuple[int, list[BaseT]]:
-        query = (
-            self.session.query(self.sql_mapping)
-            .filter_by(**filter_data)
-            .order_by(desc("id"))
-        )
+    def list(
+        self, filter_data: FilterData, count: CountStrategy | str | None = None
+    ) -> tuple[int | None, list[BaseT]]:
+        """
+        Returns the number of rows matching the filter, counted with the
+        `count` strategy (the repository `count_strategy` by default), and
+        the matching entities.
+        """
+        strategy = CountStrategy(count or self.count_strategy)
+        if strategy is CountStrategy.WINDOWED:
+            statement, params = self._windowed_list_statement(filter_data)
+            rows = self.session.execute(statement, params).unique().all()
+            return (
+                rows[0][1] if rows else 0,
+                self._hydrate_all(row[0] for row in rows),
+            )
+
+        plan = self._trusted_plan()
+        if plan is not None:
+            statement, params = self._trusted_list_statement(plan, filter_data)
+            return (
+                self._count(filter_data, strategy),
+                plan.build_all(self.session.execute(statement, params)),
+            )
 
+        statement, params = self._list_statement(filter_data)
         return (
-            query.count(),
-            [self.domain_mapping.load(user) for user in query.all()],
+            self._count(filter_data, strategy),
+            self._hydrate_all(self.session.scalars(statement, params).unique().all()),
         )
 
+    def _count(self, filter_data: FilterData, strategy: CountStrategy) -> int | None:
+        if strategy is CountStrategy.NONE:
+            return None
+
+        if strategy is CountStrategy.ESTIMATED and self._can_estimate():
+            if not filter_data:
+                reltuples = self.session.scalar(self._reltuples_statement())
+                if self._valid_estimate(reltuples):
+                    return int(reltuples)
+            return plan_rows(
+                self.session.connection()
+                .exec_driver_sql(self._explain_statement(filter_data))
+                .scalar()
+            )
+
+        if strategy is CountStrategy.CAPPED:
+            statement, params = self._capped_count_statement(filter_data)
+        else:
+            statement, params = self._count_statement(filter_data)
+        return self.session.scalar(statement, params)
+
+    def iter_list(
+        self, filter_data: FilterData, batch_size: int | None = None
+    ) -> Iterator[BaseT]:
+        """
+        Yields the entities matching the filter, fetching and hydrating
+        `batch_size` rows at a time.
+
+        Rows are read through a server-side cursor where the driver supports
+        it (named cursors on psycopg2), so memory stays bounded by the batch
+        size instead of the size of the result.
+        """
+        plan = self._trusted_plan()
+        if plan is not None:
+            statement, params = self._trusted_list_statement(plan, filter_data)
+            statement = statement.execution_options(
+                yield_per=batch_size or self.stream_batch_size
+            )
+            for rows in self.session.execute(statement, params).partitions():
+                yield from plan.build_all(rows)
+            return
 
-class SQLUpdateMixin(UpdateRepositoryMixin[BaseT, UpdateT], SQLRepository):
+        statement, params = self._list_statement(filter_data, joins=False)
+        statement = statement.execution_options(
+            yield_per=batch_size or self.stream_batch_size
+        )
+
+        for rows in self.session.scalars(statement, params).partitions():
+            yield from self._hydrate_all(rows)
+
+    def paginate(
+        self,
+        filter_data: FilterData,
+        limit: int,
+        cursor: str | None = None,
+        sort_key: str | None = None,
+    ) -> Page[BaseT]:
+        """
+        Returns at most `limit` entities after `cursor`, sorted on `sort_key`
+        (defaults to the repository `sort_key`) then on the primary key.
+
+        The cursor is turned into a WHERE clause on the sort key, so no row
+        before the cursor is ever read.
+        """
+        statement, keys = self._page_statement(filter_data, limit, cursor, sort_key)
+        rows, next_cursor = self._page_rows(
+            self.session.scalars(statement).all(), limit, keys
+        )
+
+        return Page(
+            items=self._hydrate_all(rows),
+            next_cursor=next_cursor,
+        )
+
+
+class SQLExportMixin(SQLRepository[BaseT]):
+    """
+    A class representing a SQL export mixin.
+
+    Exports read the column values of the matching rows through a
+    server-side cursor, `chunk_size` rows at a time, and turn each chunk
+    into columns without building any entity, so memory is bounded by the
+    chunk size rather than by the size of the result.
+
+    Arrow and Parquet exports require the optional pyarrow package.
+
+    Attributes:
+    -----------
+    export_chunk_size: int
+        The number of rows fetched and converted at a time.
+    """
+
+    export_chunk_size: int = 10000
+
+    def _export_chunks(
+        self,
+        filter_data: FilterData,
+        columns: Sequence[Column],
+        chunk_size: int | None,
+    ) -> Iterator[Sequence[Any]]:
+        statement, params = self._export_statement(filter_data, columns)
+        statement = statement.execution_options(
+            yield_per=chunk_size or self.export_chunk_size
+        )
+        yield from self.session.execute(statement, params).partitions()
+
+    def iter_columns(
+        self,
+        filter_data: FilterData,
+        columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[Chunk]:
+        """
+        Yields the values of the rows matching the filter, as mappings of
+        column names to lists of at most `chunk_size` values.
+        """
+        selected = self._export_columns(columns)
+        names = [column.key for column in selected]
+        for rows in self._export_chunks(filter_data, selected, chunk_size):
+            yield chunk_of(names, rows)
+
+    def export_batches(
+        self,
+        filter_data: FilterData,
+        columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Yields the rows matching the filter as Arrow record batches of at
+        most `chunk_size` rows, all sharing one schema derived from the
+        SQL types of the columns.
+        """
+        pa = require_pyarrow()
+        selected = self._export_columns(columns)
+        names = [column.key for column in selected]
+        schema = None
+
+        for rows in self._export_chunks(filter_data, selected, chunk_size):
+            chunk = chunk_of(names, rows)
+            if schema is None:
+                schema = arrow_schema(pa, selected, chunk)
+            yield pa.RecordBatch.from_arrays(
+                [
+                    pa.array(
+                        arrow_values(pa, chunk[field.name], field.type), field.type
+                    )
+                    for field in schema
+                ],
+                schema=schema,
+            )
+
+    def export_parquet(
+        self,
+        filter_data: FilterData,
+        path: str | PathLike,
+        columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+        compression: str = "snappy",
+    ) -> int:
+        """
+        Writes the rows matching the filter to a Parquet file, one row group
+        per chunk, and returns the number of rows written.
+        """
+        pa = require_pyarrow()
+        parquet = require_pyarrow("pyarrow.parquet")
+        writer = None
+        count = 0
+        try:
+            for batch in self.export_batches(filter_data, columns, chunk_size):
+                if writer is None:
+                    writer = parquet.ParquetWriter(
+                        path, batch.schema, compression=compression
+                    )
+                writer.write_batch(batch)
+                count += batch.num_rows
+            if writer is None:
+                selected = self._export_columns(columns)
+                empty = chunk_of([column.key for column in selected], [])
+                schema = arrow_schema(pa, selected, empty)
+                writer = parquet.ParquetWriter(path, schema, compression=compression)
+        finally:
+            if writer is not None:
+                writer.close()
+        return count
+
+    def export_ndjson(
+        self,
+        filter_data: FilterData,
+        file: str | PathLike | TextIO,
+        columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Writes the rows matching the filter as newline delimited JSON, to a
+        path or a text stream, and returns the number of rows written.
+
+        Dates are written in ISO format, decimals and UUIDs as strings.
+        """
+        if isinstance(file, (str, PathLike)):
+            with open(file, "w", encoding="utf-8") as stream:
+                return self.export_ndjson(filter_data, stream, columns, chunk_size)
+
+        selected = self._export_columns(columns)
+        names = [column.key for column in selected]
+        count = 0
+        for rows in self._export_chunks(filter_data, selected, chunk_size):
+            file.write(ndjson_lines(names, rows))
+            count += len(rows)
+        return count
+
+
+class SQLUpdateMixin(
+    UpdateRepositoryMixin[BaseT, UpdateT],
+    BulkUpdateRepositoryMixin[BaseT, UpdateT],
+    SQLRepository,
+):
     """
     A class representing a SQL update mixin.
     """
 
-    def update(self, id: int, data: UpdateT) -> BaseT:
-        obj = self.session.get(self.sql_mapping, id)
-        self.session.query(self.sql_mapping).filter_by(id=id).update(**data.dump())
-        self.session.refresh(obj)
-        return self.domain_mapping.load(obj)
+    def update(self, id: int, data: UpdateT, returning: bool = True) -> BaseT | None:
+        """
+        Updates a row and returns the updated entity, in a single
+        UPDATE ... RETURNING round trip where the dialect supports it.
+
+        With `returning` unset, the update is sent without reading anything
+        back and None is returned. When the session defers writes, the update
+        is queued and a Pending placeholder is returned instead.
+        """
+        if self._write_buffer is not None:
+            pending = self._write_buffer.update(self, id, data.dump())
+            return pending if returning else None
+
+        if not returning or not self._supports("update_returning"):
+            result = self.session.execute(
+                self._update_statement(id, data.dump(), returning=False)
+            )
+            if result.rowcount == 0:
+                raise ItemNotFound
+            if not returning:
+                return None
+            obj = self.session.get(
+                self.sql_mapping,
+                id,
+                options=self._loader_options(),
+                populate_existing=True,
+            )
+        else:
+            obj = self.session.scalars(
+                self._update_statement(id, data.dump(), returning=True)
+            ).one_or_none()
+
+        if obj is None:
+            raise ItemNotFound
+        return self._hydrate(obj)
+
+    def update_many(
+        self, ids: Sequence[Any], data: UpdateT, chunk_size: int | None = None
+    ) -> list[BaseT]:
+        """
+        Applies the same update to several rows with one
+        UPDATE ... WHERE id IN (...) per chunk.
+
+        Raises ItemNotFound if one of the ids does not exist, before any row
+        is updated.
+        """
+        if self._write_buffer is not None:
+            self._write_buffer.flush()
+        chunks = list(chunked(ids, chunk_size or self.bulk_chunk_size))
+        for chunk in chunks:
+            found = self.session.scalars(self._existing_statement(chunk))
+            if not set(found) >= set(chunk):
+                raise ItemNotFound
+
+        values = data.dump()
+        returning = self._supports("update_returning")
+        rows = []
+
+        for chunk in chunks:
+            statement = self._update_many_statement(chunk, values)
+            if returning:
+                rows += self.session.scalars(statement.returning(self.sql_mapping))
+            else:
+                self.session.execute(statement)
+                rows += self.session.scalars(
+                    self._select_many(chunk).execution_options(populate_existing=True)
+                )
+
+        return self._hydrate_all(self._in_order(ids, rows))
+
+
+class SQLSaveMixin(
+    SaveRepositoryMixin[BaseT],
+    BulkSaveRepositoryMixin[BaseT],
+    SQLRepository,
+):
+    """
+    A class representing a SQL save mixin.
+    """
+
+    def save(self, data: BaseT) -> BaseT:
+        return self.save_many([data])[0]
+
+    def save_many(
+        self, data: Sequence[BaseT], chunk_size: int | None = None
+    ) -> list[BaseT]:
+        """
+        Creates or updates several entities with one
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING per chunk. Entities
+        without primary key value are created with a plain INSERT.
 
+        Falls back to merging each entity in the session on dialects without
+        such upserts.
+        """
+        values = [self._column_values(item.dump()) for item in data]
+        if not self._can_upsert():
+            rows = [self.session.merge(self.sql_mapping(**row)) for row in values]
+            self.session.flush()
+            return self._hydrate_all(rows)
 
-class SQLDeleteMixin(DeleteRepositoryMixin[BaseT], SQLRepository):
+        new, keyed = self._split_new(values)
+        inserted = []
+        for chunk in chunked(new, chunk_size or self.bulk_chunk_size):
+            inserted += self.session.scalars(self._insert_many_statement(), chunk)
+        upserted = []
+        for statement, params in self._upsert_batches(keyed, chunk_size):
+            upserted += self.session.scalars(statement, params)
+
+        return self._hydrate_all(self._saved_in_order(values, inserted, upserted))
+
+
+class SQLBulkLoadMixin(SQLRepository[BaseT], Generic[BaseT, CreateT]):
+    """
+    A class representing a SQL bulk load mixin.
+
+    Attributes:
+    -----------
+    copy_buffer_size: int
+        The number of bytes of rows buffered in memory before being sent
+        with COPY.
+    """
+
+    copy_buffer_size: int = 8 * 1024 * 1024
+
+    def bulk_load(
+        self,
+        data: Iterable[CreateT],
+        staging: bool = False,
+        buffer_size: int | None = None,
+    ) -> BulkLoadReport:
+        """
+        Inserts a stream of DTOs without reading them back, and reports how
+        fast they were loaded.
+
+        On Postgres with psycopg2, rows are streamed with COPY FROM STDIN
+        from a buffer of at most `buffer_size` bytes. With `staging`, they
+        are copied into a temporary table first, then merged into the table
+        with an upsert on the primary key when it is given. Other databases
+        get one executemany INSERT per `bulk_chunk_size` rows.
+        """
+        start = perf_counter()
+        rows = (self._column_values(item.dump()) for item in data)
+        if self._can_copy():
+            count = self._copy_rows(rows, staging, buffer_size or self.copy_buffer_size)
+            method = "copy"
+        else:
+            count = self._insert_rows(rows)
+            method = "executemany"
+
+        return BulkLoadReport(rows=count, seconds=perf_counter() - start, method=method)
+
+    def _can_copy(self) -> bool:
+        return self.session.get_bind().dialect.driver == "psycopg2"
+
+    def _insert_rows(self, rows: Iterable[dict]) -> int:
+        count = 0
+        for chunk in batched(rows, self.bulk_chunk_size):
+            self.session.execute(insert(self.sql_mapping), chunk)
+            count += len(chunk)
+        return count
+
+    def _copy_rows(self, rows: Iterable[dict], staging: bool, buffer_size: int) -> int:
+        # Queued and pending ORM writes go first, COPY bypasses the session
+        if self._write_buffer is not None:
+            self._write_buffer.flush()
+        self.session.flush()
+        connection = self.session.connection()
+        cursor = connection.connection.cursor()
+        targets: dict[tuple[str, ...], Table] = {}
+        buffer = io.StringIO()
+        keys: tuple[str, ...] = ()
+        count = 0
+
+        def send():
+            target = targets.get(keys)
+            if target is None:
+                target = targets[keys] = (
+                    self._staging_table(connection, keys)
+                    if staging
+                    else self.sql_mapping.__table__
+                )
+            buffer.seek(0)
+            cursor.copy_expert(self._copy_statement(connection, target, keys), buffer)
+            buffer.seek(0)
+            buffer.truncate()
+
+        defaults = self._column_defaults()
+        for row in rows:
+            # COPY skips the defaults computed by SQLAlchemy
+            for key, default in defaults.items():
+                if key not in row:
+                    row[key] = default.arg(None) if default.is_callable else default.arg
+            # DTOs leave unset fields out, so COPY starts over when they change
+            if tuple(row) != keys and buffer.tell():
+                send()
+            keys = tuple(row)
+            buffer.write(copy_line(row.values()))
+            count += 1
+            if buffer.tell() >= buffer_size:
+                send()
+        if buffer.tell():
+            send()
+
+        if staging:
+            for keys, table in targets.items():
+                connection.execute(self._merge_statement(table, keys))
+                table.drop(connection)
+        return count
+
+    def _column_defaults(self) -> dict[str, Any]:
+        """
+        Returns the client side defaults of the columns, by attribute key.
+        """
+        defaults = {}
+        for attribute in inspect(self.sql_mapping).column_attrs:
+            default = attribute.columns[0].default
+            if default is not None and (default.is_scalar or default.is_callable):
+                defaults[attribute.key] = default
+        return defaults
+
+    def _column_names(self, keys: Sequence[str]) -> list[str]:
+        columns = inspect(self.sql_mapping).columns
+        return [columns[key].name for key in keys]
+
+    def _copy_statement(self, connection, table: Table, keys: Sequence[str]) -> str:
+        preparer = connection.dialect.identifier_preparer
+        names = ", ".join(preparer.quote(name) for name in self._column_names(keys))
+        return f"COPY {preparer.format_table(table)} ({names}) FROM STDIN"
+
+    def _staging_table(self, connection, keys: Sequence[str]) -> Table:
+        """
+        Creates the temporary table rows with the given attributes are
+        copied into before being merged, dropped at the latest on commit.
+        """
+        columns = inspect(self.sql_mapping).columns
+        table = Table(
+            f"{self.sql_mapping.__table__.name}_staging_{uuid4().hex[:8]}",
+            MetaData(),
+            *(Column(columns[key].name, columns[key].type) for key in keys),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
+        table.create(connection)
+        return table
+
+    def _merge_statement(self, staging: Table, keys: Sequence[str]):
+        """
+        Returns the statement moving the rows of a staging table into the
+        table, updating the rows that already exist.
+        """
+        names = self._column_names(keys)
+        statement = postgresql.insert(self.sql_mapping.__table__).from_select(
+            names, select(*(staging.c[name] for name in names))
+        )
+        pk = self._primary_key
+        if pk.name not in names:
+            return statement
+
+        updated = [name for name in names if name != pk.name]
+        if not updated:
+            return statement.on_conflict_do_nothing(index_elements=[pk])
+        return statement.on_conflict_do_update(
+            index_elements=[pk],
+            set_={name: statement.excluded[name] for name in updated},
+        )
+
+
+class SQLDeleteMixin(
+    DeleteRepositoryMixin[BaseT],
+    BulkDeleteRepositoryMixin[BaseT],
+    SQLRepository,
+):
     """
     A class representing a SQL delete mixin.
     """
 
     def delete(self, id: int) -> None:
+        if self._write_buffer is not None:
+            return self._write_buffer.delete(self, id)
         self.session.query(self.sql_mapping).filter_by(id=id).delete()
 
+    def delete_many(self, ids: Sequence[Any], chunk_size: int | None = None) -> None:
+        """
+        Deletes several rows with one DELETE ... WHERE id IN (...) per chunk.
+        """
+        for chunk in chunked(ids, chunk_size or self.bulk_chunk_size):
+            self.session.execute(
+                delete(self.sql_mapping).where(self._primary_key.in_(chunk))
+            )
 
-class SQLReadOnlyRepository(SQLGetMixin[BaseT], SQLListMixin[BaseT]):
+
+class SQLReadOnlyRepository(
+    SQLGetMixin[BaseT], SQLListMixin[BaseT], SQLExportMixin[BaseT]
+):
     pass
 
 
@@ -107,6 +1322,8 @@ class SQLWriteOnlyRepository(
     SQLCreateMixin[BaseT, CreateT],
     SQLUpdateMixin[BaseT, UpdateT],
     SQLDeleteMixin[BaseT],
+    SQLSaveMixin[BaseT],
+    SQLBulkLoadMixin[BaseT, CreateT],
 ):
     pass
 
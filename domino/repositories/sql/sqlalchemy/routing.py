@@ -0,0 +1,70 @@
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+if TYPE_CHECKING:
+    from .database import SQLDatabase
+
+
+class RoutingSession(Session):
+    """
+    A session sending the reads of read only sessions to a replica, and
+    everything else to the primary.
+
+    A replica is picked by the database the first time the session reads
+    from one, and is kept for the rest of the session. Once the current
+    request wrote to the primary, reads go to the primary as well so that
+    the request reads its own writes. Outside of a request scope, only the
+    reads of the session that wrote go to the primary, until it is closed.
+    """
+
+    def __init__(
+        self, *args: Any, database: "SQLDatabase", read_only: bool = False, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.database = database
+        self.read_only = read_only
+        self._replica = None
+        self._pinned = False
+
+    def close(self) -> None:
+        super().close()
+        # A session reused by a unit of work picks a replica again
+        self._replica = None
+        self._pinned = False
+
+    def pin_primary(self) -> None:
+        """
+        Sends the next reads of the session, and of the current request, to
+        the primary.
+        """
+        self.database.pin_primary()
+        if self.read_only:
+            self._pinned = True
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.read_only
+            and self.database.has_replicas
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and not self._pinned
+            and not self.database.is_primary_pinned()
+        ):
+            if self._replica is None:
+                self._replica = self.database.choose_replica()
+            return self._replica
+        return self.database.primary_bind
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _pin_primary_on_write(orm_execute_state: ORMExecuteState):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.pin_primary()
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_primary_on_flush(session: RoutingSession, flush_context):
+    session.pin_primary()
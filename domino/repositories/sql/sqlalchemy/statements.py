@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class StatementCache:
+    """
+    The statements of a repository class, built once per shape and reused
+    with different bound parameters.
+
+    Reusing the same statement object also lets SQLAlchemy skip computing
+    its cache key again before looking up the compiled form. Filter shapes
+    are chosen by callers, so the least recently used statements are dropped
+    once `maxsize` are stored.
+
+    Attributes:
+    -----------
+    maxsize: int
+        The number of statements kept.
+    hits: int
+        The number of lookups answered with an already built statement.
+    misses: int
+        The number of statements that had to be built.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._statements: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Returns the statement stored at key, building it on the first lookup.
+        """
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is not None:
+                self._statements.move_to_end(key)
+                self.hits += 1
+                return statement
+            self.misses += 1
+
+        statement = build()
+        with self._lock:
+            # Concurrent builds of the same shape are equivalent, keep the first
+            statement = self._statements.setdefault(key, statement)
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+        return statement
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self.hits = self.misses = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,198 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from domino.base.baseclass import DominoBaseClass
+from domino.domain.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
+
+from .async_repository import AsyncSQLRepository
+from .database import AsyncSQLDatabase, SQLDatabase
+from .repository import SQLRepository
+
+
+class SQLUnitOfWork(AbstractUnitOfWork):
+    """
+    A unit of work over a SQLDatabase, reusing its session and its
+    repositories from one transaction to the next.
+
+    Repositories are declared in `repositories`, by the attribute they are
+    exposed as, and are built once. The session is closed when each
+    transaction ends: its connection goes back to the engine pool and its
+    identity map is emptied, so nothing is carried over to the next
+    transaction.
+
+    Attributes:
+    -----------
+    database: SQLDatabase
+        The database the sessions are generated from.
+    repositories: dict[str, type[SQLRepository]]
+        The repository class of each attribute of the unit of work.
+    deferred: bool
+        Whether repository writes are queued in a WriteBuffer.
+    reuse_session: bool
+        Whether transactions reuse the session of the unit of work. When
+        False, each transaction generates a fresh session, and the
+        repositories are rebound to it. The repositories are then built on
+        the first `begin`.
+    """
+
+    repositories: dict[str, type[SQLRepository]] = {}
+    deferred: bool = False
+    reuse_session: bool = True
+
+    def __init__(
+        self,
+        database: SQLDatabase,
+        read_only: bool | None = None,
+        deferred: bool | None = None,
+    ) -> None:
+        DominoBaseClass.__init__(self)
+        self.database = database
+        if read_only is not None:
+            self.read_only = read_only
+        if deferred is not None:
+            self.deferred = deferred
+
+        self.session: Session | None = None
+        if self.reuse_session:
+            self.bind(self._generate_session())
+
+    def _generate_session(self) -> Session:
+        return self.database.generate_session(
+            read_only=self.read_only, deferred=self.deferred
+        )
+
+    def bind(self, session: Session) -> None:
+        """
+        Rebinds the unit of work and its repositories to another session,
+        building the repositories the first time.
+        """
+        self.session = session
+        for name, repository in self.repositories.items():
+            current = getattr(self, name, None)
+            if current is None:
+                setattr(self, name, repository(session))
+            else:
+                current.bind(session)
+
+    def begin(self):
+        if not self.reuse_session:
+            self.bind(self._generate_session())
+
+    def commit(self):
+        try:
+            self.session.commit()
+        finally:
+            self.session.close()
+
+    def rollback(self):
+        try:
+            self.session.rollback()
+        finally:
+            self.session.close()
+
+    def reset(self) -> bool:
+        """
+        Rolls back whatever a transaction left behind, so that the unit of
+        work can be reused.
+        """
+        if self.session is None:
+            return True
+        buffer = self.session.info.get("write_buffer")
+        if buffer is not None:
+            buffer.clear()
+        # Runs the rollback hooks of a transaction left open
+        self.rollback()
+        return True
+
+    def close(self) -> None:
+        """
+        Closes the session of the unit of work, once it is no longer used.
+        """
+        if self.session is not None:
+            self.session.close()
+
+
+class AsyncSQLUnitOfWork(AbstractAsyncUnitOfWork):
+    """
+    The asyncio counterpart of SQLUnitOfWork, over an AsyncSQLDatabase.
+
+    Attributes:
+    -----------
+    database: AsyncSQLDatabase
+        The database the sessions are generated from.
+    repositories: dict[str, type[AsyncSQLRepository]]
+        The repository class of each attribute of the unit of work.
+    reuse_session: bool
+        Whether transactions reuse the session of the unit of work.
+    """
+
+    repositories: dict[str, type[AsyncSQLRepository]] = {}
+    reuse_session: bool = True
+
+    def __init__(
+        self, database: AsyncSQLDatabase, read_only: bool | None = None
+    ) -> None:
+        DominoBaseClass.__init__(self)
+        self.database = database
+        if read_only is not None:
+            self.read_only = read_only
+
+        self.session: AsyncSession | None = None
+        self._closing: set[asyncio.Task] = set()
+        if self.reuse_session:
+            self.bind(self.database.generate_session(read_only=self.read_only))
+
+    def bind(self, session: AsyncSession) -> None:
+        """
+        Rebinds the unit of work and its repositories to another session,
+        building the repositories the first time.
+        """
+        self.session = session
+        for name, repository in self.repositories.items():
+            current = getattr(self, name, None)
+            if current is None:
+                setattr(self, name, repository(session))
+            else:
+                current.bind(session)
+
+    async def begin(self):
+        if not self.reuse_session:
+            self.bind(self.database.generate_session(read_only=self.read_only))
+
+    async def commit(self):
+        try:
+            await self.session.commit()
+        finally:
+            await self.session.close()
+
+    async def rollback(self):
+        try:
+            await self.session.rollback()
+        finally:
+            await self.session.close()
+
+    def reset(self) -> bool:
+        """
+        Prepares the unit of work for reuse. A transaction left open can't
+        be rolled back without awaiting, so the unit of work is reported as
+        not reusable instead.
+        """
+        if self.session is not None and self.session.in_transaction():
+            return False
+        self._run_transaction_hooks(committed=False)
+        return True
+
+    def close(self) -> None:
+        """
+        Closes the session of the unit of work, once it is no longer used.
+        Closing awaits, so it is scheduled on the running event loop.
+        """
+        if self.session is None:
+            return
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(self.session.close())
+        # The loop only keeps weak references to its tasks
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
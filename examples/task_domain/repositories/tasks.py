@@ -1,9 +1,8 @@
 from typing import Any
-from sqlalchemy import literal_column, update
 from sqlalchemy.orm import mapped_column, Mapped
 from domino.exceptions import ItemNotFound
 
-from domino.repositories.sql.sqlalchemy.repository import SQLRepository
+from domino.repositories.sql.sqlalchemy.repository import SQLSaveMixin
 from .database import Base, TaskSQLDatabase
 from examples.task_domain.domain.repositories import AbstractTaskRepository
 from examples.task_domain.domain.models import Task, TaskCreate, TaskUpdate
@@ -18,7 +17,10 @@ class TaskORM(Base):
     done: Mapped[bool] = mapped_column(default=False)
 
 
-class TaskRepository(SQLRepository, AbstractTaskRepository):
+class TaskRepository(SQLSaveMixin[Task], AbstractTaskRepository):
+    sql_mapping = TaskORM
+    domain_mapping = Task
+
     def get(self, id: Any) -> Task:
         result = self.session.query(TaskORM).get(id)
         if not result:
@@ -34,17 +36,5 @@ class TaskRepository(SQLRepository, AbstractTaskRepository):
 
         return Task.model_validate(task)
 
-    def save(self, task: Task) -> Task:
-        query = (
-            update(TaskORM)
-            .where(TaskORM.id == task.id)
-            .values(**task.dump())
-            .returning(literal_column("*"))
-        )
-
-        result = self.session.execute(query).fetchone()
-
-        return Task.model_validate(result)
-
     class Config:
         database = TaskSQLDatabase
@@ -0,0 +1,77 @@
+from dataclasses import FrozenInstanceError, dataclass, field
+
+import pytest
+
+from domino.domain.models.dataclasses import DTO, Entity, ValueObject, slotted
+
+
+@slotted
+class Task(Entity):
+    id: int
+    title: str
+    tags: list[str] = field(default_factory=list)
+
+
+@slotted
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+@dataclass
+class PlainTask(Entity):
+    id: int
+    title: str
+
+
+@slotted(kw_only=True)
+class TaskCreate(DTO):
+    title: str
+    description: str | None = None
+
+
+class TestSlottedModels:
+    def test_instances_have_no_dict(self):
+        assert not hasattr(Task(1, "task"), "__dict__")
+        assert not hasattr(Money(1, "EUR"), "__dict__")
+        # Models declared with a plain dataclass keep working
+        assert PlainTask(1, "task").dump() == {"id": 1, "title": "task"}
+
+    def test_value_objects_stay_frozen(self):
+        with pytest.raises(FrozenInstanceError):
+            Money(1, "EUR").amount = 2
+
+    def test_dump_returns_a_new_dict(self):
+        task = Task(1, "task")
+        dumped = task.dump()
+        dumped["title"] = "changed"
+
+        assert task.title == "task"
+        assert task.dump() == {"id": 1, "title": "task", "tags": []}
+        assert task.dump() is not task.dump()
+
+        dto = TaskCreate(title="task")
+        assert dto.dump() == {"title": "task", "description": None}
+
+    def test_compiled_functions_are_cached_per_class(self):
+        Task(1, "task").dump()
+        dump = Task.__dict__["__domino_dump__"]
+        Task(2, "other").dump()
+
+        assert Task.__dict__["__domino_dump__"] is dump
+        assert "__domino_dump__" not in Entity.__dict__
+
+
+class TestValueObjectHashing:
+    def test_hash_covers_the_values(self):
+        assert hash(Money(1, "EUR")) == hash(Money(1, "EUR"))
+        assert Money(1, "EUR") == Money(1, "EUR")
+        assert Money(1, "EUR") != Money(2, "EUR")
+        assert len({Money(1, "EUR"), Money(2, "EUR"), Money(1, "EUR")}) == 2
+
+    def test_hash_is_cached_in_a_slot(self, monkeypatch):
+        money = Money(1, "EUR")
+        hash(money)
+        monkeypatch.setattr(Money, "dump", lambda self: pytest.fail("dumped"))
+        assert hash(money) == hash(money)
+        assert not hasattr(money, "__dict__")
@@ -0,0 +1,184 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from domino.domain.models.abstract import InternPool
+from domino.domain.models.pydantic import (
+    DTO,
+    Entity,
+    ValueObject,
+    trusted_constructor,
+)
+
+
+class User(Entity):
+    id: int
+    login: str
+
+
+class Task(Entity):
+    id: int
+    name: str
+    user: User
+    watchers: list[User] = []
+    done: bool = False
+
+
+class Row:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class Point(ValueObject):
+    x: int
+    y: int
+
+
+class TestTrustedConstructor:
+    def test_builds_the_same_instances_as_validation(self):
+        construct = trusted_constructor(Task)
+        user = trusted_constructor(User)({"id": 2, "login": "owner"})
+
+        task = construct(
+            {"id": 1, "name": "task", "user": user, "watchers": [], "done": True}
+        )
+
+        expected = Task.load(
+            {"id": 1, "name": "task", "user": {"id": 2, "login": "owner"}, "done": True}
+        )
+        assert task == expected
+        assert task.dump() == expected.dump()
+        assert task.model_fields_set == expected.model_fields_set | {"watchers"}
+
+    def test_instances_are_independent(self):
+        construct = trusted_constructor(User)
+        first = construct({"id": 1, "login": "a"})
+        second = construct({"id": 2, "login": "b"})
+
+        first.login = "c"
+
+        assert second.login == "b"
+        assert first.model_fields_set is not second.model_fields_set
+
+    def test_sets_private_attributes(self):
+        point = trusted_constructor(Point)({"x": 1, "y": 2})
+
+        assert point._hash is None
+        assert hash(point) == hash(Point(x=1, y=2))
+
+    def test_is_compiled_once(self):
+        construct = trusted_constructor(User)
+
+        assert trusted_constructor(User) is construct
+        assert "__domino_trusted_constructor__" not in Entity.__dict__
+
+
+class TaskCreate(DTO):
+    name: str
+    description: str | None = None
+
+
+class TestBatchLoadAndDump:
+    def test_load_many_validates_mappings_and_objects(self):
+        tasks = Task.load_many(
+            [
+                Row(id=1, name="first", user=Row(id=2, login="owner"), watchers=[]),
+                {"id": "2", "name": "second", "user": {"id": 3, "login": "other"}},
+            ]
+        )
+
+        assert [task.id for task in tasks] == [1, 2]
+        assert tasks[0] == Task.load(
+            Row(id=1, name="first", user=Row(id=2, login="owner"), watchers=[])
+        )
+        assert isinstance(tasks[1].user, User)
+
+    def test_load_many_raises_on_invalid_items(self):
+        with pytest.raises(ValidationError):
+            Task.load_many([{"id": "not an id", "name": "task", "user": None}])
+
+    def test_dump_many(self):
+        tasks = Task.load_many(
+            [{"id": 1, "name": "task", "user": {"id": 2, "login": "owner"}}]
+        )
+
+        assert Task.dump_many(tasks) == [task.dump() for task in tasks]
+        assert json.loads(Task.dump_many_json(tasks)) == Task.dump_many(tasks)
+
+    def test_dto_dump_many_excludes_none(self):
+        dtos = [TaskCreate(name="a"), TaskCreate(name="b", description="desc")]
+
+        assert TaskCreate.dump_many(dtos) == [dto.dump() for dto in dtos]
+        assert (
+            TaskCreate.dump_many_json(dtos)
+            == b'[{"name":"a"},{"name":"b","description":"desc"}]'
+        )
+
+    def test_adapter_is_built_once(self):
+        Task.load_many([])
+        adapter = Task.__dict__["__domino_list_adapter__"]
+        Task.dump_many([])
+
+        assert Task.__dict__["__domino_list_adapter__"] is adapter
+        assert "__domino_list_adapter__" not in Entity.__dict__
+
+
+class Address(ValueObject):
+    street: str
+    city: str
+    tags: list[str] = []
+
+
+class Place(ValueObject):
+    street: str
+    city: str
+    tags: list[str] = []
+
+
+class TestValueObjectHashing:
+    def test_hash_covers_the_values(self):
+        first = Address(street="1 main st", city="Paris")
+        assert hash(first) == hash(Address(street="1 main st", city="Paris"))
+        assert first != Address(street="2 main st", city="Paris")
+        assert len({first, Address(street="2 main st", city="Paris")}) == 2
+
+    def test_unhashable_fields_are_hashed(self):
+        first = Address(street="1 main st", city="Paris", tags=["home"])
+        assert first == Address(street="1 main st", city="Paris", tags=["home"])
+        assert {first: 1}[Address(street="1 main st", city="Paris", tags=["home"])]
+
+    def test_hash_is_cached(self, monkeypatch):
+        address = Address(street="1 main st", city="Paris")
+        hash(address)
+        monkeypatch.setattr(Address, "dump", lambda self: pytest.fail("dumped"))
+        assert hash(address) == hash(address)
+        assert address == address
+
+    def test_other_classes_are_not_equal(self):
+        assert Address(street="1", city="Paris") != Place(street="1", city="Paris")
+
+    def test_copies_with_updates_hash_their_values(self):
+        address = Address(street="1 main st", city="Paris")
+        hash(address)
+        moved = address.model_copy(update={"city": "Lyon"})
+        assert moved == Address(street="1 main st", city="Lyon")
+        assert hash(moved) == hash(Address(street="1 main st", city="Lyon"))
+
+
+class TestInternPool:
+    def test_equal_values_share_an_instance(self):
+        pool = InternPool()
+        first = pool.intern(Address(street="1 main st", city="Paris"))
+        second = pool.intern(Address(street="1 main st", city="Paris"))
+        assert second is first
+        assert len(pool) == 1
+
+    def test_drops_least_recently_interned_values(self):
+        pool = InternPool(max_size=2)
+        paris = pool.intern(Address(street="1", city="Paris"))
+        pool.intern(Address(street="1", city="Lyon"))
+        pool.intern(Address(street="1", city="Paris"))
+        pool.intern(Address(street="1", city="Nice"))
+        assert paris in pool
+        assert Address(street="1", city="Lyon") not in pool
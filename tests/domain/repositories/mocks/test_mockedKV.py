@@ -1,8 +1,13 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
 import pytest
-from domino.exceptions import ItemNotFound
+from domino.exceptions import InvalidCursor, InvalidLimit, ItemNotFound
 
 from domino.repositories.mocks.kv import MockedKVRepository
+from domino.domain.filters import any_of, where
 from domino.domain.models.pydantic import Entity, DTO
+from domino.domain.pagination import decode_cursor, encode_cursor
 
 
 class Dummy(Entity):
@@ -27,6 +32,46 @@ class DummyKVRepository(MockedKVRepository[Dummy, DummyCreate, DummyUpdate]):
     ]
 
 
+class Event(Entity):
+    id: int
+    at: datetime
+
+
+class EventCreate(DTO):
+    at: datetime
+
+
+class EventKVRepository(MockedKVRepository[Event, EventCreate, EventCreate]):
+    entity = Event
+    sort_key = "at"
+    fixtures = [
+        EventCreate(at=datetime(2024, 1, 1) + timedelta(hours=hours))
+        for hours in range(3)
+    ]
+
+
+class TestCursors:
+    def test_values_keep_their_type(self):
+        values = [
+            datetime(2024, 1, 1, 12, 30),
+            datetime(2024, 1, 1).date(),
+            UUID(int=42),
+            "text",
+            3,
+            None,
+        ]
+        assert decode_cursor(encode_cursor(*values)) == values
+
+    def test_unsupported_values(self):
+        with pytest.raises(TypeError):
+            encode_cursor(object())
+
+    def test_invalid_tagged_values(self):
+        cursor = encode_cursor({"$type": "uuid", "value": "not-a-uuid"})
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+
 class TestMockedKVStore:
     def setup_method(self):
         self.store = DummyKVRepository()
@@ -62,3 +107,56 @@ class TestMockedKVStore:
 
         with pytest.raises(ItemNotFound):
             self.store.get(1)
+
+    def test_missing_items_are_not_found(self):
+        with pytest.raises(ItemNotFound):
+            self.store.update(99, DummyUpdate(login="missing"))
+        with pytest.raises(ItemNotFound):
+            self.store.delete(99)
+
+    def test_paginate_with_cursor(self):
+        self.store.create(DummyCreate(login="test-four"))
+
+        first_page = self.store.paginate({}, limit=3)
+        assert [item.id for item in first_page.items] == [4, 3, 2]
+        assert first_page.has_next
+
+        second_page = self.store.paginate({}, limit=3, cursor=first_page.next_cursor)
+        assert [item.id for item in second_page.items] == [1]
+        assert second_page.next_cursor is None
+
+    def test_paginate_on_custom_sort_key(self):
+        self.store.create(DummyCreate(login="test-one"))
+
+        page = self.store.paginate({}, limit=2, sort_key="login")
+        assert [item.id for item in page.items] == [2, 3]
+
+        page = self.store.paginate(
+            {}, limit=2, cursor=page.next_cursor, sort_key="login"
+        )
+        assert [item.id for item in page.items] == [4, 1]
+
+    def test_paginate_rejects_empty_pages(self):
+        for limit in (0, -1):
+            with pytest.raises(InvalidLimit):
+                self.store.paginate({}, limit=limit)
+
+    def test_paginate_on_datetime_sort_key(self):
+        store = EventKVRepository()
+
+        page = store.paginate({}, limit=2)
+        assert [item.id for item in page.items] == [3, 2]
+        page = store.paginate({}, limit=2, cursor=page.next_cursor)
+        assert [item.id for item in page.items] == [1]
+
+    def test_fetch_data_with_filter_expressions(self):
+        count, items = self.store.list(
+            where("login").startswith("test-t") & where("login").ne("test-two")
+        )
+        assert count == 1
+        assert items == [Dummy(id=3, login="test-three")]
+
+        count, _ = self.store.list(
+            any_of(where("login").in_(["test-one"]), where("login").is_null())
+        )
+        assert count == 1
@@ -0,0 +1,235 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context
+from typing import Any
+
+import pytest
+
+from domino.domain.filters import where
+from domino.domain.models.pydantic import DTO, Entity
+from domino.exceptions import ItemNotFound, WriteConflict
+from domino.repositories.mocks.kv import MockedKVRepository
+
+
+class Account(Entity):
+    id: int
+    owner: str
+    balance: int = 0
+
+
+class AccountCreate(DTO):
+    owner: str
+    balance: int = 0
+
+
+class AccountUpdate(DTO):
+    owner: str | None = None
+    balance: int | None = None
+
+
+class AccountRepository(MockedKVRepository[Account, AccountCreate, AccountUpdate]):
+    entity = Account
+    indexes = {"owner": "hash"}
+    fixtures = [
+        AccountCreate(owner="alice", balance=100),
+        AccountCreate(owner="bob", balance=50),
+    ]
+
+
+class TestMockedKVTransactions:
+    def setup_method(self):
+        self.store = AccountRepository()
+        # Each context stands for a thread or task with its own transaction
+        self.first, self.second = Context(), Context()
+
+    def test_writes_are_isolated_until_commit(self):
+        self.first.run(self.store.begin)
+        self.first.run(self.store.update, 1, AccountUpdate(balance=10))
+        self.first.run(self.store.create, AccountCreate(owner="carol"))
+
+        assert self.first.run(self.store.get, 1).balance == 10
+        assert self.first.run(self.store.list, {"owner": "carol"})[0] == 1
+        assert self.second.run(self.store.get, 1).balance == 100
+        assert self.second.run(self.store.list, {"owner": "carol"})[0] == 0
+
+        self.first.run(self.store.commit)
+        assert self.second.run(self.store.get, 1).balance == 10
+        assert self.second.run(self.store.list, {"owner": "carol"})[0] == 1
+
+    def test_transactions_read_a_snapshot(self):
+        self.first.run(self.store.begin)
+        assert self.first.run(self.store.get, 2).balance == 50
+
+        self.store.update(2, AccountUpdate(balance=0))
+        self.store.delete(1)
+        self.store.create(AccountCreate(owner="carol"))
+
+        assert self.first.run(self.store.get, 2).balance == 50
+        assert [
+            account.owner for account in self.first.run(self.store.list, {})[1]
+        ] == ["alice", "bob"]
+        assert self.first.run(self.store.list, {"owner": "alice"})[0] == 1
+
+        self.first.run(self.store.rollback)
+        assert self.first.run(self.store.get, 2).balance == 0
+        with pytest.raises(ItemNotFound):
+            self.first.run(self.store.get, 1)
+
+    def test_rollback_discards_writes(self):
+        self.first.run(self.store.begin)
+        self.first.run(self.store.delete, 1)
+        self.first.run(self.store.rollback)
+
+        assert self.store.get(1).owner == "alice"
+        assert self.store.list({"owner": "alice"})[0] == 1
+
+    def test_conflicting_writes_are_rejected(self):
+        for context in (self.first, self.second):
+            context.run(self.store.begin)
+            context.run(self.store.update, 1, AccountUpdate(balance=0))
+        self.second.run(self.store.update, 2, AccountUpdate(balance=0))
+
+        self.first.run(self.store.commit)
+        with pytest.raises(WriteConflict):
+            self.second.run(self.store.commit)
+
+        # None of the writes of the rejected transaction are committed
+        assert self.store.get(2).balance == 50
+        self.second.run(self.store.begin)
+        self.second.run(self.store.update, 2, AccountUpdate(balance=0))
+        self.second.run(self.store.commit)
+        assert self.store.get(2).balance == 0
+
+    def test_writes_to_other_items_do_not_conflict(self):
+        self.first.run(self.store.begin)
+        self.second.run(self.store.begin)
+        self.first.run(self.store.update, 1, AccountUpdate(balance=0))
+        self.second.run(self.store.update, 2, AccountUpdate(balance=0))
+        self.first.run(self.store.commit)
+        self.second.run(self.store.commit)
+
+        assert [account.balance for account in self.store.list({})[1]] == [0, 0]
+
+    def test_unread_versions_are_dropped(self):
+        self.first.run(self.store.begin)
+        self.store.update(1, AccountUpdate(balance=1))
+        self.store.delete(2)
+        assert len(self.store._store._chains["1"]) == 2
+
+        self.first.run(self.store.rollback)
+        self.store.update(1, AccountUpdate(balance=2))
+        assert len(self.store._store._chains["1"]) == 1
+        self.store.create(AccountCreate(owner="carol"))
+        assert "2" not in self.store._store._chains
+
+    def test_concurrent_transactions(self):
+        def transfer(worker: int) -> int:
+            retries = 0
+            for _ in range(20):
+                while True:
+                    self.store.begin()
+                    try:
+                        account = self.store.get(1)
+                        self.store.update(1, AccountUpdate(balance=account.balance + 1))
+                        self.store.create(AccountCreate(owner=f"worker-{worker}"))
+                        self.store.commit()
+                        break
+                    except WriteConflict:
+                        retries += 1
+                    finally:
+                        self.store.rollback()
+            return retries
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(transfer, range(4)))
+
+        assert self.store.get(1).balance == 180
+        count, accounts = self.store.list({})
+        assert count == 82
+        assert len({account.id for account in accounts}) == 82
+
+
+class Tagged(Entity):
+    id: int
+    tag: Any = None
+
+
+class TaggedCreate(DTO):
+    tag: Any = None
+
+
+class TaggedRepository(MockedKVRepository[Tagged, TaggedCreate, TaggedCreate]):
+    entity = Tagged
+    indexes = {"tag": "sorted"}
+    fixtures = [TaggedCreate(tag=1)]
+
+
+class TestRejectedCommits:
+    def test_index_errors_reject_the_whole_commit(self):
+        store = TaggedRepository()
+        store.begin()
+        store.update(1, TaggedCreate(tag=3))
+        store.create(TaggedCreate(tag=2))
+        store.create(TaggedCreate(tag="x"))
+        with pytest.raises(TypeError):
+            store.commit()
+
+        assert [item.tag for item in store.list({})[1]] == [1]
+        assert store.list(where("tag").ge(1))[0] == 1
+        assert store._indexes["tag"].entries == [(1, "1")]
+
+        store.create(TaggedCreate(tag=2))
+        assert store.list(where("tag").ge(2))[0] == 1
+
+
+class Owner(Entity):
+    id: int
+    name: str
+
+
+class OwnerCreate(DTO):
+    name: str
+
+
+class OwnerRepository(MockedKVRepository[Owner, OwnerCreate, OwnerCreate]):
+    entity = Owner
+    fixtures = [OwnerCreate(name="alice")]
+
+
+class Pet(Entity):
+    id: int
+    name: str
+    owner: Owner
+
+
+class PetCreate(DTO):
+    name: str
+    owner_id: int
+
+
+class PetRepository(MockedKVRepository[Pet, PetCreate, PetCreate]):
+    entity = Pet
+    foreign_keys = {"owner": OwnerRepository}
+    fixtures = [PetCreate(name="rex", owner_id=1)]
+
+
+class TestForeignKeysInTransactions:
+    def test_foreign_items_are_read_from_the_snapshot(self):
+        pets = PetRepository()
+        owners = pets.foreign_keys["owner"]
+        first = Context()
+
+        first.run(pets.begin)
+        owners.update(1, OwnerCreate(name="bob"))
+        assert first.run(pets.get, 1).owner.name == "alice"
+
+        first.run(pets.commit)
+        assert first.run(pets.get, 1).owner.name == "bob"
+
+    def test_foreign_transactions_end_with_the_transaction(self):
+        pets = PetRepository()
+        owners = pets.foreign_keys["owner"]
+
+        pets.begin()
+        assert owners._transaction.get() is not None
+        pets.rollback()
+        assert owners._transaction.get() is None
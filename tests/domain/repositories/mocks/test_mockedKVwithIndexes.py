@@ -0,0 +1,120 @@
+import pytest
+
+from domino.domain.filters import any_of, where
+from domino.domain.models.pydantic import DTO, Entity
+from domino.repositories.mocks.indexes import HashIndex, SortedIndex, candidates
+from domino.repositories.mocks.kv import MockedKVRepository
+
+
+class Product(Entity):
+    id: int
+    name: str
+    category: str
+    price: int | None = None
+
+
+class ProductCreate(DTO):
+    name: str
+    category: str
+    price: int | None = None
+
+
+class ProductUpdate(DTO):
+    name: str | None = None
+    category: str | None = None
+    price: int | None = None
+
+
+FIXTURES = [
+    ProductCreate(name="apple", category="fruit", price=3),
+    ProductCreate(name="avocado", category="fruit", price=8),
+    ProductCreate(name="banana", category="fruit", price=2),
+    ProductCreate(name="bread", category="bakery", price=4),
+    ProductCreate(name="brioche", category="bakery"),
+    ProductCreate(name="carrot", category="vegetable", price=1),
+]
+
+
+class ScannedProductRepository(
+    MockedKVRepository[Product, ProductCreate, ProductUpdate]
+):
+    entity = Product
+    fixtures = FIXTURES
+
+
+class IndexedProductRepository(ScannedProductRepository):
+    indexes = {"category": "hash", "price": "sorted", "name": "sorted"}
+
+
+FILTERS = [
+    {"category": "fruit"},
+    where("category").in_(["bakery", "vegetable"]),
+    where("price").between(2, 4),
+    where("price").gt(3) | where("price").lt(2),
+    where("price").ge(3) & where("category").eq("fruit"),
+    where("price").le(3) & where("name").ne("banana"),
+    where("name").startswith("b"),
+    where("name").startswith("av") & where("price").is_null(False),
+    where("price").is_null(),
+    where("price").eq(None),
+    any_of(where("category").eq("bakery"), where("name").startswith("c")),
+    where("category").eq("meat"),
+]
+
+
+class TestMockedKVStoreWithIndexes:
+    def setup_method(self):
+        self.scanned = ScannedProductRepository()
+        self.store = IndexedProductRepository()
+
+    @pytest.mark.parametrize("filter", FILTERS)
+    def test_indexed_lists_match_scans(self, filter):
+        assert self.store.list(filter) == self.scanned.list(filter)
+
+    def test_indexes_follow_writes(self):
+        for store in (self.store, self.scanned):
+            store.update(1, ProductUpdate(category="bakery", price=5))
+            store.delete(4)
+            store.create(ProductCreate(name="bagel", category="bakery", price=5))
+
+        for filter in FILTERS + [where("price").eq(5), {"category": "bakery"}]:
+            assert self.store.list(filter) == self.scanned.list(filter)
+
+        _, items = self.store.list(where("price").eq(5))
+        assert [item.name for item in items] == ["apple", "bagel"]
+
+    def test_only_candidates_are_checked(self):
+        filter = where("category").eq("fruit") & where("price").lt(3)
+        assert candidates(filter, self.store._indexes) == {"3"}
+
+        # A condition on an attribute without index is checked on candidates
+        filter = where("name").ne("apple") & where("price").ge(8)
+        assert candidates(filter, self.store._indexes) == {"2"}
+        assert candidates(where("name").ne("apple"), self.store._indexes) is None
+
+
+class TestIndexes:
+    def test_hash_index(self):
+        index = HashIndex("category")
+        index.add("1", "fruit")
+        index.add("2", "fruit")
+        index.add("3", None)
+        index.remove("1", "fruit")
+
+        assert index.lookup(where("category").eq("fruit")) == {"2"}
+        assert index.lookup(where("category").is_null()) == {"3"}
+        assert index.lookup(where("category").gt("a")) is None
+
+    def test_sorted_index_ranges(self):
+        index = SortedIndex("price")
+        for id, price in enumerate([5, 1, 3, 3, None, 8], start=1):
+            index.add(str(id), price)
+        index.remove("6", 8)
+
+        assert index.lookup(where("price").eq(3)) == {"3", "4"}
+        assert index.lookup(where("price").gt(3)) == {"1"}
+        assert index.lookup(where("price").le(3)) == {"2", "3", "4"}
+        assert index.lookup(where("price").between(2, 5)) == {"1", "3", "4"}
+        assert index.lookup(where("price").is_null()) == {"5"}
+        # Values that can't be compared fall back to a scan
+        assert index.lookup(where("price").gt("3")) is None
@@ -73,3 +73,53 @@ class TestMockedKVStoreWithForeignKeys:
             "name": "test-one",
             "user": {"id": 2, "login": "test-two"},
         }
+
+    def test_rendered_entities_are_cached(self):
+        self.store.get(1)
+        cached = self.store._rendered["1"]
+        self.store.get(1)
+        self.store.list({"user_id": 1})
+        assert self.store._rendered["1"] is cached
+
+        self.store.update(1, TaskUpdate(name="test-one-updated"))
+        assert self.store.get(1).name == "test-one-updated"
+        assert self.store._rendered["1"] is not cached
+
+    def test_writes_to_foreign_items_invalidate_entities(self):
+        self.store.get(1)
+        self.store.get(3)
+        cached = self.store._rendered["1"], self.store._rendered["3"]
+        self.store.foreign_keys["user"].update(1, UserUpdate(login="renamed"))
+
+        assert self.store.get(1).user.login == "renamed"
+        self.store.get(3)
+        assert self.store._rendered["1"] is not cached[0]
+        assert self.store._rendered["3"] is cached[1]
+
+    def test_returned_entities_can_be_mutated(self):
+        task = self.store.get(1)
+        task.name = "mutated"
+        task.user.login = "mutated"
+
+        assert self.store.get(1) is not task
+        assert self.store.get(1).name == "test-one"
+        assert self.store.get(1).user.login == "test-one"
+        assert self.store.list({"user_id": 1})[1][0].name == "test-one"
+
+    def test_list_resolves_each_foreign_key_once(self, monkeypatch):
+        users = self.store.foreign_keys["user"]
+        render_found = users._render_found
+        calls = []
+
+        def record(ids):
+            calls.append(sorted(ids))
+            return render_found(ids)
+
+        monkeypatch.setattr(users, "_render_found", record)
+        self.store.create(TaskCreate(name="test-five", user_id=1))
+        calls.clear()
+
+        count, tasks = self.store.list({})
+        assert count == 5
+        assert calls == [["1", "2", "3"]]
+        assert tasks[0].user == tasks[4].user
@@ -0,0 +1,57 @@
+import pytest
+
+from domino.domain.filters import And, Condition, Or, all_of, any_of, as_filter, where
+from domino.exceptions import InvalidFilter
+
+DOCUMENTS = [
+    {"id": 1, "name": "Alice", "age": 31, "team": None},
+    {"id": 2, "name": "Bob", "age": 25, "team": "blue"},
+    {"id": 3, "name": "Alan", "age": None, "team": "red"},
+]
+
+
+def matching(filter) -> list[int]:
+    predicate = filter.predicate()
+    return [document["id"] for document in DOCUMENTS if predicate(document)]
+
+
+class TestFilters:
+    def test_comparisons(self):
+        assert matching(where("name").eq("Bob")) == [2]
+        assert matching(where("age").gt(25)) == [1]
+        assert matching(where("age").le(31)) == [1, 2]
+        assert matching(where("age").between(20, 30)) == [2]
+        assert matching(where("id").in_([1, 3])) == [1, 3]
+        assert matching(where("name").startswith("Al")) == [1, 3]
+
+    def test_null_checks(self):
+        assert matching(where("team").is_null()) == [1]
+        assert matching(where("team").is_null(False)) == [2, 3]
+        assert matching(where("team").eq(None)) == [1]
+        # Like SQL, comparisons never match null values
+        assert matching(where("team").ne("blue")) == [3]
+
+    def test_combinations(self):
+        assert matching(where("name").startswith("Al") & where("age").gt(30)) == [1]
+        assert matching(where("id").eq(1) | where("team").eq("red")) == [1, 3]
+        assert matching(any_of(where("id").eq(2), all_of(where("id").eq(3)))) == [2, 3]
+
+    def test_shapes_ignore_values(self):
+        first = where("age").gt(20) & where("name").eq("Bob")
+        second = where("age").gt(40) & where("name").eq("Alice")
+
+        assert first.shape == second.shape
+        assert first.shape != (where("age").gt(20) | where("name").eq("Bob")).shape
+        assert where("team").eq(None).shape != where("team").eq("red").shape
+
+    def test_dicts_are_equality_filters(self):
+        assert as_filter({}) is None
+        assert as_filter({"id": 1}) == where("id").eq(1)
+        assert isinstance(as_filter({"id": 1, "name": "Bob"}), And)
+        assert isinstance(where("id").eq(1) | where("id").eq(2), Or)
+
+    def test_invalid_filters(self):
+        with pytest.raises(InvalidFilter):
+            Condition("name", "like", "A%")
+        with pytest.raises(InvalidFilter):
+            Condition("age", "between", (1,))
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from domino.domain.pools import (
+    TaskLocalUnitOfWork,
+    ThreadLocalUnitOfWork,
+    UnitOfWorkPool,
+)
+
+
+class DummyUnitOfWork:
+    def __init__(self, reusable: bool = True):
+        self.reusable = reusable
+        self.resets = 0
+
+    def reset(self) -> bool:
+        self.resets += 1
+        return self.reusable
+
+
+class TestUnitOfWorkPool:
+    def test_released_units_of_work_are_reused(self):
+        pool = UnitOfWorkPool(DummyUnitOfWork)
+        with pool.borrow() as first:
+            pass
+
+        with pool.borrow() as second:
+            assert second is first
+            with pool.borrow() as third:
+                assert third is not first
+
+        assert first.resets == 2
+        assert len(pool) == 2
+
+    def test_max_size(self):
+        pool = UnitOfWorkPool(DummyUnitOfWork, max_size=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        assert len(pool) == 1
+
+    def test_units_of_work_that_cannot_be_reset_are_dropped(self):
+        pool = UnitOfWorkPool(lambda: DummyUnitOfWork(reusable=False))
+        pool.release(pool.acquire())
+
+        assert len(pool) == 0
+
+
+class TestThreadLocalUnitOfWork:
+    def test_one_unit_of_work_per_thread(self):
+        local = ThreadLocalUnitOfWork(DummyUnitOfWork)
+        assert local.get() is local.get()
+
+        others = []
+        thread = threading.Thread(target=lambda: others.append(local.get()))
+        thread.start()
+        thread.join()
+
+        assert others[0] is not local.get()
+
+
+class TestTaskLocalUnitOfWork:
+    def test_one_unit_of_work_per_task(self):
+        local = TaskLocalUnitOfWork(DummyUnitOfWork)
+
+        async def request():
+            unit_of_work = local.get()
+            await asyncio.sleep(0)
+            assert local.get() is unit_of_work
+            return unit_of_work
+
+        async def main():
+            first, second = await asyncio.gather(request(), request())
+            assert first is not second
+
+            # Units of work are given back once their task is done
+            await asyncio.sleep(0)
+            assert len(local.pool) == 2
+            assert await asyncio.create_task(request()) in (first, second)
+
+        asyncio.run(main())
+
+    def test_needs_a_task(self):
+        with pytest.raises(RuntimeError):
+            TaskLocalUnitOfWork(DummyUnitOfWork).get()
@@ -0,0 +1,231 @@
+import time
+
+import pytest
+
+from domino.domain.models.pydantic import DTO, Entity
+from domino.domain.uow import AbstractUnitOfWork
+from domino.repositories.cache import (
+    CachedRepository,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from domino.repositories.mocks.kv import MockedKVRepository
+
+
+class Dummy(Entity):
+    id: int
+    login: str
+
+
+class DummyCreate(DTO):
+    login: str
+
+
+class DummyUpdate(DTO):
+    login: str | None = None
+
+
+class CountingKVRepository(MockedKVRepository[Dummy, DummyCreate, DummyUpdate]):
+    entity = Dummy
+    fixtures = [DummyCreate(login="test-one"), DummyCreate(login="test-two")]
+
+    def __init__(self):
+        self.reads = 0
+        super().__init__()
+
+    def get(self, id):
+        self.reads += 1
+        return super().get(id)
+
+    def list(self, filter_data={}):
+        self.reads += 1
+        return super().list(filter_data)
+
+
+class DummyUnitOfWork(AbstractUnitOfWork):
+    def __init__(self):
+        pass
+
+    def begin(self):
+        return
+
+    def commit(self):
+        return
+
+    def rollback(self):
+        return
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryCacheBackend(max_size=2)
+    return SQLiteCacheBackend(str(tmp_path / "cache.db"), max_size=2)
+
+
+class TestCachedRepository:
+    def test_get_is_read_through(self, backend):
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, backend)
+
+        assert cached.get(1) == cached.get(1) == Dummy(id=1, login="test-one")
+        assert repository.reads == 1
+        assert (cached.stats.hits, cached.stats.misses) == (1, 1)
+
+    def test_ids_share_entries_whatever_their_type(self, backend):
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, backend)
+
+        assert cached.get(1) == cached.get("1")
+        assert repository.reads == 1
+
+    def test_list_forwards_keywords(self, backend):
+        repository = CountingKVRepository()
+        repository.calls = []
+        repository.list = lambda filter_data={}, **kwargs: (
+            repository.calls.append(kwargs) or (None, [])
+        )
+        cached = CachedRepository(repository, backend)
+
+        assert cached.list({}, count="none") == cached.list({}, count="none")
+        cached.list({})
+
+        assert repository.calls == [{"count": "none"}, {}]
+
+    def test_least_recently_used_entries_are_evicted(self, backend):
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, backend)
+
+        cached.get(1)
+        cached.get(2)
+        cached.list({})
+
+        assert cached.stats.evictions == 1
+        cached.get(2)
+        assert repository.reads == 3
+        cached.get(1)
+        assert repository.reads == 4
+
+    def test_expired_entries_are_reloaded(self):
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, InMemoryCacheBackend(ttl=0.01))
+
+        cached.get(1)
+        time.sleep(0.02)
+        cached.get(1)
+
+        assert repository.reads == 2
+        assert cached.stats.evictions == 1
+
+    def test_cached_entities_are_not_shared(self):
+        cached = CachedRepository(CountingKVRepository())
+
+        cached.get(1).login = "mutated"
+
+        assert cached.get(1).login == "test-one"
+
+    def test_writes_invalidate_without_unit_of_work(self, backend):
+        cached = CachedRepository(CountingKVRepository(), backend)
+
+        cached.get(1)
+        cached.update(1, DummyUpdate(login="updated"))
+
+        assert cached.get(1).login == "updated"
+
+    def test_writes_invalidate_after_commit(self, backend):
+        uow = DummyUnitOfWork()
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, backend, unit_of_work=uow)
+        assert cached.list({})[0] == 2
+
+        with uow:
+            cached.create(DummyCreate(login="test-three"))
+            cached.update(1, DummyUpdate(login="updated"))
+            # Reads inside the transaction see its own writes
+            assert cached.get(1).login == "updated"
+            assert cached.list({})[0] == 3
+
+        reads = repository.reads
+        assert cached.get(1).login == "updated"
+        assert cached.get(1).login == "updated"
+        assert repository.reads == reads + 1
+
+    def test_rollback_keeps_cache(self):
+        uow = DummyUnitOfWork()
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, unit_of_work=uow)
+        cached.get(2)
+
+        with pytest.raises(Exception):
+            with uow:
+                cached.delete(1)
+                raise Exception()
+
+        cached.get(2)
+        assert repository.reads == 1
+
+    def test_explicit_commit_invalidates(self, backend):
+        uow = DummyUnitOfWork()
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, backend, unit_of_work=uow)
+        cached.get(1)
+
+        uow.begin()
+        cached.update(1, DummyUpdate(login="updated"))
+        uow.commit()
+
+        assert cached._pending is None
+        reads = repository.reads
+        assert cached.get(1).login == "updated"
+        assert cached.get(1).login == "updated"
+        assert repository.reads == reads + 1
+
+    def test_explicit_rollback_resets_pending_writes(self):
+        uow = DummyUnitOfWork()
+        repository = CountingKVRepository()
+        cached = CachedRepository(repository, unit_of_work=uow)
+        cached.get(2)
+
+        uow.begin()
+        cached.update(2, DummyUpdate(login="updated"))
+        uow.rollback()
+
+        # Keys written by the rolled back transaction are served again
+        assert cached._pending is None
+        cached.get(2)
+        assert repository.reads == 1
+
+    def test_writes_through_the_unit_of_work_invalidate(self, backend):
+        uow = DummyUnitOfWork()
+        uow.dummies = repository = CountingKVRepository()
+        cached = CachedRepository(repository, backend, unit_of_work=uow)
+        assert uow.dummies is cached
+        cached.get(1)
+
+        with uow:
+            uow.dummies.update(1, DummyUpdate(login="updated"))
+
+        assert cached.get(1).login == "updated"
+
+
+class TestSQLiteCacheBackend:
+    def test_is_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        SQLiteCacheBackend(path).set("key", Dummy(id=1, login="shared"))
+
+        assert SQLiteCacheBackend(path).get("key") == Dummy(id=1, login="shared")
+
+    def test_hits_are_written_in_batches(self, tmp_path):
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+        backend.touch_batch_size = 2
+        backend.set("one", Dummy(id=1, login="one"))
+        backend.set("two", Dummy(id=2, login="two"))
+        connection = backend._connection()
+        changes = connection.total_changes
+
+        backend.get("one")
+        backend.get("one")
+        assert connection.total_changes == changes
+
+        backend.get("two")
+        assert connection.total_changes == changes + 2
@@ -0,0 +1,128 @@
+import os
+
+import pytest
+
+from domino.domain.filters import where
+from domino.domain.models.pydantic import DTO, Entity
+from domino.exceptions import ItemNotFound
+from domino.repositories.kv import SQLiteKVRepository
+
+
+class User(Entity):
+    id: int
+    login: str
+
+
+class UserCreate(DTO):
+    login: str
+
+
+class UserUpdate(DTO):
+    login: str | None = None
+
+
+class Task(Entity):
+    id: int
+    name: str
+    user: User
+
+
+class TaskCreate(DTO):
+    name: str
+    user_id: int
+
+
+class TaskUpdate(DTO):
+    name: str | None = None
+    user_id: int | None = None
+
+
+class UserRepository(SQLiteKVRepository[User, UserCreate, UserUpdate]):
+    entity = User
+    fixtures = [UserCreate(login="test-one"), UserCreate(login="test-two")]
+
+
+class TaskRepository(SQLiteKVRepository[Task, TaskCreate, TaskUpdate]):
+    entity = Task
+    foreign_keys = {"user": UserRepository}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "store.db")
+
+
+class TestSQLiteKVRepository:
+    def test_crud(self, path):
+        users = UserRepository(path)
+
+        assert users.get(1) == User(id=1, login="test-one")
+        assert users.create(UserCreate(login="test-three")).id == 3
+        assert users.update(3, UserUpdate(login="updated")).login == "updated"
+        assert users.get(3).login == "updated"
+
+        users.delete(3)
+        with pytest.raises(ItemNotFound):
+            users.get(3)
+        with pytest.raises(ItemNotFound):
+            users.delete(3)
+
+    def test_items_survive_reopening(self, path):
+        UserRepository(path).create(UserCreate(login="test-three"))
+
+        users = UserRepository(path)
+        count, items = users.list({})
+        # Fixtures are only created with the table
+        assert count == 3
+        assert [item.login for item in items] == ["test-one", "test-two", "test-three"]
+        assert users.create(UserCreate(login="test-four")).id == 4
+
+    def test_resolves_foreign_keys(self, path):
+        tasks = TaskRepository(path)
+        tasks.create(TaskCreate(name="first", user_id=1))
+        tasks.create(TaskCreate(name="second", user_id=2))
+        tasks.create(TaskCreate(name="third", user_id=1))
+
+        assert tasks.get(2).user == User(id=2, login="test-two")
+        count, items = tasks.list({"user_id": 1})
+        assert count == 2
+        assert [item.name for item in items] == ["first", "third"]
+
+        tasks.foreign_keys["user"].update(1, UserUpdate(login="renamed"))
+        assert tasks.get(1).user.login == "renamed"
+
+    def test_invalid_writes_are_not_stored(self, path):
+        tasks = TaskRepository(path)
+
+        # The user doesn't exist, so the task can't be built
+        with pytest.raises(ValueError):
+            tasks.create(TaskCreate(name="orphan", user_id=42))
+
+        assert tasks.list({}) == (0, [])
+        assert tasks.create(TaskCreate(name="first", user_id=1)).id == 1
+
+    def test_filters_and_pagination(self, path):
+        users = UserRepository(path)
+        users.create(UserCreate(login="other"))
+
+        count, _ = users.list(where("login").startswith("test-"))
+        assert count == 2
+
+        page = users.paginate({}, limit=2)
+        assert [user.id for user in page.items] == [3, 2]
+        page = users.paginate({}, limit=2, cursor=page.next_cursor)
+        assert [user.id for user in page.items] == [1]
+        assert not page.has_next
+
+    def test_compact_reclaims_space(self, path):
+        users = UserRepository(path)
+        for index in range(500):
+            users.create(UserCreate(login="user" * 50 + str(index)))
+        for index in range(3, 503):
+            users.delete(index)
+
+        users.compact()
+
+        assert os.path.getsize(path + "-wal") == 0
+        assert os.path.getsize(path) < 50_000
+        assert users.list({})[0] == 2
@@ -1,5 +1,8 @@
 from .models import User, UserCreate, UserUpdate, Task, TaskCreate, TaskUpdate
-from domino.domain.repositories import AbstractCRUDRepository
+from domino.domain.repositories import (
+    AbstractAsyncCRUDRepository,
+    AbstractCRUDRepository,
+)
 
 
 class AbstractUserRepository(AbstractCRUDRepository[User, UserCreate, UserUpdate]):
@@ -8,3 +11,15 @@ class AbstractUserRepository(AbstractCRUDRepository[User, UserCreate, UserUpdate
 
 class AbstractTaskRepository(AbstractCRUDRepository[Task, TaskCreate, TaskUpdate]):
     pass
+
+
+class AbstractAsyncUserRepository(
+    AbstractAsyncCRUDRepository[User, UserCreate, UserUpdate]
+):
+    pass
+
+
+class AbstractAsyncTaskRepository(
+    AbstractAsyncCRUDRepository[Task, TaskCreate, TaskUpdate]
+):
+    pass
@@ -1,7 +1,17 @@
-from .repositories import AbstractUserRepository, AbstractTaskRepository
+from .repositories import (
+    AbstractAsyncTaskRepository,
+    AbstractAsyncUserRepository,
+    AbstractTaskRepository,
+    AbstractUserRepository,
+)
 from .models import Task, TaskCreate
 
-from domino.domain import AbstractUnitOfWork, Service
+from domino.domain import (
+    AbstractAsyncUnitOfWork,
+    AbstractUnitOfWork,
+    AsyncService,
+    Service,
+)
 
 
 class TaskUnitOfWork(AbstractUnitOfWork):
@@ -15,3 +25,16 @@ class TaskService(Service[TaskUnitOfWork]):
 
     def delete_task(self, task_id: int) -> None:
         self.unit_of_work.tasks.delete(task_id)
+
+
+class AsyncTaskUnitOfWork(AbstractAsyncUnitOfWork):
+    users: AbstractAsyncUserRepository
+    tasks: AbstractAsyncTaskRepository
+
+
+class AsyncTaskService(AsyncService[AsyncTaskUnitOfWork]):
+    async def create_task(self, data: TaskCreate) -> Task:
+        return await self.unit_of_work.tasks.create(data)
+
+    async def delete_task(self, task_id: int) -> None:
+        await self.unit_of_work.tasks.delete(task_id)
@@ -1,10 +1,14 @@
 from sqlalchemy.orm import DeclarativeBase
-from domino.repositories.sql.sqlalchemy.database import SQLDatabase
+from domino.repositories.sql.sqlalchemy.database import AsyncSQLDatabase, SQLDatabase
 
 
 class InMemoryDatabase(SQLDatabase):
     dsn = "sqlite:///:memory:"
 
 
+class AsyncInMemoryDatabase(AsyncSQLDatabase):
+    dsn = "sqlite+aiosqlite:///:memory:"
+
+
 class Base(DeclarativeBase):
     pass
@@ -2,9 +2,13 @@ from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from domino.exceptions import ItemNotFound
+from domino.repositories.sql.sqlalchemy.async_repository import AsyncSQLCRUDRepository
 from domino.repositories.sql.sqlalchemy.repository import SQLCRUDRepository
 from tests.repositories.sql.app.models import Task, TaskCreate, TaskUpdate
-from tests.repositories.sql.app.repositories import AbstractTaskRepository
+from tests.repositories.sql.app.repositories import (
+    AbstractAsyncTaskRepository,
+    AbstractTaskRepository,
+)
 from tests.repositories.sql.repositories.users import UserMapping
 
 from .db import Base
@@ -27,3 +31,11 @@ class TaskRepository(
 ):
     sql_mapping = TaskMapping
     domain_mapping = Task
+
+
+class AsyncTaskRepository(
+    AbstractAsyncTaskRepository,
+    AsyncSQLCRUDRepository[Task, TaskCreate, TaskUpdate],
+):
+    sql_mapping = TaskMapping
+    domain_mapping = Task
@@ -2,12 +2,16 @@ from sqlalchemy import desc
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from domino.exceptions import ItemNotFound
+from domino.repositories.sql.sqlalchemy.async_repository import AsyncSQLCRUDRepository
 from domino.repositories.sql.sqlalchemy.repository import (
     SQLCRUDRepository,
     SQLRepository,
 )
 from tests.repositories.sql.app.models import User, UserCreate, UserUpdate
-from tests.repositories.sql.app.repositories import AbstractUserRepository
+from tests.repositories.sql.app.repositories import (
+    AbstractAsyncUserRepository,
+    AbstractUserRepository,
+)
 
 from .db import Base
 
@@ -27,3 +31,11 @@ class UserRepository(
 ):
     sql_mapping = UserMapping
     domain_mapping = User
+
+
+class AsyncUserRepository(
+    AbstractAsyncUserRepository,
+    AsyncSQLCRUDRepository[User, UserCreate, UserUpdate],
+):
+    sql_mapping = UserMapping
+    domain_mapping = User
@@ -0,0 +1,253 @@
+import asyncio
+
+import pytest
+
+from domino.exceptions import ItemNotFound
+from tests.repositories.sql.app.models import TaskCreate, TaskUpdate, UserCreate
+from tests.repositories.sql.app.services import AsyncTaskService, AsyncTaskUnitOfWork
+from tests.repositories.sql.repositories.db import AsyncInMemoryDatabase, Base
+from tests.repositories.sql.repositories.tasks import AsyncTaskRepository
+from tests.repositories.sql.repositories.users import AsyncUserRepository
+
+
+class AsyncInMemoryTaskUnitOfWork(AsyncTaskUnitOfWork):
+    def __init__(self):
+        self.database = AsyncInMemoryDatabase()
+
+    async def begin(self):
+        self.session = self.database.generate_session()
+        self.users = AsyncUserRepository(self.session)
+        self.tasks = AsyncTaskRepository(self.session)
+
+    async def commit(self):
+        await self.session.commit()
+        await self.session.close()
+
+    async def rollback(self):
+        await self.session.rollback()
+        await self.session.close()
+
+
+async def build_unit_of_work() -> AsyncInMemoryTaskUnitOfWork:
+    unit_of_work = AsyncInMemoryTaskUnitOfWork()
+    await unit_of_work.database.create_database_from_declarative_base(Base)
+
+    # Fixtures
+    async with unit_of_work:
+        for user in [
+            UserCreate(name="John Doe", email="jdoe@42.fr"),
+            UserCreate(name="Jane Doe", email="jadoe@42.fr"),
+        ]:
+            await unit_of_work.users.create(user)
+
+    async with unit_of_work:
+        await unit_of_work.tasks.create(
+            TaskCreate(title="Test task 1", description="Test description 1", user_id=1)
+        )
+
+    return unit_of_work
+
+
+def run(test):
+    async def main():
+        uow = await build_unit_of_work()
+        try:
+            await test(uow)
+        finally:
+            await uow.database.dispose()
+
+    asyncio.run(main())
+
+
+class TestAsyncRepository:
+    def test_retrieve_first_user(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                user = await uow.users.get(1)
+
+            assert user.id == 1
+            assert user.name == "John Doe"
+            assert user.email == "jdoe@42.fr"
+
+        run(test)
+
+    def test_create_task(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                svc = AsyncTaskService(uow)
+                payload = TaskCreate(
+                    title="Test task",
+                    description="Test description",
+                    user_id=1,
+                )
+                task = await svc.create_task(payload)
+
+            assert task.id == 2
+            assert task.title == "Test task"
+            assert task.user.id == 1
+            assert "user_id" not in task.dump().keys()
+
+        run(test)
+
+    def test_cant_create_data_when_transaction_is_interrupted(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            id = None
+            with pytest.raises(Exception):
+                async with uow:
+                    task = await AsyncTaskService(uow).create_task(
+                        TaskCreate(title="Test task", description="Test", user_id=1)
+                    )
+                    id = task.id
+                    raise Exception("Interrupted transaction")
+
+            with pytest.raises(ItemNotFound):
+                async with uow:
+                    assert id is not None
+                    await uow.tasks.get(id)
+
+        run(test)
+
+    def test_can_update_a_task(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                task = await uow.tasks.update(
+                    1, TaskUpdate(title="Test task 2", description="Test description")
+                )
+
+            async with uow:
+                task = await uow.tasks.get(task.id)
+                assert task.title == "Test task 2"
+                assert task.description == "Test description"
+                assert task.user.id == 1
+
+        run(test)
+
+    def test_can_delete_and_rollback(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            with pytest.raises(Exception):
+                async with uow:
+                    await AsyncTaskService(uow).delete_task(1)
+                    raise Exception()
+
+            async with uow:
+                task = await uow.tasks.get(1)
+                assert task.title == "Test task 1"
+
+            async with uow:
+                await uow.tasks.delete(1)
+
+            with pytest.raises(ItemNotFound):
+                async with uow:
+                    await uow.tasks.get(1)
+
+        run(test)
+
+
+class TestAsyncListAndBulkOperations:
+    def test_bulk_operations(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                tasks = await uow.tasks.create_many(
+                    [
+                        TaskCreate(title=f"Task {i}", description="Desc", user_id=2)
+                        for i in range(4)
+                    ],
+                    chunk_size=3,
+                )
+            assert [task.id for task in tasks] == [2, 3, 4, 5]
+
+            async with uow:
+                tasks = await uow.tasks.update_many([5, 2], TaskUpdate(is_done=True))
+            assert [(task.id, task.is_done) for task in tasks] == [
+                (5, True),
+                (2, True),
+            ]
+
+            async with uow:
+                await uow.tasks.delete_many([2, 3])
+                count, tasks = await uow.tasks.list({"user_id": 2})
+            assert count == 2
+            assert [task.id for task in tasks] == [5, 4]
+
+        run(test)
+
+    def test_paginate_and_iter_list(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                await uow.tasks.create_many(
+                    [
+                        TaskCreate(title=f"Task {i}", description="Desc", user_id=1)
+                        for i in range(3)
+                    ]
+                )
+
+            async with uow:
+                page = await uow.tasks.paginate({}, limit=3)
+                next_page = await uow.tasks.paginate(
+                    {}, limit=3, cursor=page.next_cursor
+                )
+                streamed = [
+                    task.id
+                    async for task in uow.tasks.iter_list({"user_id": 1}, batch_size=2)
+                ]
+
+            assert [task.id for task in page.items] == [4, 3, 2]
+            assert [task.id for task in next_page.items] == [1]
+            assert streamed == [4, 3, 2, 1]
+
+        run(test)
+
+    def test_count_strategies(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                windowed = await uow.users.list({}, count="windowed")
+                empty = await uow.users.list({"name": "Nobody"}, count="windowed")
+                skipped = await uow.users.list({}, count="none")
+
+            assert windowed[0] == 2
+            assert [user.id for user in windowed[1]] == [2, 1]
+            assert empty == (0, [])
+            assert skipped[0] is None
+
+        run(test)
+
+    def test_save_many(self):
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                task = await uow.tasks.get(1)
+                task.title = "Saved"
+                created = task.model_copy(update={"id": 2, "title": "Created"})
+                saved = await uow.tasks.save_many([created, task])
+
+            async with uow:
+                count, tasks = await uow.tasks.list({})
+
+            assert [task.title for task in saved] == ["Created", "Saved"]
+            assert count == 2
+            assert [task.title for task in tasks] == ["Created", "Saved"]
+
+            async with uow:
+                new = task.model_copy(update={"id": None, "title": "New"})
+                saved = await uow.tasks.save_many([new])
+
+            assert saved[0].id == 3
+
+        run(test)
+
+    def test_trusted_hydration(self):
+        class TrustedTaskRepository(AsyncTaskRepository):
+            trusted_hydration = True
+
+        async def test(uow: AsyncInMemoryTaskUnitOfWork):
+            async with uow:
+                trusted = TrustedTaskRepository(uow.session)
+                task = await trusted.get(1)
+                listed = await trusted.list({})
+                streamed = [task async for task in trusted.iter_list({})]
+                expected = await uow.tasks.get(1)
+
+            assert task == expected
+            assert listed == (1, [expected])
+            assert streamed == [expected]
+
+        run(test)
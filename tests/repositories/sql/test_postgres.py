@@ -1,11 +1,32 @@
+import io
+import json
+import sys
+
 import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import joinedload
 
-from domino.exceptions import ItemNotFound
-from tests.repositories.sql.app.models import TaskCreate, TaskUpdate, UserCreate
+from domino.domain.filters import where
+from domino.domain.models.pydantic import DTO, Entity
+from domino.exceptions import InvalidCursor, InvalidFilter, InvalidLimit, ItemNotFound
+from domino.repositories.sql.sqlalchemy.buffer import Pending
+from domino.repositories.sql.sqlalchemy.bulk import copy_line
+from domino.repositories.sql.sqlalchemy.counting import CountStrategy, plan_rows
+from domino.repositories.sql.sqlalchemy.hydration import plan_trusted_rows
+from domino.repositories.sql.sqlalchemy.loading import derive_eager_loads
+from domino.repositories.sql.sqlalchemy.statements import StatementCache
+from tests.repositories.sql.app.models import (
+    Task,
+    TaskCreate,
+    TaskUpdate,
+    User,
+    UserCreate,
+)
 from tests.repositories.sql.app.services import TaskService, TaskUnitOfWork
 from tests.repositories.sql.repositories.db import Base, InMemoryDatabase
-from tests.repositories.sql.repositories.tasks import TaskRepository
-from tests.repositories.sql.repositories.users import UserRepository
+from tests.repositories.sql.repositories.tasks import TaskMapping, TaskRepository
+from tests.repositories.sql.repositories.users import UserMapping, UserRepository
 
 
 class InMemoryTaskUnitOfWork(TaskUnitOfWork):
@@ -121,3 +142,887 @@ class TestPostgresRepository:
             assert task.description == "Test description 1"
             assert task.user.id == 1
             assert "user_id" not in task.dump().keys()
+
+
+class TestBulkOperations:
+    def test_create_many_returns_entities_in_input_order(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        payloads = [
+            TaskCreate(title=f"Task {i}", description=f"Desc {i}", user_id=i % 2 + 1)
+            for i in range(5)
+        ]
+        with uow:
+            tasks = uow.tasks.create_many(payloads, chunk_size=2)
+
+        assert [task.title for task in tasks] == [p.title for p in payloads]
+        assert [task.id for task in tasks] == [2, 3, 4, 5, 6]
+        assert tasks[1].user.id == 2
+
+    def test_update_many_returns_entities_in_input_order(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title="Task", description="Desc", user_id=1)
+                    for _ in range(3)
+                ]
+            )
+
+        with uow:
+            tasks = uow.tasks.update_many([3, 1, 2], TaskUpdate(is_done=True))
+
+        assert [task.id for task in tasks] == [3, 1, 2]
+        assert all(task.is_done for task in tasks)
+
+        with uow:
+            assert uow.tasks.get(4).is_done is False
+
+    def test_update_many_raises_on_missing_id(self, uow: InMemoryTaskUnitOfWork):
+        with pytest.raises(ItemNotFound):
+            with uow:
+                uow.tasks.update_many([1, 42], TaskUpdate(is_done=True))
+
+    def test_update_many_leaves_rows_untouched_on_missing_id(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        with uow:
+            with pytest.raises(ItemNotFound):
+                uow.tasks.update_many([1, 42], TaskUpdate(is_done=True))
+            assert uow.tasks.get(1).is_done is False
+
+    def test_delete_many(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title="Task", description="Desc", user_id=1)
+                    for _ in range(3)
+                ]
+            )
+
+        with uow:
+            uow.tasks.delete_many([1, 2, 3], chunk_size=2)
+
+        with uow:
+            assert uow.tasks.list({})[0] == 1
+            assert uow.tasks.get(4).title == "Task"
+
+
+class TestPagination:
+    def test_paginate_with_cursor(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=1)
+                    for i in range(4)
+                ]
+            )
+
+        with uow:
+            first_page = uow.tasks.paginate({}, limit=3)
+            second_page = uow.tasks.paginate({}, limit=3, cursor=first_page.next_cursor)
+
+        assert [task.id for task in first_page.items] == [5, 4, 3]
+        assert [task.id for task in second_page.items] == [2, 1]
+        assert second_page.next_cursor is None
+
+    def test_paginate_on_non_unique_sort_key(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=title, description="Desc", user_id=1)
+                    for title in ["b", "a", "b"]
+                ]
+            )
+
+        ids = []
+        cursor = None
+        with uow:
+            while True:
+                page = uow.tasks.paginate(
+                    {"description": "Desc"}, limit=1, cursor=cursor, sort_key="title"
+                )
+                ids += [task.id for task in page.items]
+                if not page.has_next:
+                    break
+                cursor = page.next_cursor
+
+        assert ids == [4, 2, 3]
+
+    def test_paginate_rejects_empty_pages(self, uow: InMemoryTaskUnitOfWork):
+        with pytest.raises(InvalidLimit):
+            with uow:
+                uow.tasks.paginate({}, limit=0)
+
+    def test_paginate_rejects_invalid_cursor(self, uow: InMemoryTaskUnitOfWork):
+        with pytest.raises(InvalidCursor):
+            uow.tasks.paginate({}, limit=1, cursor="not-a-cursor")
+
+
+class TestIterList:
+    def test_iter_list_streams_every_entity(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=2)
+                    for i in range(5)
+                ]
+            )
+
+        with uow:
+            tasks = uow.tasks.iter_list({"user_id": 2}, batch_size=2)
+            assert [task.id for task in tasks] == [6, 5, 4, 3, 2]
+            assert all(
+                task.user.id == 2 for task in uow.tasks.iter_list({"user_id": 2})
+            )
+
+
+class TestExport:
+    @pytest.fixture(autouse=True)
+    def tasks(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=2)
+                    for i in range(5)
+                ]
+            )
+
+    def test_iter_columns_streams_chunks(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            chunks = list(
+                uow.tasks.iter_columns(
+                    where("user_id").eq(2), columns=["id", "title"], chunk_size=2
+                )
+            )
+
+        assert [chunk["id"] for chunk in chunks] == [[6, 5], [4, 3], [2]]
+        assert chunks[0] == {"id": [6, 5], "title": ["Task 4", "Task 3"]}
+
+    def test_export_follows_the_sort_key(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.sort_key, uow.tasks.sort_descending = "title", False
+            chunk = next(uow.tasks.iter_columns({}, columns=["id", "title"]))
+
+        assert chunk["title"] == sorted(chunk["title"])
+        assert chunk["id"] == [2, 3, 4, 5, 6, 1]
+
+    def test_export_builds_no_entity(self, uow: InMemoryTaskUnitOfWork, monkeypatch):
+        monkeypatch.setattr(Task, "load", lambda data: pytest.fail("hydrated"))
+        monkeypatch.setattr(Task, "load_many", lambda data: pytest.fail("hydrated"))
+        with uow:
+            chunk = next(uow.tasks.iter_columns({}))
+
+        assert list(chunk) == ["id", "user_id", "title", "description", "is_done"]
+        assert len(chunk["id"]) == 6
+
+    def test_export_ndjson(self, uow: InMemoryTaskUnitOfWork):
+        stream = io.StringIO()
+        with uow:
+            count = uow.tasks.export_ndjson({"user_id": 1}, stream, chunk_size=2)
+
+        assert count == 1
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == [
+            {
+                "id": 1,
+                "user_id": 1,
+                "title": "Test task 1",
+                "description": "Test description 1",
+                "is_done": False,
+            }
+        ]
+
+    def test_export_batches(self, uow: InMemoryTaskUnitOfWork):
+        pa = pytest.importorskip("pyarrow")
+        with uow:
+            batches = list(uow.tasks.export_batches({"user_id": 2}, chunk_size=2))
+
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        assert batches[0].schema.field("is_done").type == pa.bool_()
+        assert pa.Table.from_batches(batches).column("id").to_pylist() == [
+            6,
+            5,
+            4,
+            3,
+            2,
+        ]
+
+    def test_export_parquet(self, uow: InMemoryTaskUnitOfWork, tmp_path):
+        parquet = pytest.importorskip("pyarrow.parquet")
+        with uow:
+            count = uow.tasks.export_parquet(
+                {}, tmp_path / "tasks.parquet", columns=["id"], chunk_size=4
+            )
+
+        table = parquet.read_table(tmp_path / "tasks.parquet")
+        assert count == table.num_rows == 6
+        assert table.column_names == ["id"]
+
+    def test_arrow_export_requires_pyarrow(
+        self, uow: InMemoryTaskUnitOfWork, monkeypatch
+    ):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with uow:
+            with pytest.raises(ImportError, match="pip install pyarrow"):
+                next(uow.tasks.export_batches({}))
+
+
+class TestEagerLoading:
+    def test_derives_eager_loads_from_domain_mapping(self):
+        assert derive_eager_loads(TaskMapping, Task) == {"user": joinedload}
+        assert derive_eager_loads(UserMapping, User) == {}
+
+    def test_list_does_not_lazy_load_users(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=i % 2 + 1)
+                    for i in range(10)
+                ]
+            )
+
+        statements = []
+        event.listen(
+            uow.database._engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        with uow:
+            _, tasks = uow.tasks.list({})
+            list(uow.tasks.iter_list({}, batch_size=3))
+            uow.tasks.paginate({}, limit=5)
+
+        assert len(tasks) == 11
+        assert {task.user.id for task in tasks} == {1, 2}
+        assert not any("WHERE users.id = ?" in s for s in statements)
+
+
+class TrustedTaskRepository(TaskRepository):
+    trusted_hydration = True
+
+
+class TestTrustedHydration:
+    def test_trusted_repository_builds_the_same_entities(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        with uow:
+            uow.tasks.create(
+                TaskCreate(title="Test task 2", description="Second", user_id=2)
+            )
+
+        with uow:
+            trusted = TrustedTaskRepository(uow.session)
+            assert trusted.get(1) == uow.tasks.get(1)
+            assert trusted.get(1).dump() == uow.tasks.get(1).dump()
+            assert trusted.list({}) == uow.tasks.list({})
+            assert trusted.list({"user_id": 2})[1][0].user == User(
+                id=2, name="Jane Doe", email="jadoe@42.fr"
+            )
+            assert list(trusted.iter_list({}, batch_size=1)) == uow.tasks.list({})[1]
+
+    def test_entities_are_built_from_columns(self, uow: InMemoryTaskUnitOfWork):
+        statements = []
+        with uow:
+            event.listen(
+                uow.session.get_bind(),
+                "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            trusted = TrustedTaskRepository(uow.session)
+            _, tasks = trusted.list({}, count="none")
+            task = trusted.get(1)
+
+            assert len(statements) == 2
+            assert "LEFT OUTER JOIN users" in statements[0]
+            # No ORM instance was built along the way
+            assert len(uow.session.identity_map) == 0
+            assert tasks == [task]
+
+    def test_missing_rows_are_not_found(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            with pytest.raises(ItemNotFound):
+                TrustedTaskRepository(uow.session).get(99)
+
+    def test_fields_needing_coercion_are_validated(self):
+        class TextTask(Entity):
+            id: str
+            title: str
+
+        class TextTaskRepository(TaskRepository):
+            domain_mapping = TextTask
+            trusted_hydration = True
+
+        assert plan_trusted_rows(TaskMapping, TextTask) is None
+        assert plan_trusted_rows(TaskMapping, Task) is not None
+        assert TextTaskRepository._trusted_plan() is None
+
+
+class TestUpdateReturning:
+    def test_update_is_a_single_round_trip(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            before = uow.tasks.get(1)
+
+            statements = []
+            event.listen(
+                uow.database._engine,
+                "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            task = uow.tasks.update(1, TaskUpdate(is_done=True))
+
+            # Only the nested user is read besides the UPDATE ... RETURNING
+            task_statements = [s for s in statements if "tasks" in s]
+            assert len(task_statements) == 1
+            assert task_statements[0].startswith("UPDATE tasks")
+            assert "RETURNING" in task_statements[0]
+            assert before.is_done is False
+            assert task.is_done is True
+            # The identity map sees the update
+            assert uow.tasks.get(1).is_done is True
+
+    def test_update_without_return(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            assert (
+                uow.tasks.update(1, TaskUpdate(title="Quiet"), returning=False) is None
+            )
+
+        with uow:
+            assert uow.tasks.get(1).title == "Quiet"
+
+    def test_update_missing_item(self, uow: InMemoryTaskUnitOfWork):
+        for returning in (True, False):
+            with pytest.raises(ItemNotFound):
+                with uow:
+                    uow.tasks.update(
+                        42, TaskUpdate(title="Missing"), returning=returning
+                    )
+
+
+class TestStatementCache:
+    def test_statements_are_built_once_per_filter_shape(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        with uow:
+            cache = uow.tasks.statement_cache
+            cache.clear()
+
+            assert uow.tasks.list({"user_id": 1})[0] == 1
+            assert uow.tasks.list({"user_id": 2})[0] == 0
+            assert uow.tasks.list({"user_id": 1, "is_done": False})[0] == 1
+
+            # list and count statements, for two filter shapes
+            assert len(cache) == 4
+            assert cache.misses == 4
+            assert cache.hits == 2
+            assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_least_recently_used_statements_are_dropped(self):
+        cache = StatementCache(maxsize=2)
+
+        cache.get("one", lambda: "one")
+        cache.get("two", lambda: "two")
+        cache.get("one", lambda: "rebuilt")
+        cache.get("three", lambda: "three")
+
+        assert len(cache) == 2
+        assert cache.get("one", lambda: "rebuilt") == "one"
+        assert cache.get("two", lambda: "rebuilt") == "rebuilt"
+
+    def test_none_filters_are_null_comparisons(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            assert uow.users.list({"email": None}) == (0, [])
+            assert uow.users.list({"email": "jdoe@42.fr"})[0] == 1
+
+    def test_get_uses_the_cached_statement(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            cache = uow.tasks.statement_cache
+            cache.clear()
+
+            assert uow.tasks.get(1).title == "Test task 1"
+            with pytest.raises(ItemNotFound):
+                uow.tasks.get(42)
+
+        with uow:
+            uow.tasks.get(1)
+            assert cache.misses == 1
+            assert cache.hits == 2
+
+    def test_get_reads_loaded_rows_from_the_identity_map(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        with uow:
+            # The identity map is weak, keep the row loaded
+            row = uow.session.get(TaskMapping, 1)
+
+            statements = []
+            event.listen(
+                uow.database._engine,
+                "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            assert uow.tasks.get(1).id == row.id
+            assert not [s for s in statements if "FROM tasks" in s]
+
+
+class TestCountStrategies:
+    def create_tasks(self, uow: InMemoryTaskUnitOfWork, count: int):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=2)
+                    for i in range(count)
+                ]
+            )
+
+    def test_exact_and_windowed_counts(self, uow: InMemoryTaskUnitOfWork):
+        self.create_tasks(uow, 3)
+
+        with uow:
+            exact = uow.tasks.list({"user_id": 2})
+            windowed = uow.tasks.list({"user_id": 2}, count=CountStrategy.WINDOWED)
+            empty = uow.tasks.list({"user_id": 3}, count="windowed")
+
+        assert exact[0] == windowed[0] == 3
+        assert [task.id for task in windowed[1]] == [task.id for task in exact[1]]
+        assert windowed[1][0].user.name == "Jane Doe"
+        assert empty == (0, [])
+
+    def test_capped_count(self, uow: InMemoryTaskUnitOfWork, monkeypatch):
+        self.create_tasks(uow, 5)
+
+        with uow:
+            monkeypatch.setattr(uow.tasks, "count_cap", 3)
+            assert uow.tasks.list({"user_id": 2}, count="capped")[0] == 4
+            assert uow.tasks.list({"user_id": 1}, count="capped")[0] == 1
+
+    def test_skipped_and_default_count(self, uow: InMemoryTaskUnitOfWork, monkeypatch):
+        with uow:
+            total, tasks = uow.tasks.list({}, count="none")
+            assert total is None
+            assert len(tasks) == 1
+
+            monkeypatch.setattr(uow.tasks, "count_strategy", CountStrategy.NONE)
+            assert uow.tasks.list({})[0] is None
+
+    def test_estimated_count_is_exact_outside_postgres(
+        self, uow: InMemoryTaskUnitOfWork
+    ):
+        with uow:
+            assert uow.tasks.list({"user_id": 1}, count="estimated")[0] == 1
+
+    def test_unknown_strategy(self, uow: InMemoryTaskUnitOfWork):
+        with pytest.raises(ValueError):
+            with uow:
+                uow.tasks.list({}, count="approximate")
+
+    def test_estimate_statements(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            reltuples = str(
+                uow.tasks._reltuples_statement().compile(dialect=postgresql.dialect())
+            )
+
+        assert "FROM pg_class" in reltuples
+        assert "AS REGCLASS" in reltuples
+        assert plan_rows('[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 42}}]') == 42
+        assert plan_rows([{"Plan": {"Plan Rows": 7.0}}]) == 7
+
+
+class TestSave:
+    def test_save_updates_an_existing_entity(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            task = uow.tasks.get(1)
+            task.title = "Saved"
+            saved = uow.tasks.save(task)
+
+            assert saved.title == "Saved"
+            # The identity map sees the new values
+            assert uow.tasks.get(1).title == "Saved"
+
+        with uow:
+            assert uow.tasks.get(1).title == "Saved"
+
+    def test_save_many_creates_and_updates(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            john, jane = uow.users.get(1), uow.users.get(2)
+            existing = uow.tasks.get(1)
+            existing.is_done = True
+
+            saved = uow.tasks.save_many(
+                [
+                    Task(id=10, user=jane, title="New", description="Desc"),
+                    existing,
+                    Task(id=11, user=john, title="Other", description="Desc"),
+                ],
+                chunk_size=2,
+            )
+
+            assert [task.id for task in saved] == [10, 1, 11]
+            assert saved[0].user.id == 2
+
+        with uow:
+            count, tasks = uow.tasks.list({})
+            assert count == 3
+            assert uow.tasks.get(1).is_done is True
+            # The nested user was saved as the user_id foreign key
+            assert uow.tasks.list({"user_id": 2})[0] == 1
+
+    def test_save_many_creates_entities_without_id(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            existing = uow.tasks.get(1)
+            existing.title = "Saved"
+            new = existing.model_copy(update={"id": None, "title": "New"})
+
+            saved = uow.tasks.save_many([new, existing, new])
+
+            assert [task.id for task in saved] == [2, 1, 3]
+            assert [task.title for task in saved] == ["New", "Saved", "New"]
+
+        with uow:
+            assert uow.tasks.list({})[0] == 3
+
+    def test_save_many_with_duplicates(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            first = uow.tasks.get(1)
+            second = first.model_copy(update={"title": "Last"})
+
+            saved = uow.tasks.save_many([first, second])
+
+            assert [task.title for task in saved] == ["Last", "Last"]
+
+    def test_save_statements_are_cached(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            task = uow.tasks.get(1)
+            uow.tasks.save(task)
+            misses = uow.tasks.statement_cache.misses
+            uow.tasks.save(task)
+
+            assert uow.tasks.statement_cache.misses == misses
+
+
+class FakeCopyCursor:
+    def __init__(self):
+        self.copies = []
+
+    def copy_expert(self, sql, file):
+        self.copies.append((sql, file.read()))
+
+
+class TestBulkLoad:
+    def tasks(self, count: int):
+        return (
+            TaskCreate(title=f"Task {i}", description="Desc", user_id=2)
+            for i in range(count)
+        )
+
+    def test_bulk_load_falls_back_to_executemany(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            report = uow.tasks.bulk_load(self.tasks(5))
+
+        assert report.rows == 5
+        assert report.method == "executemany"
+        assert report.rows_per_second > 0
+        with uow:
+            assert uow.tasks.list({"user_id": 2})[0] == 5
+
+    def test_bulk_load_copies_bounded_buffers(
+        self, uow: InMemoryTaskUnitOfWork, monkeypatch
+    ):
+        cursor = FakeCopyCursor()
+        with uow:
+            connection = uow.session.connection()
+            fake = type(
+                "FakeConnection",
+                (),
+                {
+                    "dialect": postgresql.dialect(),
+                    "connection": type("Raw", (), {"cursor": lambda self: cursor})(),
+                },
+            )()
+            monkeypatch.setattr(uow.session, "connection", lambda: fake)
+            monkeypatch.setattr(uow.tasks, "_can_copy", lambda: True)
+
+            report = uow.tasks.bulk_load(self.tasks(3), buffer_size=1)
+            monkeypatch.setattr(uow.session, "connection", lambda: connection)
+
+        assert report.method == "copy"
+        assert report.rows == 3
+        assert len(cursor.copies) == 3
+        sql, data = cursor.copies[0]
+        # Client side defaults are filled in
+        assert sql == "COPY tasks (user_id, title, description, is_done) FROM STDIN"
+        assert data == "2\tTask 0\tDesc\tf\n"
+
+    def test_copy_line_escapes_values(self):
+        assert copy_line([None, True, "a\tb\\", {"a": 1}]) == (
+            '\\N\tt\ta\\tb\\\\\t{"a": 1}\n'
+        )
+
+    def test_copy_line_encodes_bytes_as_hex(self):
+        assert copy_line([b"\x00\xff", memoryview(b"ab"), bytearray(b"")]) == (
+            "\\\\x00ff\t\\\\x6162\t\\\\x\n"
+        )
+
+    def test_merge_statement(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            staging = Table(
+                "tasks_staging",
+                MetaData(),
+                Column("id", Integer),
+                Column("title", String),
+            )
+            statement = uow.tasks._merge_statement(staging, ("id", "title"))
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO tasks (id, title, is_done) SELECT")
+        assert "ON CONFLICT (id) DO UPDATE SET title = excluded.title" in sql
+
+
+class DeferredTaskUnitOfWork(InMemoryTaskUnitOfWork):
+    def begin(self):
+        self.session = self.database.generate_session(deferred=True)
+        self.users = UserRepository(self.session)
+        self.tasks = TaskRepository(self.session)
+
+
+class TitleUpdate(DTO):
+    title: str
+
+
+class KeyedTaskCreate(TaskCreate):
+    id: int
+
+
+@pytest.fixture
+def deferred_uow(uow: InMemoryTaskUnitOfWork):
+    unit_of_work = DeferredTaskUnitOfWork()
+    unit_of_work.database = uow.database
+    return unit_of_work
+
+
+def record_writes(uow: InMemoryTaskUnitOfWork) -> list[str]:
+    """
+    Records the write statements executed by the sessions of the database,
+    once per executemany.
+    """
+    writes: list[str] = []
+    event.listen(
+        uow.database._engine,
+        "before_execute",
+        lambda conn, statement, *args: (
+            writes.append(statement.__visit_name__)
+            if statement.__visit_name__ != "select"
+            else None
+        ),
+    )
+    return writes
+
+
+class TestWriteBuffer:
+    def test_creates_are_batched_until_commit(
+        self, deferred_uow: DeferredTaskUnitOfWork
+    ):
+        writes = record_writes(deferred_uow)
+        with deferred_uow:
+            created = [
+                deferred_uow.tasks.create(
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=2)
+                )
+                for i in range(5)
+            ]
+            assert all(isinstance(task, Pending) for task in created)
+            assert writes == []
+
+        assert writes == ["insert"]
+        assert [task.id for task in created] == [2, 3, 4, 5, 6]
+        assert created[0].user.name == "Jane Doe"
+
+    def test_queued_writes_are_sent_before_copy(
+        self, deferred_uow: DeferredTaskUnitOfWork, monkeypatch
+    ):
+        writes = record_writes(deferred_uow)
+        cursor = FakeCopyCursor()
+        monkeypatch.setattr(
+            cursor, "copy_expert", lambda sql, file: writes.append("copy")
+        )
+        fake = type(
+            "FakeConnection",
+            (),
+            {
+                "dialect": postgresql.dialect(),
+                "connection": type("Raw", (), {"cursor": lambda self: cursor})(),
+            },
+        )()
+
+        with deferred_uow:
+            deferred_uow.users.create(UserCreate(name="New", email="new@42.fr"))
+            monkeypatch.setattr(deferred_uow.session, "connection", lambda: fake)
+            monkeypatch.setattr(deferred_uow.tasks, "_can_copy", lambda: True)
+
+            # The tasks point to the user queued above
+            deferred_uow.tasks.bulk_load(
+                [TaskCreate(title="Task", description="Desc", user_id=3)]
+            )
+            assert writes == ["insert", "copy"]
+
+    def test_placeholders_flush_when_read(self, deferred_uow: DeferredTaskUnitOfWork):
+        with deferred_uow:
+            task = deferred_uow.tasks.create(
+                TaskCreate(title="New", description="Desc", user_id=1)
+            )
+            assert not task.is_resolved
+            assert task.id == 2
+            assert task.is_resolved
+            assert len(deferred_uow.session.info["write_buffer"]) == 0
+
+    def test_reads_see_queued_writes(self, deferred_uow: DeferredTaskUnitOfWork):
+        with deferred_uow:
+            deferred_uow.tasks.get(1)
+            deferred_uow.tasks.update(1, TaskUpdate(title="Updated"))
+            deferred_uow.tasks.create(
+                TaskCreate(title="New", description="Desc", user_id=1)
+            )
+
+            # The row loaded before the update is refreshed
+            assert deferred_uow.tasks.get(1).title == "Updated"
+            assert deferred_uow.tasks.list({})[0] == 2
+
+            deferred_uow.tasks.delete(2)
+            assert deferred_uow.tasks.list({})[0] == 1
+
+    def test_update_placeholder_resolves_to_the_entity(
+        self, deferred_uow: DeferredTaskUnitOfWork
+    ):
+        with deferred_uow:
+            task = deferred_uow.tasks.update(1, TaskUpdate(is_done=True))
+            assert task.is_done is True
+
+        with pytest.raises(ItemNotFound):
+            with deferred_uow:
+                deferred_uow.tasks.update(42, TaskUpdate(is_done=True)).resolve()
+
+    def test_buffer_limit(self, deferred_uow: DeferredTaskUnitOfWork, monkeypatch):
+        monkeypatch.setattr(deferred_uow.database, "write_buffer_limit", 2)
+        writes = record_writes(deferred_uow)
+
+        with deferred_uow:
+            for i in range(3):
+                deferred_uow.tasks.create(
+                    TaskCreate(title=f"Task {i}", description="Desc", user_id=1)
+                )
+            assert writes == ["insert"]
+
+        assert writes == ["insert", "insert"]
+
+    def test_rollback_discards_queued_writes(
+        self, deferred_uow: DeferredTaskUnitOfWork
+    ):
+        with pytest.raises(RuntimeError):
+            with deferred_uow:
+                deferred_uow.tasks.delete(1)
+                raise RuntimeError
+
+        with deferred_uow:
+            assert deferred_uow.tasks.get(1).id == 1
+
+    def test_writes_are_sent_in_queue_order(self, deferred_uow: DeferredTaskUnitOfWork):
+        with deferred_uow:
+            deferred_uow.tasks.delete(1)
+            deferred_uow.users.delete(1)
+            deferred_uow.users.create(UserCreate(name="New", email="new@42.fr"))
+            deferred_uow.session.info["write_buffer"].flush()
+
+            assert deferred_uow.users.list({})[0] == 2
+
+    def test_successive_updates_of_a_row(self, deferred_uow: DeferredTaskUnitOfWork):
+        writes = record_writes(deferred_uow)
+        with deferred_uow:
+            deferred_uow.tasks.update(1, TitleUpdate(title="A"))
+            deferred_uow.tasks.update(1, TaskUpdate(title="B", description="B"))
+            deferred_uow.tasks.update(1, TitleUpdate(title="C"))
+
+        assert writes == ["update", "update", "update"]
+        with deferred_uow:
+            task = deferred_uow.tasks.get(1)
+        assert (task.title, task.description) == ("C", "B")
+
+    def test_delete_then_create_of_a_key(self, deferred_uow: DeferredTaskUnitOfWork):
+        with deferred_uow:
+            deferred_uow.tasks.delete(1)
+            deferred_uow.tasks.create(
+                KeyedTaskCreate(id=1, title="Again", description="Desc", user_id=2)
+            )
+            deferred_uow.tasks.update(1, TitleUpdate(title="Once more"))
+
+        with deferred_uow:
+            assert deferred_uow.tasks.get(1).title == "Once more"
+
+    def test_other_statements_flush_queued_writes(
+        self, deferred_uow: DeferredTaskUnitOfWork
+    ):
+        with deferred_uow:
+            deferred_uow.tasks.create(
+                TaskCreate(title="New", description="Desc", user_id=1)
+            )
+            deferred_uow.session.execute(update(TaskMapping).values(is_done=True))
+            assert len(deferred_uow.session.info["write_buffer"]) == 0
+
+        with deferred_uow:
+            assert all(task.is_done for task in deferred_uow.tasks.list({})[1])
+
+
+class TestFilterExpressions:
+    @pytest.fixture(autouse=True)
+    def tasks(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            uow.tasks.create_many(
+                [
+                    TaskCreate(title=title, description="Desc", user_id=2)
+                    for title in ["Write docs", "Write tests", "Review 100%"]
+                ]
+            )
+
+    def ids(self, uow: InMemoryTaskUnitOfWork, filter) -> list[int]:
+        with uow:
+            count, tasks = uow.tasks.list(filter)
+        assert count == len(tasks)
+        return [task.id for task in tasks]
+
+    def test_comparisons(self, uow: InMemoryTaskUnitOfWork):
+        assert self.ids(uow, where("id").gt(2)) == [4, 3]
+        assert self.ids(uow, where("id").between(2, 3)) == [3, 2]
+        assert self.ids(uow, where("id").in_([1, 4])) == [4, 1]
+        assert self.ids(uow, where("user_id").ne(2)) == [1]
+        assert self.ids(uow, where("title").startswith("Write")) == [3, 2]
+        # LIKE wildcards in the prefix are matched literally
+        assert self.ids(uow, where("title").startswith("Review 100%")) == [4]
+        assert self.ids(uow, where("title").startswith("Review 1_0")) == []
+
+    def test_combinations(self, uow: InMemoryTaskUnitOfWork):
+        filter = where("title").startswith("Write") & where("id").lt(3)
+        assert self.ids(uow, filter) == [2]
+        assert self.ids(uow, where("id").eq(1) | where("id").eq(4)) == [4, 1]
+        assert self.ids(uow, where("description").is_null()) == []
+
+    def test_statements_are_shared_by_filter_shape(self, uow: InMemoryTaskUnitOfWork):
+        cache = uow.tasks.statement_cache
+        self.ids(uow, where("id").in_([1, 2]))
+        misses = cache.misses
+        self.ids(uow, where("id").in_([1, 2, 3]))
+
+        assert cache.misses == misses
+
+    def test_paginate_and_count_with_filters(self, uow: InMemoryTaskUnitOfWork):
+        with uow:
+            page = uow.tasks.paginate(where("title").startswith("Write"), limit=1)
+            capped = uow.tasks.list(where("user_id").eq(2), count="capped")
+
+        assert [task.id for task in page.items] == [3]
+        assert page.has_next
+        assert capped[0] == 3
+
+    def test_unknown_attribute(self, uow: InMemoryTaskUnitOfWork):
+        with pytest.raises(InvalidFilter):
+            with uow:
+                uow.tasks.list(where("priority").gt(1))
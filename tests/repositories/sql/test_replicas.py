@@ -0,0 +1,123 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from domino.repositories.sql.sqlalchemy.database import SQLDatabase
+from domino.repositories.sql.sqlalchemy.uow import SQLUnitOfWork
+from tests.repositories.sql.app.models import UserCreate
+from tests.repositories.sql.app.services import TaskUnitOfWork
+from tests.repositories.sql.repositories.db import Base
+from tests.repositories.sql.repositories.tasks import TaskRepository
+from tests.repositories.sql.repositories.users import UserMapping, UserRepository
+
+
+def seed(dsn: str, name: str):
+    engine = create_engine(dsn)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserMapping(name=name, email=f"{name}@42.fr"))
+        session.commit()
+    engine.dispose()
+
+
+class ReplicatedUnitOfWork(TaskUnitOfWork):
+    def __init__(self, database: SQLDatabase, read_only: bool = False):
+        self.database = database
+        self.read_only = read_only
+
+    def begin(self):
+        self.session = self.database.generate_session(read_only=self.read_only)
+        self.users = UserRepository(self.session)
+        self.tasks = TaskRepository(self.session)
+
+    def commit(self):
+        self.session.commit()
+        self.session.close()
+
+    def rollback(self):
+        self.session.rollback()
+        self.session.close()
+
+
+@pytest.fixture
+def database(tmp_path):
+    dsns = {
+        name: f"sqlite:///{tmp_path / name}.db"
+        for name in ("primary", "replica-1", "replica-2")
+    }
+    for name, dsn in dsns.items():
+        seed(dsn, name)
+
+    class ReplicatedDatabase(SQLDatabase):
+        dsn = dsns["primary"]
+        replica_dsns = [dsns["replica-1"], dsns["replica-2"]]
+
+    return ReplicatedDatabase()
+
+
+def read_user_name(database: SQLDatabase, read_only: bool) -> str:
+    uow = ReplicatedUnitOfWork(database, read_only=read_only)
+    with uow:
+        return uow.users.get(1).name
+
+
+class TestReplicaRouting:
+    def test_read_only_units_of_work_read_from_replicas(self, database):
+        with database.request_scope():
+            assert read_user_name(database, read_only=True) == "replica-1"
+            assert read_user_name(database, read_only=True) == "replica-2"
+            assert read_user_name(database, read_only=True) == "replica-1"
+
+    def test_other_units_of_work_use_the_primary(self, database):
+        with database.request_scope():
+            assert read_user_name(database, read_only=False) == "primary"
+
+    def test_writes_go_to_the_primary_and_are_read_back(self, database):
+        with database.request_scope():
+            uow = ReplicatedUnitOfWork(database, read_only=True)
+            with uow:
+                uow.users.create(UserCreate(name="new", email="new@42.fr"))
+
+            assert read_user_name(database, read_only=True) == "primary"
+            assert database.is_primary_pinned()
+
+        assert not database.is_primary_pinned()
+        with database.request_scope():
+            assert read_user_name(database, read_only=True) == "replica-1"
+
+    def test_writes_outside_of_a_request_scope_pin_nothing(self, database):
+        with database.request_scope():
+            uow = ReplicatedUnitOfWork(database, read_only=False)
+            with uow:
+                uow.users.create(UserCreate(name="new", email="new@42.fr"))
+        assert read_user_name(database, read_only=True) == "replica-1"
+
+        uow = ReplicatedUnitOfWork(database, read_only=True)
+        with uow:
+            uow.users.create(UserCreate(name="new", email="new@42.fr"))
+            # The session that wrote still reads its own writes
+            assert uow.users.get(2).name == "new"
+
+        assert not database.is_primary_pinned()
+        assert read_user_name(database, read_only=True) == "replica-2"
+
+    def test_reused_sessions_pick_a_replica_again(self, database):
+        class PooledUnitOfWork(SQLUnitOfWork):
+            repositories = {"users": UserRepository}
+
+        uow = PooledUnitOfWork(database, read_only=True)
+        names = []
+        for _ in range(2):
+            with database.request_scope(), uow:
+                names.append(uow.users.get(1).name)
+
+        assert names == ["replica-1", "replica-2"]
+
+    def test_least_connections(self, database):
+        database.replica_strategy = "least_connections"
+        busy = database._replicas[0][0].connect()
+
+        with database.request_scope():
+            assert read_user_name(database, read_only=True) == "replica-2"
+
+        busy.close()
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from domino.domain.pools import UnitOfWorkPool
+from domino.repositories.sql.sqlalchemy.uow import AsyncSQLUnitOfWork, SQLUnitOfWork
+from tests.repositories.sql.app.models import UserCreate, UserUpdate
+from tests.repositories.sql.app.services import AsyncTaskUnitOfWork, TaskUnitOfWork
+from tests.repositories.sql.repositories.db import (
+    AsyncInMemoryDatabase,
+    Base,
+    InMemoryDatabase,
+)
+from tests.repositories.sql.repositories.tasks import (
+    AsyncTaskRepository,
+    TaskRepository,
+)
+from tests.repositories.sql.repositories.users import (
+    AsyncUserRepository,
+    UserMapping,
+    UserRepository,
+)
+
+
+class PooledTaskUnitOfWork(SQLUnitOfWork, TaskUnitOfWork):
+    repositories = {"users": UserRepository, "tasks": TaskRepository}
+
+
+class AsyncPooledTaskUnitOfWork(AsyncSQLUnitOfWork, AsyncTaskUnitOfWork):
+    repositories = {"users": AsyncUserRepository, "tasks": AsyncTaskRepository}
+
+
+@pytest.fixture
+def database():
+    database = InMemoryDatabase()
+    database.create_database_from_declarative_base(Base)
+    return database
+
+
+class TestSQLUnitOfWork:
+    def test_repositories_are_reused(self, database):
+        uow = PooledTaskUnitOfWork(database)
+        users, tasks, session = uow.users, uow.tasks, uow.session
+
+        with uow:
+            uow.users.create(UserCreate(name="John Doe", email="jdoe@42.fr"))
+        with uow:
+            assert uow.users.get(1).name == "John Doe"
+
+        assert (uow.users, uow.tasks, uow.session) == (users, tasks, session)
+        assert users.session is session
+
+    def test_sessions_are_reset_between_transactions(self, database):
+        uow = PooledTaskUnitOfWork(database)
+        with uow:
+            uow.users.create(UserCreate(name="John Doe", email="jdoe@42.fr"))
+        with uow:
+            user = uow.session.get(UserMapping, 1)
+            assert len(uow.session.identity_map) == 1
+
+        assert len(uow.session.identity_map) == 0
+        assert user not in uow.session
+        assert not uow.session.in_transaction()
+
+        with pytest.raises(ValueError):
+            with uow:
+                uow.users.update(1, UserUpdate(name="Jane Doe"))
+                raise ValueError
+
+        assert not uow.session.in_transaction()
+        with uow:
+            assert uow.users.get(1).name == "John Doe"
+
+    def test_fresh_sessions(self, database):
+        class FreshTaskUnitOfWork(PooledTaskUnitOfWork):
+            reuse_session = False
+
+        uow = FreshTaskUnitOfWork(database)
+        # Sessions and repositories are only built by the first transaction
+        assert uow.session is None
+        with uow:
+            users, session = uow.users, uow.session
+            assert users.session is session
+
+        with uow:
+            assert uow.session is not session
+            assert uow.users is users
+            assert users.session is uow.session
+            assert uow.tasks.session is uow.session
+
+    def test_pooled_units_of_work_are_reset(self, database):
+        pool = UnitOfWorkPool(lambda: PooledTaskUnitOfWork(database))
+        with pool.borrow() as uow:
+            # A transaction left open, and its hooks, are discarded
+            uow.begin()
+            uow.on_commit(lambda: pytest.fail("hook of a discarded transaction"))
+            uow.users.create(UserCreate(name="John Doe", email="jdoe@42.fr"))
+
+        with pool.borrow() as reused:
+            assert reused is uow
+            with reused:
+                assert reused.users.list({})[0] == 0
+
+    def test_units_of_work_failing_to_reset_are_closed(self, database, monkeypatch):
+        uow = PooledTaskUnitOfWork(database)
+        pool = UnitOfWorkPool(lambda: uow)
+
+        def lost_connection():
+            raise ConnectionError
+
+        monkeypatch.setattr(uow, "reset", lost_connection)
+        closed = []
+        monkeypatch.setattr(uow, "close", lambda: closed.append(uow))
+
+        # The error the unit of work was given back with is not hidden
+        with pytest.raises(KeyError):
+            with pool.borrow():
+                raise KeyError
+
+        assert closed == [uow]
+        assert len(pool) == 0
+
+
+class TestAsyncSQLUnitOfWork:
+    def test_repositories_are_reused(self):
+        async def main():
+            database = AsyncInMemoryDatabase()
+            await database.create_database_from_declarative_base(Base)
+            uow = AsyncPooledTaskUnitOfWork(database)
+            users, session = uow.users, uow.session
+            try:
+                async with uow:
+                    await uow.users.create(
+                        UserCreate(name="John Doe", email="jdoe@42.fr")
+                    )
+                assert uow.reset()
+
+                async with uow:
+                    assert (await uow.users.get(1)).name == "John Doe"
+                    # Open transactions can't be rolled back synchronously
+                    assert not uow.reset()
+
+                assert (uow.users, uow.session) == (users, session)
+
+                # Units of work dropped with an open transaction are closed
+                await uow.begin()
+                await uow.users.get(1)
+                uow.close()
+                await asyncio.gather(*uow._closing)
+                assert not uow.session.in_transaction()
+            finally:
+                await database.dispose()
+
+        asyncio.run(main())